@@ -1,3 +1,7 @@
+import asyncio
+import getpass
+
+from src.cache.usage_tracker import usage_scope, usage_tracker
 from src.langgraph_core.LLMs.load_llms import LoadLLMs
 from src.langgraph_core.graphs.graph_builder import BasicChatbotGraphBuilder
 from src.exceptions import ExceptionError
@@ -11,8 +15,19 @@ graph_builder = BasicChatbotGraphBuilder(llm)
 graph = graph_builder.setup_ainews_graph()
 
 
-def langgraph_chatbot(user_message):
-    for event in graph.stream({"messages": ("user", user_message)}):
+async def langgraph_chatbot(user_message):
+    # Attribute LLM token usage to this run
+    with usage_scope(f"cli:{getpass.getuser()}") as request_id:
+        try:
+            await _run_news(user_message)
+        finally:
+            await usage_tracker.flush()
+            logging.info(f"LLM usage for request {request_id}: {usage_tracker.request_summary(request_id)}")
+
+
+async def _run_news(user_message):
+    # The news nodes are async (concurrent fetch, parallel summaries), so use astream
+    async for event in graph.astream({"messages": ("user", user_message)}):
         # print(user_message)
         logging.info(f"User messsage: {user_message}")
         for value in event.values():
@@ -27,10 +42,15 @@ def langgraph_chatbot(user_message):
             # logging.info(f"Assistant: {msg[0].content}")
 
 
-if __name__ == "__main__":
+async def main():
+    # One event loop for the whole session: the pooled LLM/Tavily connections are bound to it
     while True:
-        user_input = input("User: ")
-        langgraph_chatbot(user_input)
+        user_input = await asyncio.to_thread(input, "User: ")
+        await langgraph_chatbot(user_input)
         if user_input.lower() in ["quit", "exit", "q"]:
             print("Goodbye!")
             break
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,3 +1,7 @@
+import asyncio
+import getpass
+
+from src.cache.usage_tracker import usage_scope, usage_tracker
 from src.langgraph_core.LLMs.load_llms import LoadLLMs
 from src.langgraph_core.graphs.graph_builder import BasicChatbotGraphBuilder
 from src.exceptions import ExceptionError
@@ -12,6 +16,16 @@ graph = graph_builder.setup_agentic_graph()
 
 
 def langgraph_chatbot(user_message):
+    # Attribute LLM token usage to this message
+    with usage_scope(f"cli:{getpass.getuser()}") as request_id:
+        try:
+            _run_chatbot(user_message)
+        finally:
+            asyncio.run(usage_tracker.flush())
+            logging.info(f"LLM usage for request {request_id}: {usage_tracker.request_summary(request_id)}")
+
+
+def _run_chatbot(user_message):
     for event in graph.stream({"messages": ("user", user_message)}):
         # print(user_message)
         logging.info(f"User messsage: {user_message}")
@@ -2,6 +2,7 @@ from src.langgraph_core.LLMs.load_llms import LoadLLMs
 from src.langgraph_core.graphs.travel_planner_graph import TravelGraphBuilder
 from langchain_core.messages import HumanMessage, AIMessage, ToolMessage
 from src.cache.redis_client import redis_client
+from src.cache.usage_tracker import usage_scope, usage_tracker
 from src.exceptions import ExceptionError
 from src.loggers import Logger
 import asyncio
@@ -10,15 +11,31 @@ from concurrent.futures import ThreadPoolExecutor
 langgraph_executor = ThreadPoolExecutor(max_workers=10)
 # Initialize LLM + Graph
 models = LoadLLMs()
-llm = models.load_groq_model()
-graph_builder = TravelGraphBuilder(llm)
+llm = models.load_failover_model(models.load_groq_model(), "groq/" + models.groq_config["model_name"])
+node_llms = models.load_node_llms()  # per call site model tiering (llm_configs.yml: node_models)
+graph_builder = TravelGraphBuilder(llm, node_llms)
 graph = graph_builder.build()
 
 logger = Logger(__name__).get_logger()
 
 
-async def langgraph_chatbot(user_message: str, user_id: str = None, session_id: str = None):
-    """Handle user message with user-specific state"""
+async def langgraph_chatbot(user_message: str, user_id: str = None, session_id: str = None, on_stream=None):
+    """Handle user message with user-specific state.
+
+    ``on_stream`` (optional async callable) receives custom chunks emitted by nodes while
+    the graph runs, e.g. each itinerary day as soon as it is generated.
+    """
+    # Attribute LLM token usage to this user/request; over-budget users get the cheaper model
+    with usage_scope(user_id) as request_id:
+        await usage_tracker.check_budget(user_id)
+        try:
+            return await _run_chatbot(user_message, user_id, session_id, on_stream)
+        finally:
+            await usage_tracker.flush()
+            logger.info(f"LLM usage for request {request_id}: {usage_tracker.request_summary(request_id)}")
+
+
+async def _run_chatbot(user_message: str, user_id: str, session_id: str, on_stream):
     try:
         logger.info(f"User message from user {user_id}: {user_message}")
 
@@ -41,8 +58,16 @@ async def langgraph_chatbot(user_message: str, user_id: str = None, session_id:
         async def run_langgraph():
             new_ai_messages = []
 
-            async for event in graph.astream(conversation_state):
+            async for mode, event in graph.astream(conversation_state, stream_mode=["updates", "custom"]):
+                if mode == "custom":
+                    logger.info(f"Streamed chunk: {event.get('type')}")
+                    if on_stream:
+                        await on_stream(event)
+                    continue
+
                 for value in event.values():
+                    if not value:  # side-effect only nodes (e.g. hotel prefetch) return no update
+                        continue
                     conversation_state.update(value)
                     logger.info(f"DEBUG - State AFTER update: awaiting_field = {conversation_state.get('awaiting_field')}")
 
@@ -53,11 +78,14 @@ async def langgraph_chatbot(user_message: str, user_id: str = None, session_id:
                     if initial_message_count < len(all_messages):
                         new_messages = all_messages[initial_message_count:]
 
-                        for msg in new_messages:
+                        for i, msg in enumerate(new_messages):
                             if isinstance(msg, AIMessage) and msg.content:
                                 logger.info(f"Assistant: {msg.content}")
                                 new_ai_messages.append(msg.content)
                             elif isinstance(msg, ToolMessage) and msg.content:
+                                # A reply written from the tool results follows - don't echo the raw output
+                                if any(isinstance(later, AIMessage) and later.content for later in new_messages[i + 1:]):
+                                    continue
                                 logger.info(f"[Tool Result] {msg.content}")
                                 new_ai_messages.append(msg.content)
             return new_ai_messages, conversation_state
@@ -0,0 +1,76 @@
+"""
+Throughput of src.utils.date_parser against dateutil.
+
+Three runs over the same inputs:
+  - dateutil.parser.parse(fuzzy=True) - what extract_dates_and_duration used to call
+  - parse_trip_dates with the memo cleared on every call (cold, pure regex work)
+  - parse_trip_dates with the LRU memo warm (repeated user answers)
+
+Run from the repo root:
+    python -m benchmarks.date_parser_benchmark --iterations 20000
+"""
+import argparse
+import time
+from datetime import date
+
+from dateutil import parser as date_parser
+
+from src.utils import date_parser as trip_date_parser
+
+INPUTS = [
+    "12 Dec 2025",
+    "2025-12-25",
+    "25/12/2025",
+    "Dec 12, 2025",
+    "I want to travel to Paris from 12 Dec 2025 to 18 Dec 2025",
+    "Plan a trip to Tokyo for 5 days starting 3 Jan 2026",
+    "next friday",
+    "tomorrow",
+    "12-18 Dec",
+    "for 5 nights",
+    "in 2 weeks",
+    "from 28 Dec to 3 Jan",
+]
+
+
+def run(name, fn, inputs, iterations):
+    parsed = 0
+    start = time.perf_counter()
+    for i in range(iterations):
+        if fn(inputs[i % len(inputs)]) is not None:
+            parsed += 1
+    elapsed = time.perf_counter() - start
+    print(f"{name:<28} {iterations / elapsed:>12,.0f} parses/s   {elapsed / iterations * 1e6:>8.2f} µs/parse   understood {parsed / iterations:.0%}")
+
+
+def dateutil_parse(text):
+    try:
+        return date_parser.parse(text, fuzzy=True).date()
+    except (ValueError, OverflowError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    today = date.today()
+
+    def cold(text):
+        trip_date_parser._parse_trip_dates.cache_clear()
+        return trip_date_parser.parse_trip_dates(text, today).start_date
+
+    def warm(text):
+        return trip_date_parser.parse_trip_dates(text, today).start_date
+
+    print(f"Date parsing throughput - {args.iterations} parses over {len(INPUTS)} inputs")
+    print("=" * 90)
+    run("dateutil (fuzzy)", dateutil_parse, INPUTS, args.iterations)
+    run("date_parser (cold)", cold, INPUTS, args.iterations)
+    run("date_parser (memo warm)", warm, INPUTS, args.iterations)
+    print(f"\nmemo: {trip_date_parser.cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+"""
+End-to-end benchmark of the compiled travel planner graph on a scripted conversation.
+
+Drives TravelGraphBuilder directly (no FastAPI, no Redis state) through
+destination -> source -> dates -> yes -> flight pick -> guests -> hotel pick (itinerary),
+with the scripted chat model and the fake SerpAPI / OpenWeather / Tavily server from
+src/fakes. Reports per-turn and per-node latency plus tracemalloc allocations and peak
+memory, writes JSON results and compares them against a stored baseline.
+
+Run from the repo root:
+    python -m benchmarks.graph_benchmark --runs 5
+    python -m benchmarks.graph_benchmark --zero-latency --save-baseline benchmarks/data/graph_baseline.json
+    python -m benchmarks.graph_benchmark --zero-latency --baseline benchmarks/data/graph_baseline.json --json results.json
+
+Exits with status 1 when a turn or node p50 regresses by more than --tolerance.
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+
+# Offline backends must be selected before settings are imported
+os.environ.setdefault("FAKE_LLM", "true")
+os.environ.setdefault("FAKE_UPSTREAMS", "true")
+
+from langchain_core.messages import HumanMessage  # noqa: E402
+
+from src.config.settings import settings  # noqa: E402
+from src.fakes.latency import load_fakes_config  # noqa: E402
+from src.fakes.upstream_server import start_fake_upstreams  # noqa: E402
+from src.langgraph_core.graphs.travel_planner_graph import TravelGraphBuilder  # noqa: E402
+from src.langgraph_core.LLMs.load_llms import LoadLLMs  # noqa: E402
+from src.langgraph_core.tools.http_session import upstream_http  # noqa: E402
+from src.utils.background import background_tasks  # noqa: E402
+
+
+def conversation(today: date):
+    """The scripted turns; trip dates are relative to today so the parser accepts them."""
+    start, end = today + timedelta(days=30), today + timedelta(days=35)
+    return [
+        ("destination", "I want to plan a trip to Goa"),
+        ("source", "Delhi"),
+        ("dates", f"from {start.strftime('%d %b %Y')} to {end.strftime('%d %b %Y')}"),
+        ("confirm", "yes"),
+        ("flight_pick", "1"),
+        ("guests", "2"),
+        ("hotel_pick", "1"),
+    ]
+
+
+def zero_fake_latency():
+    """Remove simulated latency and errors so only graph/node overhead is measured."""
+    config = load_fakes_config()
+    sections = [config.get("llm", {})] + [v for v in config.get("upstreams", {}).values() if isinstance(v, dict)]
+    for section in sections:
+        section["latency"] = {}
+
+
+def build_graph():
+    models = LoadLLMs()
+    return TravelGraphBuilder(models.load_groq_model(), models.load_node_llms()).build(draw=False)
+
+
+def _ts(event) -> float:
+    return datetime.fromisoformat(event["timestamp"]).timestamp()
+
+
+async def run_turn(graph, state: dict, text: str):
+    """One user message through the graph; returns (state, {node: [seconds]})."""
+    state["messages"].append(HumanMessage(content=text))
+    started = {}
+    node_times = defaultdict(list)
+
+    async for mode, event in graph.astream(state, stream_mode=["updates", "debug"]):
+        if mode == "updates":
+            for value in event.values():
+                if value:
+                    state.update(value)
+        elif event.get("type") == "task":
+            started[event["payload"]["id"]] = _ts(event)
+        elif event.get("type") == "task_result":
+            task_id = event["payload"]["id"]
+            if task_id in started:
+                node_times[event["payload"]["name"]].append(_ts(event) - started.pop(task_id))
+    return state, node_times
+
+
+async def run_conversation(graph, turns):
+    state = {"user_id": "bench", "session_id": "bench", "messages": [], "route": "router_node"}
+    turn_results = []
+    for name, text in turns:
+        tracemalloc.reset_peak()
+        mem_before = tracemalloc.get_traced_memory()[0]
+        blocks_before = sys.getallocatedblocks()
+        start = time.perf_counter()
+
+        state, node_times = await run_turn(graph, state, text)
+
+        elapsed = time.perf_counter() - start
+        mem_after, peak = tracemalloc.get_traced_memory()
+        turn_results.append({
+            "turn": name,
+            "seconds": elapsed,
+            "net_alloc_kb": (mem_after - mem_before) / 1024,
+            "peak_kb": (peak - mem_before) / 1024,
+            "net_blocks": sys.getallocatedblocks() - blocks_before,
+            "nodes": dict(node_times),
+        })
+    await background_tasks.shutdown()
+    return turn_results
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))]
+
+
+def summarize(runs):
+    turns = defaultdict(lambda: defaultdict(list))
+    nodes = defaultdict(list)
+    for run in runs:
+        for turn in run:
+            for metric in ("seconds", "net_alloc_kb", "peak_kb", "net_blocks"):
+                turns[turn["turn"]][metric].append(turn[metric])
+            for node, timings in turn["nodes"].items():
+                nodes[node].extend(timings)
+
+    summary = {"turns": {}, "nodes": {}}
+    for name, metrics in turns.items():
+        ms = [s * 1000 for s in metrics["seconds"]]
+        summary["turns"][name] = {
+            "p50_ms": statistics.median(ms),
+            "p95_ms": percentile(ms, 95),
+            "mean_ms": statistics.mean(ms),
+            "net_alloc_kb": statistics.mean(metrics["net_alloc_kb"]),
+            "peak_kb": max(metrics["peak_kb"]),
+            "net_blocks": statistics.mean(metrics["net_blocks"]),
+        }
+    for name, timings in nodes.items():
+        ms = [s * 1000 for s in timings]
+        summary["nodes"][name] = {"calls": len(ms), "p50_ms": statistics.median(ms), "p95_ms": percentile(ms, 95), "mean_ms": statistics.mean(ms)}
+    total = [sum(turn["seconds"] for turn in run) * 1000 for run in runs]
+    summary["conversation"] = {"p50_ms": statistics.median(total), "p95_ms": percentile(total, 95), "mean_ms": statistics.mean(total)}
+    return summary
+
+
+def print_summary(summary):
+    print(f"{'turn':<14}{'p50 ms':>10}{'p95 ms':>10}{'alloc KB':>11}{'peak KB':>10}{'blocks':>9}")
+    print("-" * 64)
+    for name, r in summary["turns"].items():
+        print(f"{name:<14}{r['p50_ms']:>10.2f}{r['p95_ms']:>10.2f}{r['net_alloc_kb']:>11.1f}{r['peak_kb']:>10.1f}{r['net_blocks']:>9.0f}")
+    c = summary["conversation"]
+    print(f"{'conversation':<14}{c['p50_ms']:>10.2f}{c['p95_ms']:>10.2f}")
+
+    print(f"\n{'node':<36}{'calls':>7}{'p50 ms':>10}{'p95 ms':>10}")
+    print("-" * 63)
+    for name, r in sorted(summary["nodes"].items(), key=lambda item: -item[1]["p50_ms"]):
+        print(f"{name:<36}{r['calls']:>7}{r['p50_ms']:>10.2f}{r['p95_ms']:>10.2f}")
+
+
+def compare(summary, baseline, tolerance, min_delta_ms):
+    """Return the list of p50 regressions against ``baseline``."""
+    regressions = []
+    for section in ("turns", "nodes"):
+        for name, current in summary[section].items():
+            previous = baseline.get(section, {}).get(name)
+            if not previous:
+                continue
+            delta = current["p50_ms"] - previous["p50_ms"]
+            if delta > min_delta_ms and current["p50_ms"] > previous["p50_ms"] * (1 + tolerance):
+                regressions.append(f"{section[:-1]} {name}: p50 {previous['p50_ms']:.2f} -> {current['p50_ms']:.2f} ms (+{delta / previous['p50_ms']:.0%})")
+    return regressions
+
+
+async def main_async(args):
+    tracemalloc.start()
+    runner = await start_fake_upstreams(port=settings.FAKE_UPSTREAM_PORT)
+    try:
+        graph = build_graph()
+        turns = conversation(date.today())
+        for _ in range(args.warmup):
+            await run_conversation(graph, turns)
+        return [await run_conversation(graph, turns) for _ in range(args.runs)]
+    finally:
+        await upstream_http.close()
+        await runner.cleanup()
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--zero-latency", action="store_true", help="disable simulated LLM/API latency and errors")
+    parser.add_argument("--json", help="write machine-readable results to this file")
+    parser.add_argument("--baseline", help="compare against results saved with --save-baseline")
+    parser.add_argument("--save-baseline", help="store this run's summary as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="allowed p50 slowdown (fraction)")
+    parser.add_argument("--min-delta-ms", type=float, default=1.0, help="ignore regressions smaller than this")
+    args = parser.parse_args()
+
+    if args.zero_latency:
+        zero_fake_latency()
+
+    runs = asyncio.run(main_async(args))
+    summary = summarize(runs)
+    summary["config"] = {"runs": args.runs, "warmup": args.warmup, "zero_latency": args.zero_latency}
+
+    print(f"Travel graph benchmark - {args.runs} runs, {len(runs[0])} turns")
+    print("=" * 64)
+    print_summary(summary)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"summary": summary, "runs": runs}, f, indent=2)
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump(summary, f, indent=2)
+        print(f"\nBaseline saved to {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline, "r") as f:
+            regressions = compare(summary, json.load(f), args.tolerance, args.min_delta_ms)
+        print()
+        if regressions:
+            print(f"Regressions (> {args.tolerance:.0%} p50 slowdown):")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print("No regressions against baseline.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Accuracy / latency benchmark for the TravelInfo location extractor backends.
+
+Runs a labeled corpus of travel utterances through every backend and reports
+precision, recall, F1 and per-message latency, then names the cheapest backend
+that meets the accuracy bar.
+
+Run from the repo root:
+    python -m benchmarks.location_extractor_benchmark --min-recall 0.85
+    python -m benchmarks.location_extractor_benchmark --backends gazetteer en_core_web_sm --json results.json
+"""
+import argparse
+import json
+import os
+import statistics
+import time
+
+from src.utils.location_extractors import LOCATION_EXTRACTORS, get_location_extractor
+
+CORPUS_PATH = os.path.join(os.path.dirname(__file__), "data", "travel_utterances.jsonl")
+
+
+def load_corpus(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def score(predicted, expected):
+    """Micro counts over case-insensitive place names."""
+    predicted = {p.lower() for p in predicted}
+    expected = {e.lower() for e in expected}
+    true_positives = len(predicted & expected)
+    return true_positives, len(predicted) - true_positives, len(expected) - true_positives
+
+
+def bench_backend(backend, corpus, warmup=3):
+    extractor = get_location_extractor(backend)
+
+    # First call loads the model - keep it out of the per-message numbers
+    start = time.perf_counter()
+    for example in corpus[:warmup]:
+        extractor.extract(example["text"])
+    load_time = time.perf_counter() - start
+
+    tp = fp = fn = 0
+    timings = []
+    for example in corpus:
+        start = time.perf_counter()
+        predicted = extractor.extract(example["text"])
+        timings.append(time.perf_counter() - start)
+
+        t, f_pos, f_neg = score(predicted, example["locations"])
+        tp, fp, fn = tp + t, fp + f_pos, fn + f_neg
+
+    precision = tp / (tp + fp) if tp + fp else 0.0
+    recall = tp / (tp + fn) if tp + fn else 0.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    timings_ms = sorted(t * 1000 for t in timings)
+
+    return {
+        "backend": backend,
+        "precision": precision,
+        "recall": recall,
+        "f1": f1,
+        "mean_ms": statistics.mean(timings_ms),
+        "p95_ms": timings_ms[int(0.95 * (len(timings_ms) - 1))],
+        "load_s": load_time,
+    }
+
+
+def print_results(results):
+    print(f"{'backend':<16}{'precision':>10}{'recall':>10}{'f1':>8}{'mean ms':>10}{'p95 ms':>10}{'load s':>9}")
+    print("-" * 73)
+    for r in results:
+        print(f"{r['backend']:<16}{r['precision']:>10.3f}{r['recall']:>10.3f}{r['f1']:>8.3f}{r['mean_ms']:>10.3f}{r['p95_ms']:>10.3f}{r['load_s']:>9.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backends", nargs="+", default=list(LOCATION_EXTRACTORS), help="backends to compare")
+    parser.add_argument("--corpus", default=CORPUS_PATH, help="JSONL file with {text, locations} rows")
+    parser.add_argument("--min-precision", type=float, default=0.9)
+    parser.add_argument("--min-recall", type=float, default=0.85)
+    parser.add_argument("--json", help="write machine-readable results to this file")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus)
+    print(f"Location extractor benchmark - {len(corpus)} utterances")
+    print("=" * 73)
+
+    results = []
+    for backend in args.backends:
+        try:
+            results.append(bench_backend(backend, corpus))
+        except Exception as e:
+            print(f"{backend}: skipped ({e})")
+
+    print_results(results)
+
+    passing = [r for r in results if r["precision"] >= args.min_precision and r["recall"] >= args.min_recall]
+    print()
+    if passing:
+        cheapest = min(passing, key=lambda r: r["mean_ms"])
+        print(f"Cheapest backend meeting precision>={args.min_precision} recall>={args.min_recall}: {cheapest['backend']}")
+        print(f"Set LOCATION_EXTRACTOR={cheapest['backend']} to use it.")
+    else:
+        print("No backend meets the accuracy bar.")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"corpus_size": len(corpus), "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
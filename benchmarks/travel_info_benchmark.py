@@ -0,0 +1,97 @@
+"""
+Per-message TravelInfo extraction latency, before and after the shared spaCy pipeline.
+
+Run from the repo root:
+    python -m benchmarks.travel_info_benchmark --messages 50
+"""
+import argparse
+import statistics
+import time
+
+import spacy
+
+from src.utils.location_extractors import get_nlp
+from src.utils.Utilities import TravelInfo
+
+TEST_MESSAGES = [
+    "I want to travel to Paris from 12 Dec 2025 to 18 Dec 2025",
+    "Plan a trip to Tokyo for 5 days starting 3 Jan 2026",
+    "I'd like to visit Goa for a week",
+    "Holiday in Dubai from 1 Feb 2026 to 6 Feb 2026",
+    "Can you plan a vacation to New York for 4 days",
+    "Trip to Bali on 20 Mar 2026 for 7 days",
+    "I want to go to London",
+    "Visit Singapore from 10 Apr 2026 to 14 Apr 2026",
+]
+
+
+class LegacyTravelInfo(TravelInfo):
+    """Old behaviour: full en_core_web_md pipeline loaded on every construction."""
+
+    def __init__(self):
+        super().__init__("en_core_web_md")
+        self._nlp = spacy.load("en_core_web_md")
+
+    def extract_location(self, text: str):
+        return [ent.text for ent in self._nlp(text).ents if ent.label_ == "GPE"]
+
+
+def summarize(name, timings):
+    timings_ms = sorted(t * 1000 for t in timings)
+    p95 = timings_ms[int(0.95 * (len(timings_ms) - 1))]
+    print(f"{name:<32} mean={statistics.mean(timings_ms):9.2f}ms  p50={statistics.median(timings_ms):9.2f}ms  p95={p95:9.2f}ms")
+
+
+def bench_before(messages):
+    """travel_node before: TravelInfo() (and spacy.load) per message."""
+    timings = []
+    for msg in messages:
+        start = time.perf_counter()
+        LegacyTravelInfo().extract_trip_info(msg)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def bench_after(messages):
+    """travel_node after: one shared, NER-only pipeline."""
+    get_nlp()  # first-load cost is paid once per process, exclude it from per-message numbers
+    extractor = TravelInfo("en_core_web_md")
+    timings = []
+    for msg in messages:
+        start = time.perf_counter()
+        extractor.extract_trip_info(msg)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def bench_batched(messages):
+    extractor = TravelInfo("en_core_web_md")
+    start = time.perf_counter()
+    extractor.extract_trip_info_many(messages)
+    total = time.perf_counter() - start
+    return [total / len(messages)] * len(messages)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=40, help="number of messages to extract")
+    parser.add_argument("--skip-before", action="store_true", help="skip the (slow) per-message spacy.load run")
+    args = parser.parse_args()
+
+    messages = [TEST_MESSAGES[i % len(TEST_MESSAGES)] for i in range(args.messages)]
+
+    print(f"TravelInfo extraction latency over {len(messages)} messages")
+    print("=" * 80)
+
+    start = time.perf_counter()
+    get_nlp()
+    print(f"{'shared pipeline first load':<32} {(time.perf_counter() - start) * 1000:9.2f}ms (once per process)")
+
+    if not args.skip_before:
+        summarize("before: spacy.load per message", bench_before(messages))
+    summarize("after: shared NER-only pipeline", bench_after(messages))
+    summarize("after: extract_trip_info_many", bench_batched(messages))
+
+
+if __name__ == "__main__":
+    main()
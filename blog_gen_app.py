@@ -1,13 +1,17 @@
 import uvicorn
 from fastapi import FastAPI, Request
+from src.cache.usage_tracker import usage_scope, usage_tracker
 from src.langgraph_core.graphs.graph_builder import BasicChatbotGraphBuilder
 from src.langgraph_core.LLMs.load_llms import LoadLLMs
+from src.loggers import Logger
 
 import os
 from dotenv import load_dotenv
 
 load_dotenv()
 
+logger = Logger(__name__).get_logger()
+
 app = FastAPI()
 
 print(os.getenv("LANGCHAIN_API_KEY"))
@@ -30,7 +34,13 @@ async def create_blogs(request: Request):
     graph_builder = BasicChatbotGraphBuilder(llm)
     if topic:
         graph = graph_builder.setup_bloggen_graph(usecase="topic")
-        state = graph.invoke({"topic": topic})
+        # Attribute LLM token usage to the caller and this request
+        with usage_scope(data.get("user_id") or (request.client.host if request.client else None)) as request_id:
+            try:
+                state = graph.invoke({"topic": topic})
+            finally:
+                await usage_tracker.flush()
+                logger.info(f"LLM usage for request {request_id}: {usage_tracker.request_summary(request_id)}")
 
     return {"data": state}
 
@@ -1,16 +1,29 @@
 from ai_travel_planner import langgraph_chatbot
 from fastapi import FastAPI, Request, HTTPException, status
-from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel, EmailStr
 from typing import Optional
+from datetime import date
+from uuid import uuid4
+import asyncio
+import json
 from src.cache.redis_client import init_redis
 import uvicorn
 from contextlib import asynccontextmanager
 from src.database.databases import database
 from src.auth.authentication import AuthenticationService
 from src.cache.session_manager import session_manager
+from src.utils.background import background_tasks
+from src.cache.usage_tracker import usage_tracker
+from src.cache.single_flight import single_flight
+from src.cache.cache_keys import cache_stats
+from src.config.settings import settings
+from src.langgraph_core.LLMs.http_clients import llm_http
+from src.langgraph_core.tools.http_session import upstream_http
+from src.langgraph_core.tools.upstream_guard import upstream_guard
+from src.fakes.upstream_server import start_fake_upstreams
 from src.loggers import Logger
 
 logger = Logger(__name__).get_logger()
@@ -21,8 +34,23 @@ async def lifespan(app: FastAPI):
     # Startup
     await init_redis()
     logger.info("Redis connected successfully")
+    fake_upstreams = await start_fake_upstreams(port=settings.FAKE_UPSTREAM_PORT) if settings.FAKE_UPSTREAMS else None
+    if not settings.FAKE_LLM:
+        await llm_http.prewarm()
+    if not settings.FAKE_UPSTREAMS:
+        await upstream_http.prewarm()
     yield
     # Shutdown
+    await background_tasks.shutdown()
+    logger.info(f"LLM HTTP pool metrics: {llm_http.metrics()}")
+    await llm_http.aclose()
+    logger.info(f"Upstream HTTP pool metrics: {upstream_http.metrics()}")
+    logger.info(f"Upstream resilience metrics: {upstream_guard.metrics()}")
+    logger.info(f"Search single-flight metrics: {single_flight.metrics()}")
+    logger.info(f"Search cache hit ratios: {cache_stats.metrics()}")
+    await upstream_http.close()
+    if fake_upstreams:
+        await fake_upstreams.cleanup()
     logger.info("Application shutdown")
 
 # Then create your app with the lifespan
@@ -307,5 +335,83 @@ async def get_data(request: Request):
     })
 
 
+@app.post('/data/stream')
+async def stream_data(request: Request):
+    """
+    Same as /data, but as Server-Sent Events - REQUIRES AUTHENTICATION
+
+    Emits the custom chunks nodes stream while the graph runs (``itinerary_day`` events,
+    one per generated day), then one ``message`` event with the full reply.
+    """
+    user = await get_current_user_from_request(request)
+    if not user:
+        return JSONResponse({"error": "Authentication required"}, status_code=401)
+
+    data = await request.json()
+    user_input = data.get('data')
+    session_token = get_session_token(request)
+    queue = asyncio.Queue()
+
+    async def run():
+        try:
+            message = await langgraph_chatbot(
+                user_message=user_input,
+                user_id=str(user['id']),
+                session_id=session_token,
+                on_stream=queue.put,
+            )
+            logger.info(f"AI message for user {user['email']}: {message}")
+            await queue.put({"type": "message", "message": message, "user_name": user.get("name")})
+        except Exception as e:
+            logger.error(f"Streaming chat failed for user {user['email']}: {e}")
+            await queue.put({"type": "error", "message": "Sorry, I encountered an error. Please try again."})
+
+    # The run finishes (and saves the conversation state) even if the client disconnects
+    background_tasks.spawn(f"chat_stream:{user['id']}:{uuid4().hex}", run())
+
+    async def events():
+        while True:
+            event = await queue.get()
+            yield f"event: {event.get('type', 'chunk')}\ndata: {json.dumps(event)}\n\n"
+            if event.get("type") in ("message", "error"):
+                break
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+
+@app.get("/admin/usage")
+async def admin_usage(request: Request, day: Optional[str] = None):
+    """
+    LLM token and cost aggregates per user, node and provider for ``day`` (YYYY-MM-DD,
+    default today) - REQUIRES AN ADMIN SESSION
+    """
+    user = await get_current_user_from_request(request)
+    if not user or user["email"].lower() not in settings.ADMIN_EMAILS:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required")
+
+    await usage_tracker.flush()
+    return JSONResponse({
+        "day": day or date.today().isoformat(),
+        "usage": await usage_tracker.daily_report(day),
+        "process_totals": usage_tracker.metrics(),
+    })
+
+
+@app.get("/admin/cache")
+async def admin_cache(request: Request):
+    """
+    Per-namespace hit ratios of the search/weather caches and request coalescing
+    counters for this worker - REQUIRES AN ADMIN SESSION
+    """
+    user = await get_current_user_from_request(request)
+    if not user or user["email"].lower() not in settings.ADMIN_EMAILS:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required")
+
+    return JSONResponse({
+        "namespaces": cache_stats.metrics(),
+        "single_flight": single_flight.metrics(),
+    })
+
+
 if __name__ == '__main__':
     uvicorn.run("main:app", host="0.0.0.0", port=5000, reload=True)
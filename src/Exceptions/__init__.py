@@ -20,3 +20,13 @@ class ExceptionError(Exception):
 
     def __str__(self):
         return self.error_message
+
+
+class UpstreamUnavailableError(Exception):
+    """An upstream API (SerpAPI, OpenWeather, Tavily) could not be reached after retries,
+    is rate limited, or its circuit breaker is open."""
+
+    def __init__(self, api: str, reason: str):
+        self.api = api
+        self.reason = reason
+        super().__init__(f"{api} unavailable: {reason}")
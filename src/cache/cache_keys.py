@@ -0,0 +1,148 @@
+"""
+Canonical Redis keys for cached travel searches, and per-namespace hit ratios.
+
+Keys look like ``travel:flights:v3:currency=INR|destination=BOM|...``: a namespace with
+its own schema version (bump it in ``NAMESPACE_VERSIONS`` when the cached format
+changes, and old entries simply stop being read) followed by every upstream query
+parameter, sorted, with places and dates normalized so equivalent searches share an
+entry: "Bombay" and "mumbai " -> "mumbai", "London, CA" -> "london,ca", "bom" -> "BOM",
+"12 Dec 2025" -> "2025-12-12".
+"""
+import re
+from collections import defaultdict
+from datetime import date, datetime
+
+from src.utils.date_parser import to_iso
+
+KEY_PREFIX = "travel"
+
+# Schema version per namespace (v1 was the un-versioned "<source>-<destination>-<dates>" key)
+NAMESPACE_VERSIONS = {
+    "flights": 5,  # v4: records carry option_id; v5: and every leg
+    "hotels": 4,
+    "weather_current": 1,
+    "weather_forecast": 1,
+    "tavily": 1,
+}
+
+# Old / alternative names -> the name we cache under
+CITY_ALIASES = {
+    "bombay": "mumbai",
+    "bangalore": "bengaluru",
+    "calcutta": "kolkata",
+    "madras": "chennai",
+    "new delhi": "delhi",
+    "poona": "pune",
+    "gurgaon": "gurugram",
+    "trivandrum": "thiruvananthapuram",
+    "cochin": "kochi",
+    "benares": "varanasi",
+    "banaras": "varanasi",
+    "mysore": "mysuru",
+    "baroda": "vadodara",
+    "pondicherry": "puducherry",
+    "panjim": "panaji",
+    "allahabad": "prayagraj",
+    "nyc": "new york",
+    "new york city": "new york",
+    "saigon": "ho chi minh city",
+    "peking": "beijing",
+}
+
+_IATA_RE = re.compile(r"^[A-Za-z]{3}$")
+_NON_WORD_RE = re.compile(r"[^\w\s-]")
+
+
+def _normalize_part(text: str) -> str:
+    return " ".join(_NON_WORD_RE.sub(" ", text).split()).casefold()
+
+
+def canonical_city(name: str) -> str:
+    """Cache-key form of a place: casefolded, punctuation dropped, aliases applied to the city.
+
+    A ", state/country" qualifier is kept so different places don't share an entry:
+    " Bombay " -> "mumbai", "London, CA" -> "london,ca". Only for keys - upstream APIs
+    get the user's own text.
+    """
+    city, *qualifiers = [_normalize_part(part) for part in (name or "").split(",")]
+    return ",".join([CITY_ALIASES.get(city, city)] + [q for q in qualifiers if q])
+
+
+def canonical_place(value: str) -> str:
+    """IATA codes upper-cased ("bom" -> "BOM"); anything else treated as a city name."""
+    value = (value or "").strip()
+    return value.upper() if _IATA_RE.match(value) else canonical_city(value)
+
+
+def iso_date(value) -> str:
+    """date / datetime / free-text date -> YYYY-MM-DD (unparseable text is kept, trimmed)."""
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    text = str(value or "").strip()
+    return to_iso(text) or text
+
+
+def build_key(namespace: str, **params) -> str:
+    """Versioned key for ``namespace`` covering every parameter (None values are kept as "")."""
+    version = NAMESPACE_VERSIONS[namespace]
+    query = "|".join(f"{name}={'' if value is None else value}" for name, value in sorted(params.items()))
+    return f"{KEY_PREFIX}:{namespace}:v{version}:{query}"
+
+
+def flight_search_key(origin: str, destination: str, outbound_date, return_date, currency: str = "INR") -> str:
+    """Key for one google_flights query; ``origin``/``destination`` are IATA codes or city names."""
+    return build_key(
+        "flights",
+        origin=canonical_place(origin),
+        destination=canonical_place(destination),
+        outbound_date=iso_date(outbound_date),
+        return_date=iso_date(return_date),
+        currency=currency.upper(),
+    )
+
+
+def hotel_search_key(city: str, check_in, check_out, adults: int, currency: str = "INR") -> str:
+    """Key for one google_hotels query."""
+    return build_key(
+        "hotels",
+        city=canonical_city(city),
+        check_in=iso_date(check_in),
+        check_out=iso_date(check_out),
+        adults=int(adults),
+        currency=currency.upper(),
+    )
+
+
+def namespace_of(key: str) -> str:
+    parts = key.split(":")
+    return parts[1] if len(parts) > 2 and parts[0] == KEY_PREFIX else "other"
+
+
+class CacheStats:
+    """Process-wide fresh / stale / miss counters per cache namespace."""
+
+    def __init__(self):
+        self.counts = defaultdict(lambda: defaultdict(int))
+
+    def record(self, key: str, outcome: str):
+        """``outcome`` is "hit", "stale" or "miss"."""
+        self.counts[namespace_of(key)][outcome] += 1
+
+    def metrics(self) -> dict:
+        report = {}
+        for namespace, counts in self.counts.items():
+            lookups = sum(counts.values())
+            served = counts["hit"] + counts["stale"]
+            report[namespace] = {
+                **counts,
+                "lookups": lookups,
+                "hit_ratio": round(served / lookups, 4) if lookups else None,
+                "fresh_hit_ratio": round(counts["hit"] / lookups, 4) if lookups else None,
+            }
+        return report
+
+
+# Global instance shared by all caches
+cache_stats = CacheStats()
@@ -0,0 +1,150 @@
+import hashlib
+import json
+import time
+from collections import OrderedDict, defaultdict
+from typing import Callable, List, Optional
+
+from langchain_core.messages import AIMessage, BaseMessage
+
+from src.cache.redis_client import redis_client
+from src.config.settings import settings
+from src.loggers import Logger
+from src.utils.Utilities import load_llm_config
+
+logger = Logger(__name__).get_logger()
+
+DEFAULT_TTL = 3600
+
+
+class InMemoryResponseStore:
+    """Process-local LRU store with per-entry expiry."""
+
+    def __init__(self, max_entries: int = 5000):
+        self.max_entries = max_entries
+        self._data = OrderedDict()
+
+    async def get(self, key: str):
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: str, expire: int):
+        self._data[key] = (value, time.monotonic() + expire)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+        return True
+
+
+class RedisResponseStore:
+    """Shared store on top of the app's async Redis client."""
+
+    async def get(self, key: str):
+        return await redis_client.get(key)
+
+    async def set(self, key: str, value: str, expire: int):
+        return await redis_client.set(key, value, expire)
+
+
+class LLMResponseCache:
+    """
+    Opt-in cache around ``llm.ainvoke`` for prompts fully determined by their inputs.
+
+    Entries are keyed by a hash of (model, temperature, prompt) and expire after a
+    TTL configured per prompt type under ``response_cache`` in llm_configs.yml.
+    Creative prompts (e.g. the itinerary) must keep calling the LLM directly.
+    """
+
+    key_prefix = "llm_cache:"
+
+    def __init__(self):
+        self._config = None
+        self._store = None
+        self.hits = defaultdict(int)
+        self.misses = defaultdict(int)
+        self.rejected = defaultdict(int)
+
+    def _load(self):
+        try:
+            self._config = load_llm_config("response_cache") or {}
+        except Exception as e:
+            logger.warning(f"No response_cache config, using defaults: {e}")
+            self._config = {}
+
+        backend = settings.LLM_CACHE_BACKEND or self._config.get("backend", "redis")
+        if backend == "memory":
+            self._store = InMemoryResponseStore(self._config.get("max_entries", 5000))
+        elif backend == "redis":
+            self._store = RedisResponseStore()
+        else:
+            self._store = None
+        logger.info(f"LLM response cache backend: {backend}")
+
+    @property
+    def enabled(self) -> bool:
+        if self._config is None:
+            self._load()
+        return self._store is not None
+
+    def ttl_for(self, prompt_type: str) -> int:
+        return self._config.get("ttl_seconds", {}).get(prompt_type, DEFAULT_TTL)
+
+    @staticmethod
+    def _model_name(llm) -> str:
+        return str(getattr(llm, "model_name", None) or getattr(llm, "model", None) or type(llm).__name__)
+
+    def make_key(self, llm, messages: List[BaseMessage]) -> str:
+        payload = json.dumps(
+            {
+                "model": self._model_name(llm),
+                "temperature": getattr(llm, "temperature", None),
+                "prompt": [(m.type, m.content) for m in messages],
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return self.key_prefix + hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def ainvoke(self, llm, messages: List[BaseMessage], prompt_type: str, cacheable: Optional[Callable[[str], bool]] = None) -> AIMessage:
+        """``llm.ainvoke(messages)``, answered from the cache when possible.
+
+        Only non-empty replies that pass ``cacheable`` (if given) are stored, so a
+        malformed reply is retried next time instead of being replayed for the whole TTL.
+        """
+        if not self.enabled:
+            return await llm.ainvoke(messages)
+
+        key = self.make_key(llm, messages)
+        cached = await self._store.get(key)
+        if cached is not None:
+            self.hits[prompt_type] += 1
+            logger.info(f"LLM cache hit for {prompt_type}")
+            return AIMessage(content=cached)
+
+        self.misses[prompt_type] += 1
+        response = await llm.ainvoke(messages)
+        if isinstance(response.content, str) and response.content.strip():
+            if cacheable is None or cacheable(response.content):
+                await self._store.set(key, response.content, self.ttl_for(prompt_type))
+            else:
+                self.rejected[prompt_type] += 1
+                logger.warning(f"Not caching malformed {prompt_type} reply: {response.content[:200]!r}")
+        return response
+
+    def metrics(self) -> dict:
+        """Hit/miss counters per prompt type."""
+        result = {}
+        for prompt_type in set(self.hits) | set(self.misses):
+            hits, misses = self.hits[prompt_type], self.misses[prompt_type]
+            result[prompt_type] = {"hits": hits, "misses": misses, "rejected": self.rejected[prompt_type], "hit_ratio": hits / (hits + misses)}
+        return result
+
+
+# Global instance shared by all nodes
+llm_cache = LLMResponseCache()
@@ -102,6 +102,63 @@ class AsyncRedisClient:
             logger.error(f"Redis exists error: {e}")
             return False
 
+    async def set_if_absent(self, key: str, value: str, expire: int = None):
+        """Async SET NX; True if set, False if the key exists, None if Redis is unavailable"""
+        if not await self.is_connected():
+            return None
+        try:
+            return bool(await self.client.set(key, value, ex=expire, nx=True))
+        except Exception as e:
+            logger.error(f"Redis set_if_absent error: {e}")
+            return None
+
+    async def delete_if_value(self, key: str, value: str):
+        """Async delete key only while it still holds value (safe lock release)"""
+        if not await self.is_connected():
+            return False
+        try:
+            script = "if redis.call('get', KEYS[1]) == ARGV[1] then return redis.call('del', KEYS[1]) else return 0 end"
+            return await self.client.eval(script, 1, key, value) == 1
+        except Exception as e:
+            logger.error(f"Redis delete_if_value error: {e}")
+            return False
+
+    async def hincrbyfloat(self, key: str, mapping: dict, expire: int = None):
+        """Async increment several hash fields in one round trip"""
+        if not await self.is_connected():
+            return False
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for field, amount in mapping.items():
+                    pipe.hincrbyfloat(key, field, amount)
+                if expire:
+                    pipe.expire(key, expire)
+                await pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Redis hincrbyfloat error: {e}")
+            return False
+
+    async def hget(self, key: str, field: str):
+        """Async get one hash field"""
+        if not await self.is_connected():
+            return None
+        try:
+            return await self.client.hget(key, field)
+        except Exception as e:
+            logger.error(f"Redis hget error: {e}")
+            return None
+
+    async def hgetall(self, key: str):
+        """Async get a whole hash"""
+        if not await self.is_connected():
+            return {}
+        try:
+            return await self.client.hgetall(key)
+        except Exception as e:
+            logger.error(f"Redis hgetall error: {e}")
+            return {}
+
 # ✅ Global async instance
 redis_client = AsyncRedisClient()
 
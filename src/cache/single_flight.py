@@ -0,0 +1,99 @@
+import asyncio
+import time
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, Optional
+from uuid import uuid4
+
+from src.cache.redis_client import redis_client
+from src.loggers import Logger
+
+logger = Logger(__name__).get_logger()
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical searches into one upstream call.
+
+    Within a worker, callers for the same key share one task (the first caller starts
+    it, the rest await it; cancelling a caller never cancels the shared work). Across
+    workers, the task first takes a short Redis lock (``lock:<key>``, SET NX EX). If
+    another worker holds it, the task polls the result cache until the value appears,
+    and only searches itself when the lock disappears without a result or the wait
+    times out. Without Redis, coalescing is per worker only.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.stats = defaultdict(int)
+
+    async def run(
+        self,
+        key: str,
+        produce: Callable[[], Awaitable[Any]],
+        read_cache: Callable[[], Awaitable[Optional[Any]]],
+        lock_ttl: int = 30,
+        wait_timeout: float = 25.0,
+        poll_interval: float = 0.2,
+    ) -> Any:
+        """Return ``produce()`` for ``key``, sharing it with concurrent callers.
+
+        ``produce`` must write its result to the cache that ``read_cache`` reads.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            self.stats["leaders"] += 1
+            task = asyncio.create_task(self._lead(key, produce, read_cache, lock_ttl, wait_timeout, poll_interval), name=f"single_flight:{key}")
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._on_done(key, t))
+        else:
+            self.stats["local_waiters"] += 1
+            logger.info(f"Joining in-flight search for {key}")
+        return await asyncio.shield(task)
+
+    def _on_done(self, key: str, task: asyncio.Task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # retrieved here in case every caller was cancelled
+
+    async def _lead(self, key, produce, read_cache, lock_ttl, wait_timeout, poll_interval):
+        lock_key = f"lock:{key}"
+        token = uuid4().hex
+        acquired = await redis_client.set_if_absent(lock_key, token, lock_ttl)
+
+        if acquired is False:
+            # Another worker is searching; wait for its result to land in the cache
+            self.stats["remote_waits"] += 1
+            logger.info(f"Waiting for another worker's search for {key}")
+            deadline = time.monotonic() + wait_timeout
+            while time.monotonic() < deadline:
+                await asyncio.sleep(poll_interval)
+                cached = await read_cache()
+                if cached is not None:
+                    self.stats["remote_hits"] += 1
+                    return cached
+                if not await redis_client.exists(lock_key):
+                    break
+            # Holder failed or is too slow: search ourselves (and take the lock if free)
+            self.stats["remote_fallbacks"] += 1
+            acquired = await redis_client.set_if_absent(lock_key, token, lock_ttl)
+
+        try:
+            if acquired:
+                # The previous holder may have filled the cache since the caller's miss
+                cached = await read_cache()
+                if cached is not None:
+                    self.stats["remote_hits"] += 1
+                    return cached
+            self.stats["upstream_calls"] += 1
+            return await produce()
+        finally:
+            if acquired:
+                await redis_client.delete_if_value(lock_key, token)
+
+    def metrics(self) -> dict:
+        return {**self.stats, "in_flight": len(self._inflight)}
+
+
+# Global instance shared by all nodes
+single_flight = SingleFlight()
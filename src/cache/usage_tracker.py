@@ -0,0 +1,188 @@
+import threading
+import uuid
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import date
+from typing import Dict, Optional
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+from src.cache.redis_client import redis_client
+from src.loggers import Logger
+from src.utils.Utilities import load_llm_config
+
+logger = Logger(__name__).get_logger()
+
+# Who the current LLM calls are for; set once per chat request by usage_scope()
+current_user_id: ContextVar[Optional[str]] = ContextVar("current_user_id", default=None)
+current_request_id: ContextVar[Optional[str]] = ContextVar("current_request_id", default=None)
+over_budget: ContextVar[bool] = ContextVar("over_budget", default=False)
+
+USAGE_FIELDS = ("input_tokens", "output_tokens", "total_tokens", "cost_usd", "calls")
+DIMENSIONS = ("user", "node", "provider")
+
+
+@contextmanager
+def usage_scope(user_id: str = None, request_id: str = None):
+    """Attribute every LLM call made inside the block to ``user_id`` / ``request_id``."""
+    tokens = [
+        current_user_id.set(user_id),
+        current_request_id.set(request_id or uuid.uuid4().hex),
+        over_budget.set(False),
+    ]
+    try:
+        yield current_request_id.get()
+    finally:
+        for var, token in zip((current_user_id, current_request_id, over_budget), tokens):
+            var.reset(token)
+
+
+class UsageTracker:
+    """
+    Token and cost accounting for LLM calls.
+
+    Calls are aggregated per request, user, graph node and provider/model. Counters are
+    kept in process and written to Redis hashes by ``flush()`` (one hash per day and
+    dimension, fields ``<name>:<counter>``). Prices and the optional per-user daily
+    budget come from ``usage`` in llm_configs.yml.
+    """
+
+    key_prefix = "usage:"
+    day_ttl = 60 * 60 * 24 * 35
+    request_ttl = 60 * 60 * 24
+
+    def __init__(self):
+        self._config = None
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        self._requests: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        self.totals: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+
+    @property
+    def config(self) -> dict:
+        if self._config is None:
+            try:
+                self._config = load_llm_config("usage") or {}
+            except Exception as e:
+                logger.warning(f"No usage config, costs will be reported as 0: {e}")
+                self._config = {}
+        return self._config
+
+    def cost(self, model: str, input_tokens: int, output_tokens: int) -> float:
+        """Estimated USD cost; prices are per 1M tokens."""
+        price = self.config.get("pricing", {}).get(model)
+        if not price:
+            return 0.0
+        return (input_tokens * price.get("input", 0) + output_tokens * price.get("output", 0)) / 1_000_000
+
+    def _day_key(self, dimension: str, day: str = None) -> str:
+        return f"{self.key_prefix}{day or date.today().isoformat()}:{dimension}"
+
+    def record(self, provider: str, model: str, node: str, input_tokens: int, output_tokens: int):
+        user_id = current_user_id.get() or "anonymous"
+        request_id = current_request_id.get()
+        usage = {
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens,
+            "cost_usd": self.cost(model, input_tokens, output_tokens),
+            "calls": 1,
+        }
+        names = {"user": user_id, "node": node, "provider": f"{provider}/{model}"}
+
+        with self._lock:
+            for dimension, name in names.items():
+                for field, amount in usage.items():
+                    self._pending[self._day_key(dimension)][f"{name}:{field}"] += amount
+                    self.totals[f"{dimension}:{name}"][field] += amount
+            if request_id:
+                for field, amount in usage.items():
+                    self._pending[f"{self.key_prefix}request:{request_id}"][field] += amount
+                    self._requests[request_id][field] += amount
+
+    def request_summary(self, request_id: str) -> dict:
+        """Usage of one request (forgotten after this call)."""
+        with self._lock:
+            return dict(self._requests.pop(request_id, {}))
+
+    async def flush(self):
+        """Write pending increments to Redis."""
+        with self._lock:
+            pending, self._pending = self._pending, defaultdict(lambda: defaultdict(float))
+        for key, mapping in pending.items():
+            expire = self.request_ttl if key.startswith(f"{self.key_prefix}request:") else self.day_ttl
+            await redis_client.hincrbyfloat(key, dict(mapping), expire)
+
+    async def daily_cost(self, user_id: str) -> float:
+        value = await redis_client.hget(self._day_key("user"), f"{user_id}:cost_usd")
+        return float(value) if value else 0.0
+
+    async def check_budget(self, user_id: str) -> bool:
+        """Flag the current request as over budget when the user's spend today exceeds ``daily_budget_usd``."""
+        budget = self.config.get("daily_budget_usd") or 0
+        if not budget or not user_id:
+            return False
+        spent = await self.daily_cost(user_id)
+        if spent >= budget:
+            logger.warning(f"User {user_id} is over the daily LLM budget (${spent:.4f} >= ${budget}), downgrading model")
+            over_budget.set(True)
+            return True
+        return False
+
+    async def daily_report(self, day: str = None) -> dict:
+        """Per user / node / provider aggregates for ``day`` (YYYY-MM-DD, default today)."""
+        report = {}
+        for dimension in DIMENSIONS:
+            grouped = defaultdict(dict)
+            for field_key, value in (await redis_client.hgetall(self._day_key(dimension, day))).items():
+                name, _, field = field_key.rpartition(":")
+                grouped[name][field] = float(value)
+            report[dimension] = dict(grouped)
+        return report
+
+    def metrics(self) -> dict:
+        """In-process totals since startup."""
+        with self._lock:
+            return {name: dict(values) for name, values in self.totals.items()}
+
+
+class UsageCallbackHandler(BaseCallbackHandler):
+    """Feeds ``usage_metadata`` of every chat model response into the UsageTracker."""
+
+    run_inline = True
+
+    def __init__(self, tracker: UsageTracker):
+        self.tracker = tracker
+        self._runs = {}
+
+    def on_chat_model_start(self, serialized, messages, *, run_id, metadata=None, **kwargs):
+        metadata = metadata or {}
+        self._runs[run_id] = (
+            metadata.get("ls_provider", "unknown"),
+            metadata.get("ls_model_name", "unknown"),
+            metadata.get("langgraph_node", "unknown"),
+        )
+
+    def on_llm_end(self, response, *, run_id, **kwargs):
+        provider, model, node = self._runs.pop(run_id, ("unknown", "unknown", "unknown"))
+        usage = None
+        try:
+            usage = response.generations[0][0].message.usage_metadata
+        except (AttributeError, IndexError):
+            pass
+        if not usage:
+            token_usage = (response.llm_output or {}).get("token_usage") or {}
+            usage = {
+                "input_tokens": token_usage.get("prompt_tokens", 0),
+                "output_tokens": token_usage.get("completion_tokens", 0),
+            }
+        self.tracker.record(provider, model, node, usage.get("input_tokens", 0), usage.get("output_tokens", 0))
+
+    def on_llm_error(self, error, *, run_id, **kwargs):
+        self._runs.pop(run_id, None)
+
+
+# Global instances shared by all LLM clients
+usage_tracker = UsageTracker()
+usage_handler = UsageCallbackHandler(usage_tracker)
@@ -9,5 +9,33 @@ class Settings:
     REDIS_URL = os.getenv("REDIS_URL")
     SECRET_KEY = os.getenv("SECRET_KEY")
 
+    # Hotel search started in the background once trip details are confirmed
+    HOTEL_PREFETCH_ENABLED = os.getenv("HOTEL_PREFETCH_ENABLED", "true").lower() == "true"
+    HOTEL_PREFETCH_GUESTS = int(os.getenv("HOTEL_PREFETCH_GUESTS", "2"))
+
+    # Opt-in: search flights while the user is still reading the trip summary
+    SPECULATIVE_FLIGHT_PREFETCH = os.getenv("SPECULATIVE_FLIGHT_PREFETCH", "false").lower() == "true"
+    SPECULATIVE_PREFETCH_RETAIN = int(os.getenv("SPECULATIVE_PREFETCH_RETAIN", "900"))  # seconds
+
+    # Location extractor backend: en_core_web_md | en_core_web_sm | gazetteer
+    LOCATION_EXTRACTOR = os.getenv("LOCATION_EXTRACTOR", "en_core_web_md")
+
+    # LLM response cache backend: redis | memory | off (defaults to llm_configs.yml)
+    LLM_CACHE_BACKEND = os.getenv("LLM_CACHE_BACKEND")
+
+    # Offline rig (src/fakes): scripted chat model and local stand-ins for SerpAPI, OpenWeather and Tavily
+    FAKE_LLM = os.getenv("FAKE_LLM", "false").lower() == "true"
+    FAKE_UPSTREAMS = os.getenv("FAKE_UPSTREAMS", "false").lower() == "true"
+    FAKE_UPSTREAM_PORT = int(os.getenv("FAKE_UPSTREAM_PORT", "8765"))
+    _FAKE_UPSTREAM_URL = f"http://127.0.0.1:{FAKE_UPSTREAM_PORT}"
+
+    # Upstream API base URLs (overridable, e.g. for a shared fake server)
+    SERPAPI_BASE_URL = os.getenv("SERPAPI_BASE_URL") or (_FAKE_UPSTREAM_URL if FAKE_UPSTREAMS else "https://serpapi.com")
+    OPENWEATHER_BASE_URL = os.getenv("OPENWEATHER_BASE_URL") or (_FAKE_UPSTREAM_URL if FAKE_UPSTREAMS else "https://api.openweathermap.org")
+    TAVILY_BASE_URL = os.getenv("TAVILY_BASE_URL") or (_FAKE_UPSTREAM_URL if FAKE_UPSTREAMS else "https://api.tavily.com")
+
+    # Comma separated emails allowed to read /admin/usage
+    ADMIN_EMAILS = [email.strip().lower() for email in os.getenv("ADMIN_EMAILS", "").split(",") if email.strip()]
+
 
 settings = Settings()
@@ -0,0 +1,101 @@
+import re
+from typing import Any, List, Optional
+from uuid import uuid4
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.utils.function_calling import convert_to_openai_tool
+from pydantic import Field, PrivateAttr
+
+from src.fakes.latency import InjectedError, LatencyModel, load_fakes_config
+
+
+class ScriptedChatModel(BaseChatModel):
+    """
+    Offline chat model answering from the ``llm.rules`` in fakes.yml.
+
+    The first rule whose regex matches the last human message decides the reply; named
+    groups are substituted into the response. Latency and injected errors follow the
+    ``llm.latency`` model, and every reply carries approximate ``usage_metadata``.
+    """
+
+    model_name: str = "fake-scripted"
+    temperature: float = 0.0
+    rules: List[dict] = Field(default_factory=list)
+    default_response: str = "This is a scripted reply from the offline chat model."
+    latency: dict = Field(default_factory=dict)
+
+    _latency_model: LatencyModel = PrivateAttr()
+    _compiled: list = PrivateAttr()
+
+    def model_post_init(self, __context: Any):
+        self._latency_model = LatencyModel.from_config(self.latency)
+        self._compiled = [(re.compile(rule["match"], re.DOTALL), rule) for rule in self.rules]
+
+    @classmethod
+    def from_config(cls, **overrides) -> "ScriptedChatModel":
+        config = dict(load_fakes_config().get("llm", {}))
+        config.update(overrides)
+        return cls(**config)
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted-fake"
+
+    @property
+    def _identifying_params(self) -> dict:
+        return {"model_name": self.model_name, "temperature": self.temperature}
+
+    def _get_ls_params(self, stop=None, **kwargs):
+        params = super()._get_ls_params(stop=stop, **kwargs)
+        params["ls_provider"] = "fake"
+        params["ls_model_name"] = self.model_name
+        return params
+
+    def bind_tools(self, tools, **kwargs):
+        return self.bind(tools=[convert_to_openai_tool(tool) for tool in tools], **kwargs)
+
+    @staticmethod
+    def _text(message) -> str:
+        return message.content if isinstance(message.content, str) else str(message.content)
+
+    def _reply(self, messages: List[BaseMessage], tools: Optional[list]) -> AIMessage:
+        last = messages[-1] if messages else None
+        bound = {tool["function"]["name"] for tool in tools or []}
+
+        # After a tool result, summarise instead of calling the tool again
+        if not isinstance(last, ToolMessage):
+            prompt = self._text(last) if last is not None else ""
+            for pattern, rule in self._compiled:
+                match = pattern.search(prompt)
+                if not match:
+                    continue
+                tool_call = rule.get("tool_call")
+                if tool_call:
+                    if tool_call["name"] not in bound:
+                        continue
+                    return AIMessage(content="", tool_calls=[{"id": str(uuid4()), "name": tool_call["name"], "args": tool_call.get("args", {})}])
+                return AIMessage(content=rule["response"].format(**match.groupdict()))
+        return AIMessage(content=self.default_response)
+
+    def _result(self, messages: List[BaseMessage], tools: Optional[list]) -> ChatResult:
+        reply = self._reply(messages, tools)
+        input_tokens = sum(len(self._text(m).split()) for m in messages)
+        output_tokens = len(self._text(reply).split()) or 1
+        reply.usage_metadata = {"input_tokens": input_tokens, "output_tokens": output_tokens, "total_tokens": input_tokens + output_tokens}
+        return ChatResult(generations=[ChatGeneration(message=reply)])
+
+    def _generate(self, messages: List[BaseMessage], stop=None, run_manager=None, tools: list = None, **kwargs) -> ChatResult:
+        if self._latency_model.should_fail():
+            raise InjectedError("Scripted chat model: injected provider error")
+        result = self._result(messages, tools)
+        self._latency_model.wait_sync(result.generations[0].message.usage_metadata["output_tokens"])
+        return result
+
+    async def _agenerate(self, messages: List[BaseMessage], stop=None, run_manager=None, tools: list = None, **kwargs) -> ChatResult:
+        if self._latency_model.should_fail():
+            raise InjectedError("Scripted chat model: injected provider error")
+        result = self._result(messages, tools)
+        await self._latency_model.wait(result.generations[0].message.usage_metadata["output_tokens"])
+        return result
@@ -0,0 +1,52 @@
+import asyncio
+import os
+import random
+import time
+
+import yaml
+
+FAKES_CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "config", "fakes.yml")
+
+_CONFIG = None
+
+
+def load_fakes_config() -> dict:
+    """Read src/config/fakes.yml once."""
+    global _CONFIG
+    if _CONFIG is None:
+        with open(FAKES_CONFIG_PATH, "r") as f:
+            _CONFIG = yaml.safe_load(f) or {}
+    return _CONFIG
+
+
+class InjectedError(Exception):
+    """Failure injected by a LatencyModel's error_rate."""
+
+
+class LatencyModel:
+    """Normal(mean_ms, jitter_ms) latency plus per_token_ms, with an error_rate for injected failures."""
+
+    def __init__(self, mean_ms: float = 0, jitter_ms: float = 0, per_token_ms: float = 0, error_rate: float = 0.0, seed: int = None):
+        self.mean_ms = mean_ms
+        self.jitter_ms = jitter_ms
+        self.per_token_ms = per_token_ms
+        self.error_rate = error_rate
+        self._random = random.Random(seed)
+
+    @classmethod
+    def from_config(cls, config: dict = None) -> "LatencyModel":
+        return cls(**(config or {}), seed=load_fakes_config().get("seed"))
+
+    def sample(self, tokens: int = 0) -> float:
+        """Latency in seconds for a call producing ``tokens`` tokens."""
+        ms = self._random.gauss(self.mean_ms, self.jitter_ms) if self.jitter_ms else self.mean_ms
+        return max(0.0, ms + tokens * self.per_token_ms) / 1000
+
+    def should_fail(self) -> bool:
+        return self.error_rate > 0 and self._random.random() < self.error_rate
+
+    async def wait(self, tokens: int = 0):
+        await asyncio.sleep(self.sample(tokens))
+
+    def wait_sync(self, tokens: int = 0):
+        time.sleep(self.sample(tokens))
@@ -0,0 +1,199 @@
+"""
+Local stand-ins for SerpAPI (google_flights, google_hotels), OpenWeather and Tavily.
+
+Responses follow the shape of the real APIs (only the fields the app reads) and are
+generated deterministically from the request parameters. Latency and injected errors
+come from ``upstreams`` in fakes.yml.
+
+Run standalone with ``python -m src.fakes.upstream_server --port 8765`` or in-process
+with ``await start_fake_upstreams()``; point the app at it with FAKE_UPSTREAMS=true.
+"""
+import argparse
+import hashlib
+import random
+from datetime import datetime, timedelta, timezone
+
+from aiohttp import web
+
+from src.fakes.latency import LatencyModel, load_fakes_config
+from src.loggers import Logger
+
+logger = Logger(__name__).get_logger()
+
+AIRLINES = ["IndiGo", "Air India", "Vistara", "SpiceJet", "Akasa Air", "Emirates", "Lufthansa", "Qatar Airways"]
+HOTEL_WORDS = ["Grand", "Residency", "Palace", "Inn", "Suites", "Plaza", "Heritage", "Bay View", "Comfort", "Royal"]
+
+
+def _rng(*parts) -> random.Random:
+    """Random generator seeded by the request, so equal requests get equal results."""
+    seed = hashlib.sha256("|".join(str(p) for p in parts).encode("utf-8")).hexdigest()
+    return random.Random(int(seed[:16], 16))
+
+
+class FakeUpstreams:
+    def __init__(self, config: dict = None):
+        self.config = config or load_fakes_config().get("upstreams", {})
+        self.error_status = self.config.get("error_status", 503)
+        self.latency = {
+            name: LatencyModel.from_config(self.config.get(name, {}).get("latency"))
+            for name in ("serpapi_flights", "serpapi_hotels", "openweather", "tavily")
+        }
+        self.requests = {name: 0 for name in self.latency}
+
+    async def _simulate(self, name: str):
+        """Apply latency; return an error response when an error is injected."""
+        self.requests[name] += 1
+        model = self.latency[name]
+        await model.wait()
+        if model.should_fail():
+            return web.json_response({"error": f"Injected {name} error"}, status=self.error_status)
+        return None
+
+    # ---- SerpAPI -----------------------------------------------------------
+
+    async def serpapi_search(self, request: web.Request):
+        engine = request.query.get("engine")
+        if engine == "google_flights":
+            name, build = "serpapi_flights", self._flights
+        elif engine == "google_hotels":
+            name, build = "serpapi_hotels", self._hotels
+        else:
+            return web.json_response({"error": f"Unsupported engine '{engine}'"}, status=400)
+        error = await self._simulate(name)
+        return error or web.json_response(build(request.query))
+
+    def _flights(self, query) -> dict:
+        origin, destination = query.get("departure_id", "DEL"), query.get("arrival_id", "BOM")
+        outbound = query.get("outbound_date") or datetime.now().date().isoformat()
+        rng = _rng("flights", origin, destination, outbound)
+        flights = []
+        for _ in range(self.config.get("serpapi_flights", {}).get("results", 8)):
+            departure = datetime.fromisoformat(outbound) + timedelta(hours=rng.randint(5, 22), minutes=rng.choice([0, 15, 30, 45]))
+            minutes = rng.randint(70, 600)
+            airline = rng.choice(AIRLINES)
+            flights.append({
+                "flights": [{
+                    "departure_airport": {"name": f"{origin} Airport", "id": origin, "time": departure.strftime("%Y-%m-%d %H:%M")},
+                    "arrival_airport": {"name": f"{destination} Airport", "id": destination, "time": (departure + timedelta(minutes=minutes)).strftime("%Y-%m-%d %H:%M")},
+                    "duration": minutes,
+                    "airline": airline,
+                    "flight_number": f"{airline[:2].upper()} {rng.randint(100, 999)}",
+                }],
+                "total_duration": minutes,
+                "price": rng.randint(3500, 45000),
+                "type": "Round trip",
+            })
+        flights.sort(key=lambda f: f["price"])
+        return {"search_metadata": {"status": "Success"}, "best_flights": flights[:3], "other_flights": flights[3:]}
+
+    def _hotels(self, query) -> dict:
+        city = query.get("q", "City")
+        rng = _rng("hotels", city.lower(), query.get("check_in_date"), query.get("check_out_date"))
+        properties = []
+        for _ in range(self.config.get("serpapi_hotels", {}).get("results", 12)):
+            nightly = rng.randint(1200, 18000)
+            nights = 1
+            try:
+                nights = max(1, (datetime.fromisoformat(query["check_out_date"]) - datetime.fromisoformat(query["check_in_date"])).days)
+            except (KeyError, ValueError):
+                pass
+            name = f"{city.title()} {rng.choice(HOTEL_WORDS)} {rng.choice(HOTEL_WORDS)}"
+            properties.append({
+                "type": "hotel",
+                "name": name,
+                "link": f"https://example.com/hotels/{name.lower().replace(' ', '-')}",
+                "gps_coordinates": {"latitude": round(rng.uniform(-60, 60), 5), "longitude": round(rng.uniform(-150, 150), 5)},
+                "hotel_class": f"{rng.randint(2, 5)}-star hotel",
+                "overall_rating": round(rng.uniform(3.0, 4.9), 1),
+                "reviews": rng.randint(20, 9000),
+                "rate_per_night": {"lowest": f"₹{nightly:,}", "extracted_lowest": nightly},
+                "total_rate": {"lowest": f"₹{nightly * nights:,}", "extracted_lowest": nightly * nights},
+            })
+        return {"search_metadata": {"status": "Success"}, "properties": properties}
+
+    # ---- OpenWeather -------------------------------------------------------
+
+    async def openweather_current(self, request: web.Request):
+        error = await self._simulate("openweather")
+        if error:
+            return error
+        city = request.query.get("q", "Pune")
+        rng = _rng("weather", city.lower(), datetime.now().strftime("%Y-%m-%d %H"))
+        return web.json_response({
+            "name": city.title(),
+            "weather": [{"main": "Clear", "description": "clear sky"}],
+            "main": {"temp": round(rng.uniform(-5, 38), 1), "humidity": rng.randint(20, 95)},
+            "wind": {"speed": round(rng.uniform(0, 12), 1), "deg": rng.randint(0, 359)},
+            "cod": 200,
+        })
+
+    async def openweather_forecast(self, request: web.Request):
+        """5-day / 3-hour forecast: 40 slots starting at the next 3-hour boundary (UTC)."""
+        error = await self._simulate("openweather")
+        if error:
+            return error
+        city = request.query.get("q", "Pune")
+        now = datetime.utcnow().replace(minute=0, second=0, microsecond=0)
+        start = now + timedelta(hours=3 - now.hour % 3)
+        rng = _rng("forecast", city.lower(), start.strftime("%Y-%m-%d %H"))
+        base = rng.uniform(0, 32)
+        slots = []
+        for i in range(40):
+            at = start + timedelta(hours=3 * i)
+            temp = round(base + rng.uniform(-4, 4), 1)
+            condition = rng.choice(["Clear", "Clouds", "Clouds", "Rain"])
+            slots.append({
+                "dt": int(at.replace(tzinfo=timezone.utc).timestamp()),
+                "dt_txt": at.strftime("%Y-%m-%d %H:%M:%S"),
+                "main": {"temp": temp, "temp_min": round(temp - 1, 1), "temp_max": round(temp + 1, 1)},
+                "weather": [{"main": condition, "description": condition.lower()}],
+                "pop": round(rng.uniform(0.4, 1.0) if condition == "Rain" else rng.uniform(0, 0.2), 2),
+            })
+        return web.json_response({"cod": "200", "cnt": len(slots), "list": slots, "city": {"name": city.title(), "timezone": 19800}})
+
+    # ---- Tavily ------------------------------------------------------------
+
+    async def tavily_search(self, request: web.Request):
+        error = await self._simulate("tavily")
+        if error:
+            return error
+        body = await request.json()
+        query = body.get("query", "")
+        rng = _rng("tavily", query.lower())
+        count = min(body.get("max_results", 5), self.config.get("tavily", {}).get("results", 5))
+        results = [
+            {
+                "title": f"{query.title()} - result {i + 1}",
+                "url": f"https://example.com/{'-'.join(query.lower().split()) or 'search'}/{i + 1}",
+                "content": f"Offline stand-in content about {query} ({rng.randint(1, 1000)}).",
+                "score": round(rng.uniform(0.5, 1.0), 3),
+                "published_date": (datetime.now() - timedelta(days=rng.randint(0, 30))).strftime("%a, %d %b %Y %H:%M:%S GMT"),
+            }
+            for i in range(count)
+        ]
+        return web.json_response({"query": query, "answer": f"Offline answer for {query}.", "results": results})
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get("/search", self.serpapi_search)
+        app.router.add_post("/search", self.tavily_search)
+        app.router.add_get("/data/2.5/weather", self.openweather_current)
+        app.router.add_get("/data/2.5/forecast", self.openweather_forecast)
+        return app
+
+
+async def start_fake_upstreams(host: str = "127.0.0.1", port: int = 8765) -> web.AppRunner:
+    """Serve the fake upstreams in the running event loop; ``await runner.cleanup()`` to stop."""
+    runner = web.AppRunner(FakeUpstreams().app())
+    await runner.setup()
+    await web.TCPSite(runner, host, port).start()
+    logger.info(f"Fake upstream APIs listening on http://{host}:{port}")
+    return runner
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve fake SerpAPI / OpenWeather / Tavily endpoints")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+    web.run_app(FakeUpstreams().app(), host=args.host, port=args.port)
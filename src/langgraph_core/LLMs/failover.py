@@ -0,0 +1,205 @@
+import asyncio
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from src.loggers import Logger
+from src.utils.resilience import CircuitBreaker, LatencyTracker
+
+logger = Logger(__name__).get_logger()
+
+# Shared per provider so every composite model sees the same health picture
+_BREAKERS: Dict[str, CircuitBreaker] = {}
+_LATENCIES: Dict[str, LatencyTracker] = {}
+
+
+class Provider:
+    """One link of the failover chain: a chat model client plus its breaker and latency window."""
+
+    def __init__(self, name: str, client, breaker_config: dict = None):
+        breaker_config = breaker_config or {}
+        self.name = name
+        self.client = client
+        self.breaker = _BREAKERS.setdefault(
+            name,
+            CircuitBreaker(
+                name,
+                failure_threshold=breaker_config.get("failure_threshold", 5),
+                reset_timeout=breaker_config.get("reset_timeout", 30),
+            ),
+        )
+        self.latency = _LATENCIES.setdefault(name, LatencyTracker(breaker_config.get("latency_window", 200)))
+
+    def with_client(self, client) -> "Provider":
+        provider = Provider.__new__(Provider)
+        provider.name, provider.client = self.name, client
+        provider.breaker, provider.latency = self.breaker, self.latency
+        return provider
+
+
+class FailoverChatModel:
+    """
+    Composite chat model that tries providers in order.
+
+    Providers whose circuit is open are skipped. With hedging on, when the in-flight
+    provider has not answered by its observed p95 latency, the next provider gets a
+    duplicate request and whichever answers first wins; the loser is cancelled.
+    Exposes the ``ainvoke`` / ``invoke`` / ``bind_tools`` surface the nodes use.
+    """
+
+    def __init__(self, providers: List[Provider], hedge_config: dict = None):
+        if not providers:
+            raise ValueError("FailoverChatModel needs at least one provider")
+        hedge_config = hedge_config or {}
+        self.providers = providers
+        self.hedge = hedge_config.get("enabled", True)
+        self.hedge_percentile = hedge_config.get("percentile", 95)
+        self.hedge_min_samples = hedge_config.get("min_samples", 20)
+        self.hedge_initial_delay = hedge_config.get("initial_delay_seconds", 8.0)
+        self.hedge_min_delay = hedge_config.get("min_delay_seconds", 0.5)
+        self._hedge_config = hedge_config
+
+    # Attributes read by the response cache key and logs follow the primary provider
+    @property
+    def model_name(self):
+        client = self.providers[0].client
+        return getattr(client, "model_name", None) or getattr(client, "model", None)
+
+    @property
+    def temperature(self):
+        return getattr(self.providers[0].client, "temperature", None)
+
+    def bind_tools(self, tools, **kwargs) -> "FailoverChatModel":
+        bound = [p.with_client(p.client.bind_tools(tools, **kwargs)) for p in self.providers]
+        return FailoverChatModel(bound, self._hedge_config)
+
+    def _candidates(self) -> Iterator[Tuple[Provider, bool]]:
+        """
+        Providers in chain order, each with whether its breaker admitted this request.
+
+        ``allow()`` is asked lazily, right before a provider is called, so a request never
+        claims a half-open trial slot for a provider it does not reach.
+        """
+        admitted_any = False
+        for provider in self.providers:
+            if provider.breaker.allow():
+                admitted_any = True
+                yield provider, True
+        if not admitted_any:
+            # Everything is open: still try the chain rather than failing outright
+            logger.warning("All LLM provider circuits are open, trying the full chain")
+            for provider in self.providers:
+                yield provider, False
+
+    def _hedge_delay(self, provider: Provider) -> float:
+        if len(provider.latency) < self.hedge_min_samples:
+            return self.hedge_initial_delay
+        return max(provider.latency.percentile(self.hedge_percentile), self.hedge_min_delay)
+
+    @staticmethod
+    def _record_outcome(provider: Provider, admitted: bool, started: float, error: Optional[Exception] = None):
+        """Latency sample and breaker outcome of one finished call (breaker only if this request was admitted)."""
+        if error is None or _is_timeout(error):
+            # A timed-out call is a censored sample: it took at least this long
+            provider.latency.record(time.monotonic() - started)
+        if not admitted:
+            return
+        if error is None:
+            provider.breaker.record_success()
+        else:
+            provider.breaker.record_failure()
+
+    @classmethod
+    async def _call(cls, provider: Provider, admitted: bool, input, config, kwargs):
+        # Cancellation (a hedged loser) is accounted for by ainvoke, which knows when it happened
+        started = time.monotonic()
+        try:
+            result = await provider.client.ainvoke(input, config, **kwargs)
+        except Exception as e:
+            cls._record_outcome(provider, admitted, started, e)
+            logger.warning(f"LLM provider {provider.name} failed: {e}")
+            raise
+        cls._record_outcome(provider, admitted, started)
+        return result
+
+    async def ainvoke(self, input, config=None, **kwargs):
+        candidates = self._candidates()
+        pending: Dict[asyncio.Task, Tuple[Provider, bool, float]] = {}
+        exhausted = False
+        last_error: Optional[Exception] = None
+
+        def launch() -> Optional[Provider]:
+            nonlocal exhausted
+            candidate = next(candidates, None)
+            if candidate is None:
+                exhausted = True
+                return None
+            provider, admitted = candidate
+            task = asyncio.create_task(self._call(provider, admitted, input, config, kwargs))
+            pending[task] = (provider, admitted, time.monotonic())
+            return provider
+
+        primary = launch()
+        try:
+            while pending:
+                timeout = None
+                if self.hedge and len(pending) == 1 and not exhausted:
+                    provider, _, started = next(iter(pending.values()))
+                    timeout = max(0.0, self._hedge_delay(provider) - (time.monotonic() - started))
+
+                done, _ = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    hedge = launch()
+                    if hedge is not None:
+                        logger.info(f"Hedging LLM request to {hedge.name} after {timeout:.2f}s")
+                    continue
+
+                for task in done:
+                    provider, _, _ = pending.pop(task)
+                    if task.exception() is None:
+                        if provider is not primary:
+                            logger.info(f"LLM request served by fallback provider {provider.name}")
+                        return task.result()
+                    last_error = task.exception()
+
+                if not pending:
+                    launch()
+        finally:
+            for task, (provider, admitted, started) in pending.items():
+                if task.done():
+                    continue
+                task.cancel()
+                # Censored sample at the cancellation point, so hedged losers still count
+                provider.latency.record(time.monotonic() - started)
+                if admitted:
+                    provider.breaker.release()
+
+        raise last_error
+
+    def invoke(self, input, config=None, **kwargs):
+        """Sequential failover for synchronous callers (no hedging)."""
+        last_error: Optional[Exception] = None
+        for provider, admitted in self._candidates():
+            started = time.monotonic()
+            try:
+                result = provider.client.invoke(input, config, **kwargs)
+            except Exception as e:
+                self._record_outcome(provider, admitted, started, e)
+                logger.warning(f"LLM provider {provider.name} failed: {e}")
+                last_error = e
+                continue
+            self._record_outcome(provider, admitted, started)
+            return result
+        raise last_error
+
+
+def _is_timeout(error: Exception) -> bool:
+    """asyncio/httpx/SDK timeouts (e.g. APITimeoutError) by type, without importing every client."""
+    return isinstance(error, TimeoutError) or any("Timeout" in cls.__name__ for cls in type(error).__mro__)
+
+
+def provider_health() -> dict:
+    """Breaker state and latency percentiles for every provider seen so far."""
+    return {
+        name: {**breaker.snapshot(), **_LATENCIES[name].snapshot()}
+        for name, breaker in _BREAKERS.items()
+    }
@@ -0,0 +1,163 @@
+import asyncio
+import importlib.util
+import time
+from collections import defaultdict
+
+import httpx
+
+from src.loggers import Logger
+from src.utils.Utilities import load_llm_config
+
+logger = Logger(__name__).get_logger()
+
+
+class LLMHttpClients:
+    """
+    Process-wide httpx clients shared by every LLM provider client.
+
+    Connection limits, keep-alive, HTTP/2 and the hosts to pre-warm come from
+    ``http_pool`` in llm_configs.yml. Groq/DeepSeek and OpenAI clients accept these
+    through ``http_client`` / ``http_async_client``; Gemini talks gRPC and keeps its own
+    channel. A per-request trace hook counts new TCP connections and TLS handshakes
+    so pool reuse shows up in ``metrics()``.
+    """
+
+    def __init__(self):
+        self._config = None
+        self._async_client = None
+        self._sync_client = None
+        self.requests = defaultdict(int)
+        self.connections = defaultdict(int)
+        self.tls_handshakes = defaultdict(int)
+        self.tls_seconds = defaultdict(float)
+        self.errors = defaultdict(int)
+
+    @property
+    def config(self) -> dict:
+        if self._config is None:
+            try:
+                self._config = load_llm_config("http_pool") or {}
+            except Exception as e:
+                logger.warning(f"No http_pool config, using httpx defaults: {e}")
+                self._config = {}
+        return self._config
+
+    def _limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.config.get("max_connections", 100),
+            max_keepalive_connections=self.config.get("max_keepalive_connections", 20),
+            keepalive_expiry=self.config.get("keepalive_expiry", 60),
+        )
+
+    def _timeout(self) -> httpx.Timeout:
+        return httpx.Timeout(
+            self.config.get("read_timeout", 60),
+            connect=self.config.get("connect_timeout", 5),
+            pool=self.config.get("pool_timeout", 10),
+        )
+
+    def _http2(self) -> bool:
+        if not self.config.get("http2", True):
+            return False
+        if importlib.util.find_spec("h2") is None:
+            logger.warning("http2 enabled but the 'h2' package is not installed, using HTTP/1.1")
+            return False
+        return True
+
+    # ---- trace hooks -------------------------------------------------------
+
+    def _trace_for(self, host: str):
+        """httpcore trace callback for one request; only fires on work a reused connection skips."""
+        started = {}
+
+        def record(event: str, info: dict):
+            if event == "connection.connect_tcp.complete":
+                self.connections[host] += 1
+            elif event == "connection.start_tls.started":
+                started["tls"] = time.perf_counter()
+            elif event == "connection.start_tls.complete":
+                self.tls_handshakes[host] += 1
+                if "tls" in started:
+                    self.tls_seconds[host] += time.perf_counter() - started.pop("tls")
+
+        return record
+
+    def _on_request(self, request: httpx.Request):
+        host = request.url.host
+        self.requests[host] += 1
+        request.extensions["trace"] = self._trace_for(host)
+
+    async def _on_request_async(self, request: httpx.Request):
+        sync_trace = self._trace_for(request.url.host)
+        self.requests[request.url.host] += 1
+
+        async def trace(event: str, info: dict):
+            sync_trace(event, info)
+
+        request.extensions["trace"] = trace
+
+    def _on_response(self, response: httpx.Response):
+        if response.status_code >= 500 or response.status_code == 429:
+            self.errors[response.request.url.host] += 1
+
+    async def _on_response_async(self, response: httpx.Response):
+        self._on_response(response)
+
+    # ---- clients -----------------------------------------------------------
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                limits=self._limits(),
+                timeout=self._timeout(),
+                http2=self._http2(),
+                event_hooks={"request": [self._on_request_async], "response": [self._on_response_async]},
+            )
+        return self._async_client
+
+    @property
+    def sync_client(self) -> httpx.Client:
+        if self._sync_client is None:
+            self._sync_client = httpx.Client(
+                limits=self._limits(),
+                timeout=self._timeout(),
+                http2=self._http2(),
+                event_hooks={"request": [self._on_request], "response": [self._on_response]},
+            )
+        return self._sync_client
+
+    async def prewarm(self):
+        """Open (and TLS-handshake) a pooled connection to every host in ``http_pool.prewarm``."""
+
+        async def warm(url: str):
+            try:
+                await self.async_client.head(url, timeout=self.config.get("connect_timeout", 5))
+                logger.info(f"Pre-warmed LLM connection to {url}")
+            except httpx.HTTPError as e:
+                logger.warning(f"Could not pre-warm connection to {url}: {e}")
+
+        await asyncio.gather(*(warm(url) for url in self.config.get("prewarm", [])))
+
+    async def aclose(self):
+        if self._async_client is not None:
+            await self._async_client.aclose()
+        if self._sync_client is not None:
+            self._sync_client.close()
+
+    def metrics(self) -> dict:
+        """Requests, new connections, TLS handshakes and upstream errors per host."""
+        return {
+            host: {
+                "requests": self.requests[host],
+                "new_connections": self.connections[host],
+                "tls_handshakes": self.tls_handshakes[host],
+                "tls_seconds": round(self.tls_seconds[host], 4),
+                "errors": self.errors[host],
+            }
+            for host in self.requests
+        }
+
+
+# Global instance shared by all LLM clients
+llm_http = LLMHttpClients()
@@ -4,7 +4,12 @@ from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_groq import ChatGroq
 from langchain_openai import ChatOpenAI
 
+from src.cache.usage_tracker import usage_handler
+from src.config.settings import settings
 from src.exceptions import ExceptionError
+from src.fakes.fake_llm import ScriptedChatModel
+from src.langgraph_core.LLMs.failover import FailoverChatModel, Provider
+from src.langgraph_core.LLMs.http_clients import llm_http
 from src.loggers import logging
 from src.utils.Utilities import get_api_key, load_llm_config
 
@@ -22,18 +27,46 @@ class LoadLLMs:
         self.openai_config = load_llm_config("openai")
         self.deppseek_config = load_llm_config("deepseek")
 
+        # one client per model profile / failover chain entry, built on first use
+        self._profile_clients = {}
+        self._chain_clients = {}
+        self.failover_config = self._load_failover_config()
+
+    @staticmethod
+    def _load_failover_config() -> dict:
+        try:
+            return load_llm_config("failover") or {}
+        except Exception as e:
+            logging.warning(f"No failover config, using a single provider: {e}")
+            return {}
+
+    def _build_client(self, provider: str, config: dict):
+        """Build a chat model client for ``provider`` ("groq", "gemini", "openai", "deepseek")."""
+        common = {
+            "model": config["model_name"],
+            "temperature": config["temperature"],
+            "max_tokens": config["max_tokens"],
+            "timeout": config["timeout"],
+            "max_retries": config["max_retries"],
+            "callbacks": [usage_handler],  # token / cost accounting
+        }
+        if settings.FAKE_LLM:
+            return ScriptedChatModel.from_config(temperature=config["temperature"], callbacks=[usage_handler])
+        # Shared keep-alive pools (see http_clients.py); Gemini uses gRPC and manages its own channel
+        pooled = {"http_client": llm_http.sync_client, "http_async_client": llm_http.async_client}
+        if provider in ("groq", "deepseek"):  # deepseek models are served through Groq
+            return ChatGroq(api_key=self.groq_key, **pooled, **common)
+        if provider == "gemini":
+            return ChatGoogleGenerativeAI(**common)
+        if provider == "openai":
+            return ChatOpenAI(api_key=self.openai_key, **pooled, **common)
+        raise ValueError(f"Unknown LLM provider '{provider}'")
+
     def load_groq_model(self):
         try:
             logging.info("Loading Groq model...")
-            groq_llm = ChatGroq(
-                api_key=self.groq_key,
-                model=self.groq_config["model_name"],
-                temperature=self.groq_config["temperature"],
-                max_tokens=self.groq_config["max_tokens"],
-                timeout=self.groq_config["timeout"],
-                max_retries=self.groq_config["max_retries"],
-            )
-            logging.info(f"Groq model loaded successfully and mode is {self.groq_config["model_name"]} ")
+            groq_llm = self._build_client("groq", self.groq_config)
+            logging.info(f"Groq model loaded successfully and mode is {self.groq_config['model_name']} ")
             return groq_llm
         except Exception as e:
             raise ExceptionError(e, sys)
@@ -41,14 +74,8 @@ class LoadLLMs:
     def load_gemini_model(self):
         try:
             logging.info("Loading Gemini model...")
-            gemini_llm = ChatGoogleGenerativeAI(
-                model=self.gemini_config["model_name"],
-                temperature=self.gemini_config["temperature"],
-                max_tokens=self.gemini_config["max_tokens"],
-                timeout=self.gemini_config["timeout"],
-                max_retries=self.gemini_config["max_retries"],
-            )
-            logging.info(f"Gemini LLM loaded successfully  and model is {self.gemini_config["model_name"]}")
+            gemini_llm = self._build_client("gemini", self.gemini_config)
+            logging.info(f"Gemini LLM loaded successfully  and model is {self.gemini_config['model_name']}")
             return gemini_llm
         except Exception as e:
             raise ExceptionError(e, sys)
@@ -56,14 +83,7 @@ class LoadLLMs:
     def load_openai_model(self):
         try:
             logging.info("Loading OpenAI model...")
-            openai_llm = ChatOpenAI(
-                api_key=self.openai_key,
-                model=self.openai_config["model_name"],
-                temperature=self.openai_config["temperature"],
-                max_tokens=self.openai_config["max_tokens"],
-                timeout=self.openai_config["timeout"],
-                max_retries=self.openai_config["max_retries"],
-            )
+            openai_llm = self._build_client("openai", self.openai_config)
             logging.info(f"OpenAI LLM loaded successfully and model is {self.openai_config['model_name']}")
             return openai_llm
         except Exception as e:
@@ -72,16 +92,70 @@ class LoadLLMs:
     def load_deppseek_model(self):
         try:
             logging.info("Loading Deepseek model...")
-            deepseek_llm = ChatGroq(
-                api_key=self.groq_key,
-                model=self.deppseek_config["model_name"],
-                temperature=self.deppseek_config["temperature"],
-                max_tokens=self.deppseek_config["max_tokens"],
-                timeout=self.deppseek_config["timeout"],
-                max_retries=self.deppseek_config["max_retries"],
-            )
+            deepseek_llm = self._build_client("deepseek", self.deppseek_config)
             logging.info(f"Deepseek LLM loaded successfully and model is {self.deppseek_config['model_name']}")
             return deepseek_llm
 
         except Exception as e:
             raise ExceptionError(e, sys)
+
+    def load_profile(self, profile_name: str):
+        """Return the (cached) client for a model profile from ``profiles`` in llm_configs.yml."""
+        if profile_name in self._profile_clients:
+            return self._profile_clients[profile_name]
+        try:
+            profiles = load_llm_config("profiles")
+            if profile_name not in profiles:
+                raise ValueError(f"Model profile '{profile_name}' not found in config file.")
+            profile = profiles[profile_name]
+
+            logging.info(f"Loading model profile {profile_name}: {profile['provider']}/{profile['model_name']}")
+            client = self._build_client(profile["provider"], profile)
+            if self.failover_config.get("enabled"):
+                client = self.load_failover_model(client, f"{profile['provider']}/{profile['model_name']}")
+            self._profile_clients[profile_name] = client
+            return client
+        except Exception as e:
+            raise ExceptionError(e)
+
+    def load_node_llms(self) -> dict:
+        """
+        Map every TravelPlannerNode call site to its client, following ``node_models``
+        in llm_configs.yml. Call sites sharing a profile share one client. The
+        ``over_budget`` entry maps call sites to their downgraded clients.
+        """
+        node_models = dict(load_llm_config("node_models"))
+        downgrades = node_models.pop("over_budget", None) or {}
+        node_llms = {call_site: self.load_profile(profile_name) for call_site, profile_name in node_models.items()}
+        node_llms["over_budget"] = {call_site: self.load_profile(profile_name) for call_site, profile_name in downgrades.items()}
+        return node_llms
+
+    def _chain_client(self, provider: str):
+        if provider not in self._chain_clients:
+            self._chain_clients[provider] = self._build_client(provider, load_llm_config(provider))
+        return self._chain_clients[provider]
+
+    def load_failover_model(self, primary=None, primary_name: str = None):
+        """
+        Composite model over ``failover.chain`` in llm_configs.yml: ``primary`` (if given)
+        first, then every chain provider serving a different model, each behind its own
+        circuit breaker, with optional hedging at the observed p95.
+        """
+        try:
+            chain = self.failover_config.get("chain", ["groq"])
+            if not self.failover_config.get("enabled"):
+                return primary or self._chain_client(chain[0])
+
+            breaker_config = self.failover_config.get("breaker", {})
+            providers = []
+            if primary is not None:
+                providers.append(Provider(primary_name, primary, breaker_config))
+            for provider in chain:
+                name = f"{provider}/{load_llm_config(provider)['model_name']}"
+                if name not in [p.name for p in providers]:
+                    providers.append(Provider(name, self._chain_client(provider), breaker_config))
+
+            logging.info(f"Failover chain loaded: {[p.name for p in providers]}")
+            return FailoverChatModel(providers, self.failover_config.get("hedge"))
+        except Exception as e:
+            raise ExceptionError(e)
@@ -1,17 +1,17 @@
 from langgraph.graph import END, START, StateGraph
-from langgraph.prebuilt import ToolNode
 
+from src.config.settings import settings
 from src.langgraph_core.nodes.travel_planner_nodes import TravelPlannerNode
 from src.langgraph_core.state.travel_planner_states import TravelPlannerState
 from src.langgraph_core.tools.custom_tools import weather_tool
-from src.langgraph_core.tools.tools import create_tool_node, get_tools
+from src.langgraph_core.tools.tools import get_tools
 
 
 class TravelGraphBuilder:
-    def __init__(self, llm):
+    def __init__(self, llm, node_llms: dict = None):
         self.llm = llm
         self.graph_builder = StateGraph(TravelPlannerState)
-        self.travel_planner_node = TravelPlannerNode(self.llm)
+        self.travel_planner_node = TravelPlannerNode(self.llm, node_llms)
 
     def _add_nodes(self) -> None:
         """Register all nodes in the graph."""
@@ -19,12 +19,10 @@ class TravelGraphBuilder:
         self.graph_builder.add_node("chat_node", self.travel_planner_node.chat_node)
 
         # Tool nodes
-        weather_node = ToolNode(tools=[weather_tool])
-        self.graph_builder.add_node("weather_node", weather_node)
-
-        tools = get_tools()
-        search_node = create_tool_node(tools)
-        self.graph_builder.add_node("search_node", search_node)
+        tool_nodes = self.travel_planner_node.tool_nodes
+        self.graph_builder.add_node("weather_node", tool_nodes[weather_tool.name])
+        self.graph_builder.add_node("search_node", tool_nodes[get_tools()[0].name])
+        self.graph_builder.add_node("multi_tool_node", self.travel_planner_node.multi_tool_node)
 
         # Travel planning nodes
         self.graph_builder.add_node("travel_node", self.travel_planner_node.travel_node)
@@ -32,6 +30,7 @@ class TravelGraphBuilder:
         self.graph_builder.add_node("process_travel_confirmation_node", self.travel_planner_node.process_travel_confirmation)
         self.graph_builder.add_node("flight_search_node", self.travel_planner_node.flight_search_node)
         self.graph_builder.add_node("flight_selection_node", self.travel_planner_node.flight_selection_node)
+        self.graph_builder.add_node("hotel_prefetch_node", self.travel_planner_node.hotel_prefetch_node)
         self.graph_builder.add_node("hotel_search_node", self.travel_planner_node.hotel_search_node)
         self.graph_builder.add_node("hotel_selection_node", self.travel_planner_node.hotel_selection_node)
         self.graph_builder.add_node("collect_hotel_info_node", self.travel_planner_node.collect_hotel_info_node)
@@ -57,6 +56,7 @@ class TravelGraphBuilder:
                 "travel": "travel_node",
                 "weather": "weather_node",
                 "search": "search_node",
+                "tools": "multi_tool_node",  # Weather and search in one message
                 "chat": "chat_node",
             },
         )
@@ -64,10 +64,11 @@ class TravelGraphBuilder:
         # Travel flow
         self.graph_builder.add_conditional_edges(
             "travel_node",
-            lambda state: state.get("route", "chat"),
+            self._route_with_hotel_prefetch,
             {
                 "collect_missing_travel_info_node": "collect_missing_travel_info_node",
                 "flight_search_node": "flight_search_node",
+                "hotel_prefetch_node": "hotel_prefetch_node",  # Runs alongside flight search
                 "chat": "chat_node",
             },
         )
@@ -85,9 +86,10 @@ class TravelGraphBuilder:
         # Travel confirmation flow
         self.graph_builder.add_conditional_edges(
             "process_travel_confirmation_node",
-            lambda state: state.get("route", "END"),
+            self._route_with_hotel_prefetch,
             {
                 "flight_search_node": "flight_search_node",  # After user confirms
+                "hotel_prefetch_node": "hotel_prefetch_node",  # Runs alongside flight search
                 "chat_node": "chat_node",  # If user says no
                 "END": END,
             },
@@ -109,6 +111,7 @@ class TravelGraphBuilder:
             lambda state: state.get("route", "END"),
             {
                 "hotel_search_node": "hotel_search_node",  # After flight selection
+                "flight_search_node": "flight_search_node",  # Shown options were refreshed away
                 "END": END,
             },
         )
@@ -141,6 +144,7 @@ class TravelGraphBuilder:
             {
                 "generate_itinerary_node": "generate_itinerary_node",
                 "hotel_selection_node": "hotel_selection_node",  # Self-loop for invalid selections
+                "hotel_search_node": "hotel_search_node",  # Shown options were refreshed away
                 "END": END,  # Valid selection completes the flow
             },
         )
@@ -149,12 +153,23 @@ class TravelGraphBuilder:
         self.graph_builder.add_edge("chat_node", END)
         self.graph_builder.add_edge("weather_node", END)
         self.graph_builder.add_edge("search_node", END)
+        self.graph_builder.add_edge("multi_tool_node", END)
         self.graph_builder.add_edge("generate_itinerary_node", END)
-
-    def build(self):
-        """Build and compile the travel planner graph."""
+        self.graph_builder.add_edge("hotel_prefetch_node", END)
+
+    @staticmethod
+    def _route_with_hotel_prefetch(state):
+        """Fan out to the hotel prefetch branch whenever the flight search starts."""
+        route = state.get("route", "END")
+        if route == "flight_search_node" and settings.HOTEL_PREFETCH_ENABLED:
+            return ["flight_search_node", "hotel_prefetch_node"]
+        return route
+
+    def build(self, draw: bool = True):
+        """Build and compile the travel planner graph (``draw=False`` skips the mermaid render, which needs network)."""
         self._add_nodes()
         self._add_edges()
         compiled_graph = self.graph_builder.compile()
-        compiled_graph.get_graph().draw_mermaid_png(output_file_path=r"./logs/travel_routing_3.png")
+        if draw:
+            compiled_graph.get_graph().draw_mermaid_png(output_file_path=r"./logs/travel_routing_3.png")
         return compiled_graph
@@ -1,18 +1,73 @@
+import asyncio
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
 from langchain_core.prompts import ChatPromptTemplate
-from tavily import TavilyClient
+from tavily import AsyncTavilyClient
+
+from src.loggers import Logger
+from src.utils.Utilities import load_llm_config
+
+logger = Logger(__name__).get_logger()
+
+SUMMARY_FORMAT = """Summarize AI news articles into markdown format. For each item include:
+            - Date in **YYYY-MM-DD** format in IST timezone
+            - Concise sentences summary from latest news
+            - Sort news by date wise (latest first)
+            - Source URL as link
+            Use format:
+            ### [Date]
+            - [Summary](URL)"""
+
+MAP_PROMPT = ChatPromptTemplate.from_messages([("system", SUMMARY_FORMAT), ("user", "Articles:\n{articles}")])
+
+REDUCE_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        (
+            "system",
+            """Merge these partial AI news summaries into one markdown summary.
+            - Keep the same format: ### [Date] headings, latest date first
+            - Put items from the same date under one heading
+            - Drop items that report the same story twice, keeping one link
+            - Keep every Source URL link unchanged""",
+        ),
+        ("user", "Partial summaries:\n{summaries}"),
+    ]
+)
+
+
+def normalize_url(url: str) -> str:
+    """Key for deduplication: scheme, "www.", fragment, tracking params and trailing slash dropped."""
+    parts = urlsplit((url or "").strip())
+    host = parts.netloc.lower().removeprefix("www.")
+    query = urlencode([(k, v) for k, v in parse_qsl(parts.query) if not k.lower().startswith("utm_")])
+    return urlunsplit(("", host, parts.path.rstrip("/"), query, ""))
 
 
 class AINewsNode:
+    """
+    Fetch -> summarize -> save pipeline for the AI news digest.
+
+    ``fetch_news`` runs one Tavily news search per query in ``ai_news.queries`` (India and
+    global) concurrently and deduplicates the articles by URL. ``summarize_news`` is a
+    map-reduce: articles are summarized in chunks of ``chunk_size`` in parallel, then the
+    partial summaries are merged ``reduce_fan_in`` at a time until one remains, so weekly
+    and monthly runs never need one prompt holding every article.
+    """
+
     def __init__(self, llm):
         """
-        Initialize the AINewsNode with API keys for Tavily and GROQ.
+        Initialize the AINewsNode with the async Tavily client and the summarizing LLM.
         """
-        self.tavily = TavilyClient()
+        self.tavily = AsyncTavilyClient()
         self.llm = llm
-        # this is used to capture various steps in this file so that later can be use for steps shown
-        self.state = {}
-
-    def fetch_news(self, state: dict) -> dict:
+        # Run data lives in the graph state only: the node is shared by concurrent runs
+        try:
+            self.config = load_llm_config("ai_news") or {}
+        except Exception as e:
+            logger.warning(f"No ai_news config, using defaults: {e}")
+            self.config = {}
+
+    async def fetch_news(self, state: dict) -> dict:
         """
         Fetch AI news based on the specified frequency.
 
@@ -24,27 +79,60 @@ class AINewsNode:
         """
 
         frequency = state["messages"][0].content.lower()
-        self.state["frequency"] = frequency
         time_range_map = {"daily": "d", "weekly": "w", "monthly": "m", "year": "y"}
         days_map = {"daily": 1, "weekly": 7, "monthly": 30, "year": 366}
-
-        response = self.tavily.search(
-            query="Top Artificial Intelligence (AI) technology news India and globally",
-            topic="news",
-            time_range=time_range_map[frequency],
-            include_answer="advanced",
-            max_results=20,
-            days=days_map[frequency],
-            # include_domains=["techcrunch.com", "venturebeat.com/ai", ...]  # Uncomment and add domains if needed
+        queries = self.config.get("queries", ["Top Artificial Intelligence (AI) technology news India and globally"])
+
+        responses = await asyncio.gather(
+            *(
+                self.tavily.search(
+                    query=query,
+                    topic="news",
+                    time_range=time_range_map[frequency],
+                    include_answer="advanced",
+                    max_results=self.config.get("max_results", 20),
+                    days=days_map[frequency],
+                    # include_domains=["techcrunch.com", "venturebeat.com/ai", ...]  # Uncomment and add domains if needed
+                )
+                for query in queries
+            ),
+            return_exceptions=True,
         )
 
-        state["news_data"] = response.get("results", [])
-        self.state["news_data"] = state["news_data"]
-        return state
-
-    def summarize_news(self, state: dict) -> dict:
+        news_data, seen = [], set()
+        for query, response in zip(queries, responses):
+            if isinstance(response, Exception):
+                logger.warning(f"News search failed for '{query}': {response}")
+                continue
+            for item in response.get("results", []):
+                url = normalize_url(item.get("url", ""))
+                if url and url not in seen:
+                    seen.add(url)
+                    news_data.append(item)
+
+        if len(news_data) == 0 and all(isinstance(response, Exception) for response in responses):
+            raise responses[0]
+        logger.info(f"Fetched {len(news_data)} unique articles from {len(queries)} queries")
+
+        return {"frequency": frequency, "news_data": news_data}
+
+    async def _summarize_chunk(self, semaphore: asyncio.Semaphore, items: list) -> str:
+        articles_str = "\n\n".join([f"Content: {item.get('content', '')}\nURL: {item.get('url', '')}\nDate: {item.get('published_date', '')}" for item in items])
+        async with semaphore:
+            response = await self.llm.ainvoke(MAP_PROMPT.format(articles=articles_str))
+        return response.content
+
+    async def _merge(self, semaphore: asyncio.Semaphore, summaries: list) -> str:
+        async with semaphore:
+            response = await self.llm.ainvoke(REDUCE_PROMPT.format(summaries="\n\n---\n\n".join(summaries)))
+        return response.content
+
+    async def _merge_group(self, semaphore: asyncio.Semaphore, summaries: list) -> str:
+        return summaries[0] if len(summaries) == 1 else await self._merge(semaphore, summaries)
+
+    async def summarize_news(self, state: dict) -> dict:
         """
-        Summarize the fetched news using an LLM.
+        Summarize the fetched news using an LLM (map-reduce over article chunks).
 
         Args:
             state (dict): The state dictionary containing 'news_data'.
@@ -53,38 +141,31 @@ class AINewsNode:
             dict: Updated state with 'summary' key containing the summarized news.
         """
 
-        news_items = self.state["news_data"]
+        news_items = state.get("news_data") or []
+        if not news_items:
+            return {"summary": "No AI news found for this period."}
 
-        prompt_template = ChatPromptTemplate.from_messages(
-            [
-                (
-                    "system",
-                    """Summarize AI news articles into markdown format. For each item include:
-            - Date in **YYYY-MM-DD** format in IST timezone
-            - Concise sentences summary from latest news
-            - Sort news by date wise (latest first)
-            - Source URL as link
-            Use format:
-            ### [Date]
-            - [Summary](URL)""",
-                ),
-                ("user", "Articles:\n{articles}"),
-            ]
-        )
+        semaphore = asyncio.Semaphore(self.config.get("max_concurrency", 4))
+        chunk_size = self.config.get("chunk_size", 8)
+        fan_in = max(2, self.config.get("reduce_fan_in", 4))
+
+        # Map: summarize each chunk of articles in parallel
+        chunks = [news_items[i : i + chunk_size] for i in range(0, len(news_items), chunk_size)]
+        summaries = await asyncio.gather(*(self._summarize_chunk(semaphore, chunk) for chunk in chunks))
 
-        articles_str = "\n\n".join([f"Content: {item.get('content', '')}\nURL: {item.get('url', '')}\nDate: {item.get('published_date', '')}" for item in news_items])
+        # Reduce: merge partial summaries a few at a time until one is left
+        while len(summaries) > 1:
+            groups = [summaries[i : i + fan_in] for i in range(0, len(summaries), fan_in)]
+            summaries = await asyncio.gather(*(self._merge_group(semaphore, group) for group in groups))
+        logger.info(f"Summarized {len(news_items)} articles in {len(chunks)} chunks")
 
-        response = self.llm.invoke(prompt_template.format(articles=articles_str))
-        state["summary"] = response.content
-        self.state["summary"] = state["summary"]
-        return self.state
+        return {"summary": summaries[0]}
 
     def save_result(self, state):
-        frequency = self.state["frequency"]
-        summary = self.state["summary"]
+        frequency = state["frequency"]
+        summary = state["summary"]
         filename = f"./AINews/{frequency}_summary.md"
         with open(filename, "w") as f:
             f.write(f"# {frequency.capitalize()} AI News Summary\n\n")
             f.write(summary)
-        self.state["filename"] = filename
-        return self.state
+        return {"filename": filename}
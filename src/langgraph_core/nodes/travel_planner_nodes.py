@@ -1,9 +1,15 @@
 import json
-from datetime import datetime
+import math
+import time
+from datetime import date, datetime, timedelta
 from uuid import uuid4
 import asyncio
+from collections import OrderedDict
 
 from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.runnables import RunnableConfig
+from langgraph.prebuilt import ToolNode
+from langgraph.config import get_stream_writer
 
 from src.langgraph_core.state.travel_planner_states import TravelPlannerState
 from src.langgraph_core.tools.custom_tools import (
@@ -11,32 +17,106 @@ from src.langgraph_core.tools.custom_tools import (
     search_hotels,
     weather_tool,
 )
-from src.langgraph_core.tools.tools import get_tools
+from src.langgraph_core.tools.tools import create_tool_node, get_tools
+from src.langgraph_core.tools.weather_service import format_forecast, weather_service
 from src.loggers import Logger
-from src.utils.Utilities import TravelInfo
+from src.utils.Utilities import TravelInfo, load_llm_config
+from src.utils.date_parser import parse_trip_dates
+from src.utils.result_store import FLIGHT_RANKINGS, HOTEL_RANKINGS, ResultTable, flight_table, hotel_table, parse_amount
+from src.utils.background import background_tasks
+from src.cache.llm_cache import llm_cache
+from src.cache.usage_tracker import over_budget
 from src.cache.redis_client import redis_client
+from src.cache.single_flight import single_flight
+from src.cache.cache_keys import cache_stats, canonical_city, flight_search_key, hotel_search_key, iso_date
+from src.config.settings import settings
+from src.exceptions import UpstreamUnavailableError
 
 logger = Logger(__name__).get_logger()
 
 
+# Replies that ask for the next page of flight / hotel options
+MORE_REPLIES = {"more", "next", "show more", "more options", "see more"}
+
+# Response-cache prompt types and the node_models call site that serves them
+PROMPT_CALL_SITES = {
+    "weather_city": "router_extraction",
+    "search_query": "router_extraction",
+    "destination_check": "country_check",
+    "city_suggestion": "country_check",
+    "iata": "iata",
+}
+
+
+def _is_iata_json(text: str) -> bool:
+    try:
+        data = json.loads(text)
+    except ValueError:
+        return False
+    return isinstance(data, dict) and bool(data.get("source_iata")) and bool(data.get("destination_iata"))
+
+
+def _is_short_name(text: str) -> bool:
+    return "\n" not in text.strip() and len(text.split()) <= 5
+
+
+# Replies worth caching per prompt type (anything else is used once and not replayed)
+PROMPT_VALIDATORS = {
+    "iata": _is_iata_json,
+    "destination_check": lambda text: text.strip().strip("\"'.").lower() in ("country", "city"),
+    "city_suggestion": _is_short_name,
+    "weather_city": _is_short_name,
+}
+
+
 class TravelPlannerNode:
-    def __init__(self, llm):
+    def __init__(self, llm, node_llms: dict = None):
         self.llm = llm
+        # Per call site clients from node_models in llm_configs.yml; self.llm is the fallback
+        self.node_llms = node_llms or {}
         self.weather_tool_name = weather_tool.name
         self.search_tool_name = get_tools()[0].name
+        # One ToolNode per tool family, shared by the single-tool graph nodes and multi_tool_node
+        self.tool_nodes = {
+            self.weather_tool_name: ToolNode(tools=[weather_tool]),
+            self.search_tool_name: create_tool_node(get_tools()),
+        }
+        # spaCy pipeline is loaded lazily once per process and shared
+        self.travel_info = TravelInfo()
+        self.itinerary_config = self._load_config_section("itinerary")
+        self.results_config = self._load_config_section("search_results")
+        self.search_cache_config = self._load_config_section("search_cache")
+        # Last result sets this worker showed, for selections while Redis is unavailable
+        self._recent_results = OrderedDict()
+
+    @staticmethod
+    def _load_config_section(name: str) -> dict:
+        try:
+            return load_llm_config(name) or {}
+        except Exception as e:
+            logger.warning(f"No {name} config, using defaults: {e}")
+            return {}
+
+    def _llm_for(self, call_site: str):
+        if over_budget.get() and call_site in self.node_llms.get("over_budget", {}):
+            return self.node_llms["over_budget"][call_site]
+        return self.node_llms.get(call_site, self.llm)
+
+    async def _cached_ainvoke(self, prompt_type: str, prompt: str):
+        """LLM call for deterministic prompts, answered from the response cache when possible."""
+        llm = self._llm_for(PROMPT_CALL_SITES[prompt_type])
+        return await llm_cache.ainvoke(llm, [HumanMessage(content=prompt)], prompt_type, cacheable=PROMPT_VALIDATORS.get(prompt_type))
 
     async def router(self, state: TravelPlannerState) -> dict:
         logger.info("Router node is called")
         if not state.get("messages"):
             return {"route": "chat", "messages": [AIMessage(content="Hello! I'm your travel assistant. How can I help you today?")], "last_user_message": ""}
 
-        available_flights = state.get("available_flights", {})
-        if available_flights and not state.get("flights_processed", False):
+        if state.get("flight_results_key") and not state.get("flights_processed", False):
             logger.info("Bypassing router - processing flight selection")
             return {"route": "flight_selection_node", "messages": state["messages"], "last_user_message": state.get("last_user_message", "")}
 
-        available_hotels = state.get("available_hotels", {})
-        if available_hotels and not state.get("hotels_processed", False):
+        if state.get("hotel_results_key") and not state.get("hotels_processed", False):
             logger.info("Bypassing router - processing hotel selection")
             return {"route": "hotel_selection_node", "messages": state["messages"], "last_user_message": state.get("last_user_message", "")}
 
@@ -71,40 +151,101 @@ class TravelPlannerNode:
 
         # Enhanced routing logic
         user_input_lower = user_input.lower()
+        wants_weather = any(word in user_input_lower for word in ["weather", "temperature", "forecast"])
+        wants_search = any(word in user_input_lower for word in ["search", "find", "look for"])
         if any(word in user_input_lower for word in ["travel", "visit", "trip", "vacation", "holiday", "go to"]):
             route = "travel"
-        elif any(word in user_input_lower for word in ["weather", "temperature", "forecast"]):
+        elif wants_weather and wants_search:
+            route = "tools"  # Compound question: both tool calls go out in one message
+        elif wants_weather:
             route = "weather"
-        elif any(word in user_input_lower for word in ["search", "find", "look for"]):
+        elif wants_search:
             route = "search"
         else:
             route = "chat"
 
         messages = state["messages"]
 
-        # Tool call injection
-        if route == "weather":
-            city_prompt = f"Extract city from: '{user_input}' or say 'pune'"
-            city_response = await self.llm.ainvoke([HumanMessage(content=city_prompt)])
-            city = city_response.content.strip() or "pune"
-            ai_msg = AIMessage(
-                content="Let me check the weather for you...",
-                tool_calls=[{"id": str(uuid4()), "name": self.weather_tool_name, "args": {"city_name": city}}],
-            )
-            messages = messages + [ai_msg]
-        elif route == "search":
-            query_prompt = f"Extract search query from: '{user_input}'"
-            query_response = await self.llm.ainvoke([HumanMessage(content=query_prompt)])
-            query = query_response.content.strip() or user_input
+        # Tool call injection (the extractions for a compound question run concurrently)
+        if route in ("weather", "search", "tools"):
+            extractions = []
+            if route in ("weather", "tools"):
+                extractions.append(self._weather_call(user_input))
+            if route in ("search", "tools"):
+                extractions.append(self._search_call(user_input))
+            calls = await asyncio.gather(*extractions)
             ai_msg = AIMessage(
-                content=f"Searching for {query}...",
-                tool_calls=[{"id": str(uuid4()), "name": self.search_tool_name, "args": {"query": query}}],
+                content=" ".join(status for status, _ in calls),
+                tool_calls=[tool_call for _, tool_call in calls],
             )
             messages = messages + [ai_msg]
 
         logger.info(f"Router classified intent as: {route}")
         return {"route": route, "messages": messages, "last_user_message": user_input}
 
+    async def _weather_call(self, user_input: str):
+        city_prompt = f"Extract city from: '{user_input}' or say 'pune'"
+        city_response = await self._cached_ainvoke("weather_city", city_prompt)
+        city = city_response.content.strip() or "pune"
+        return "Let me check the weather for you...", {"id": str(uuid4()), "name": self.weather_tool_name, "args": {"city_name": city}}
+
+    async def _search_call(self, user_input: str):
+        query_prompt = f"Extract search query from: '{user_input}'"
+        query_response = await self._cached_ainvoke("search_query", query_prompt)
+        query = query_response.content.strip() or user_input
+        return f"Searching for {query}...", {"id": str(uuid4()), "name": self.search_tool_name, "args": {"query": query}}
+
+    async def multi_tool_node(self, state: TravelPlannerState, config: RunnableConfig):
+        """
+        Run every tool call of the router's last message concurrently, each through the
+        ToolNode that owns the tool, and answer with one merged reply.
+        """
+        logger.info("Multi tool node is called")
+        ai_msg = state["messages"][-1]
+        calls_by_tool = {}
+        for tool_call in ai_msg.tool_calls:
+            calls_by_tool.setdefault(tool_call["name"], []).append(tool_call)
+
+        async def run(tool_name: str, tool_calls: list) -> list:
+            partial = AIMessage(content=ai_msg.content, id=ai_msg.id, tool_calls=tool_calls)
+            result = await self.tool_nodes[tool_name].ainvoke({"messages": [partial]}, config)
+            return result["messages"]
+
+        results = await asyncio.gather(*(run(name, calls) for name, calls in calls_by_tool.items()))
+        tool_messages = {msg.tool_call_id: msg for batch in results for msg in batch}
+
+        # Reply sections follow the order of the tool calls, not completion order
+        sections = [self._format_tool_result(tool_call, tool_messages.get(tool_call["id"])) for tool_call in ai_msg.tool_calls]
+        reply = AIMessage(content="\n\n".join(sections))
+        return {"messages": state["messages"] + [tool_messages[call["id"]] for call in ai_msg.tool_calls if call["id"] in tool_messages] + [reply]}
+
+    def _format_tool_result(self, tool_call: dict, tool_message) -> str:
+        """One reply section for a tool result (ToolNode serialises results to JSON)."""
+        if tool_call["name"] == self.weather_tool_name:
+            title = f"**Weather in {tool_call['args'].get('city_name', '').title()}**"
+        else:
+            title = f"**Results for \"{tool_call['args'].get('query', '')}\"**"
+
+        unavailable = f"{title}\nSorry, I couldn't get this right now. Please try again shortly."
+        if tool_message is None or getattr(tool_message, "status", "success") == "error":
+            return unavailable
+
+        try:
+            data = json.loads(tool_message.content)
+        except (TypeError, ValueError):
+            # Not a tool result (e.g. the repr of a search error) - never echo it to the user
+            logger.warning(f"Unexpected {tool_call['name']} output: {str(tool_message.content)[:200]}")
+            return unavailable
+
+        if tool_call["name"] == self.weather_tool_name and isinstance(data, dict):
+            wind = data.get("wind") or {}
+            return f"**Weather in {data.get('city', '')}**\n{data.get('temp')}° {data.get('unit', 'Celsius')}, wind {wind.get('speed')} m/s from {wind.get('direction')}°"
+        if tool_call["name"] != self.weather_tool_name and isinstance(data, list):
+            lines = [f"- {item.get('content', '')[:300]} ({item.get('url', '')})" for item in data if isinstance(item, dict)]
+            return f"{title}\n" + ("\n".join(lines) or "No results found.")
+        logger.warning(f"Unexpected {tool_call['name']} output: {str(tool_message.content)[:200]}")
+        return unavailable
+
     async def chat_node(self, state: TravelPlannerState):
         logger.info("Chat_node is called")
         if not state["messages"]:
@@ -114,12 +255,12 @@ class TravelPlannerNode:
         if not isinstance(last_msg, HumanMessage):
             return {"messages": state["messages"]}
 
-        response = await self.llm.ainvoke([last_msg])
+        response = await self._llm_for("chat").ainvoke([last_msg])
         return {"messages": state["messages"] + [response]}
 
     async def travel_node(self, state: TravelPlannerState):
         logger.info("Travel node is called")
-        extractor = TravelInfo()
+        extractor = self.travel_info
         logger.info("Extracting the info from user msg ...")
 
         # Extract from the LAST human message
@@ -178,19 +319,20 @@ class TravelPlannerNode:
             user_input = last_msg.content
 
             # Store the user's response
+            stored = True
             if current_field == "source":
                 state["source"] = user_input
                 logger.info(f"User provided source: {user_input}")
-            elif current_field == "start_date":
-                state["start_date"] = user_input
-                logger.info(f"User provided start_date: {user_input}")
-            elif current_field == "end_date":
-                state["end_date"] = user_input
-                logger.info(f"User provided end_date: {user_input}")
-
-            # Update missing fields
+            elif current_field in ("start_date", "end_date"):
+                # Dates are normalized to ISO so duration and SerpAPI calls can use them
+                stored = self._store_trip_date(state, current_field, user_input)
+                logger.info(f"User provided {current_field}: {user_input} -> {state.get(current_field) if stored else 'unparsed'}")
+                if not stored:
+                    state["messages"].append(AIMessage(content=f"Sorry, I couldn't understand '{user_input}' as a date."))
+
+            # Update missing fields (an unparsed date stays missing and is asked again)
             missing_fields = state.get("missing_fields", [])
-            if current_field in missing_fields:
+            if stored and current_field in missing_fields:
                 missing_fields.remove(current_field)
             state["missing_fields"] = missing_fields
 
@@ -203,9 +345,9 @@ class TravelPlannerNode:
                 if next_field == "source":
                     question = "What is your departure city?"
                 elif next_field == "start_date":
-                    question = "When would you like to start your trip? (e.g., 2024-12-25)"
+                    question = "When would you like to start your trip? (e.g., 2024-12-25, 25 Dec or next friday)"
                 elif next_field == "end_date":
-                    question = "When does your trip end? (e.g., 2024-12-31)"
+                    question = "When does your trip end? (e.g., 2024-12-31 or for 5 nights)"
 
                 state["messages"].append(AIMessage(content=question))
                 state["route"] = "END"  # End graph after asking question
@@ -229,6 +371,14 @@ class TravelPlannerNode:
                 state["messages"].append(AIMessage(content=summary_msg))
                 logger.info(f"Displayed trip summary: {summary_msg}")
 
+                if settings.SPECULATIVE_FLIGHT_PREFETCH and all([state.get("source"), state.get("destination"), state.get("start_date"), state.get("end_date")]):
+                    # Search flights while the user reads the summary; discarded if they answer "no"
+                    background_tasks.spawn(
+                        self._flight_prefetch_key(state["source"], state["destination"], state["start_date"], state["end_date"]),
+                        self._speculative_flight_search(state["source"], state["destination"], state["start_date"], state["end_date"], state.get("flight_type") or "cheapest"),
+                        retain=settings.SPECULATIVE_PREFETCH_RETAIN,
+                    )
+
                 # Add searching message
                 state["messages"].append(AIMessage(content="Should I proceed with searching for flights and hotels? (yes/no)"))
                 state["route"] = "END"
@@ -248,9 +398,9 @@ class TravelPlannerNode:
                 if current_field == "source":
                     question = "What is your departure city?"
                 elif current_field == "start_date":
-                    question = "When would you like to start your trip? (e.g., 2024-12-25)"
+                    question = "When would you like to start your trip? (e.g., 2024-12-25, 25 Dec or next friday)"
                 elif current_field == "end_date":
-                    question = "When does your trip end? (e.g., 2024-12-31)"
+                    question = "When does your trip end? (e.g., 2024-12-31 or for 5 nights)"
 
                 state["messages"].append(AIMessage(content=question))
                 state["route"] = "END"  # End graph after asking question
@@ -262,6 +412,31 @@ class TravelPlannerNode:
 
         return {"messages": state["messages"], "source": state.get("source"), "start_date": state.get("start_date"), "end_date": state.get("end_date"), "duration": state.get("duration"), "route": state["route"], "awaiting_field": state.get("awaiting_field"), "missing_fields": state.get("missing_fields"), "awaiting_confirmation": state.get("awaiting_confirmation")}
 
+    def _store_trip_date(self, state: TravelPlannerState, field: str, user_input: str) -> bool:
+        """Parse a start/end date answer into ISO format; returns False if it isn't a date."""
+        start = date.fromisoformat(state["start_date"]) if field == "end_date" and state.get("start_date") else None
+        parsed_start, parsed_end, duration = parse_trip_dates(user_input, today=start)
+
+        if field == "start_date":
+            if not parsed_start:
+                return False
+            state["start_date"] = parsed_start.isoformat()
+            if parsed_end:
+                # A whole range was given ("12-18 Dec") - no need to ask for the end date
+                state["end_date"] = parsed_end.isoformat()
+                if "end_date" in (state.get("missing_fields") or []):
+                    state["missing_fields"].remove("end_date")
+            return True
+
+        # End date: either a date, or a length of stay ("5 nights") counted from the start date
+        end = parsed_end or parsed_start
+        if end is None and duration and start:
+            end = start + timedelta(days=duration)
+        if end is None or (start and end < start):
+            return False
+        state["end_date"] = end.isoformat()
+        return True
+
     def _calculate_duration(self, start_date: str, end_date: str) -> int:
         """Calculate duration between two dates in days."""
         try:
@@ -308,6 +483,8 @@ class TravelPlannerNode:
 
             else:
                 # User declined or said something else
+                if state.get("source") and state.get("destination"):
+                    background_tasks.cancel(self._flight_prefetch_key(state["source"], state["destination"], state.get("start_date"), state.get("end_date")))
                 state["awaiting_confirmation"] = False
                 state["route"] = "chat_node"
                 state["messages"].append(AIMessage(content="Okay, let me know if you'd like to make any changes to your trip details."))
@@ -363,39 +540,109 @@ class TravelPlannerNode:
                 state["route"] = "END"
                 return state
 
-        # Step 2: Check if destination is a country name (only if not already processed)
-        if not state.get("awaiting_destination_city") and not state.get("destination_city_processed"):
-            destination_check_prompt = f"""
-            Is "{destination}" a country name or city name?
-            Respond with ONLY one word: "country" or "city"
-            """
+        # A speculative prefetch (started while the user read the trip summary) already ran steps 2-4
+        prefetched = await background_tasks.wait(self._flight_prefetch_key(source, destination, start_date, end_date))
+        if prefetched:
+            logger.info("Using speculative flight prefetch")
+            source_iata = prefetched["source_iata"]
+            destination_iata = prefetched["destination_iata"]
+        else:
+            # Step 2: Check if destination is a country name (only if not already processed)
+            if not state.get("awaiting_destination_city") and not state.get("destination_city_processed"):
+                try:
+                    dest_type = await self._destination_type(destination)
+
+                    if "country" in dest_type:
+                        # It's a country, ask for city
+                        city_suggestion_prompt = f"""
+                        What is the main city or capital of {destination} for flight searches?
+                        Respond with ONLY the city name.
+                        """
+                        city_resp = await self._cached_ainvoke("city_suggestion", city_suggestion_prompt)
+                        suggested_city = city_resp.content.strip()
+
+                        state["messages"].append(AIMessage(content=f"I see you mentioned {destination} which is a country. For flight search, I need a specific city. Should I use {suggested_city} or would you like to specify a different city in {destination}?"))
+                        state["awaiting_destination_city"] = True
+                        state["original_destination"] = destination
+                        state["suggested_city"] = suggested_city
+                        state["route"] = "END"
+                        return state
+
+                except Exception as e:
+                    logger.error(f"Error analyzing destination: {e}")
+                    # Continue with original destination, mark as processed
+                    state["destination_city_processed"] = True
+
+            # Step 3 & 4: Convert to IATA codes, falling back to city names
+            source_iata, destination_iata = await self._resolve_iata(source, destination)
 
-            try:
-                dest_resp = await self.llm.ainvoke([HumanMessage(content=destination_check_prompt)])
-                dest_type = dest_resp.content.strip().lower()
-
-                if "country" in dest_type:
-                    # It's a country, ask for city
-                    city_suggestion_prompt = f"""
-                    What is the main city or capital of {destination} for flight searches?
-                    Respond with ONLY the city name.
-                    """
-                    city_resp = await self.llm.ainvoke([HumanMessage(content=city_suggestion_prompt)])
-                    suggested_city = city_resp.content.strip()
-
-                    state["messages"].append(AIMessage(content=f"I see you mentioned {destination} which is a country. For flight search, I need a specific city. Should I use {suggested_city} or would you like to specify a different city in {destination}?"))
-                    state["awaiting_destination_city"] = True
-                    state["original_destination"] = destination
-                    state["suggested_city"] = suggested_city
-                    state["route"] = "END"
-                    return state
+        # Step 5: Search for flights
+        try:
+            logger.info(f"Searching flights from {source_iata} to {destination_iata}")
+            flight_type = state.get("flight_type") or "cheapest"
+            table = await self._fetch_flights(source, destination, source_iata, destination_iata, start_date, end_date, flight_type)
+
+            # Rank up to max_flights options; they are shown one page at a time
+            ranked = table.top_k(self.results_config.get("max_flights", 50), FLIGHT_RANKINGS.get(flight_type, FLIGHT_RANKINGS["cheapest"]))
+            page = table.take(ranked[: self._page_size("flights")])
+
+            # Only the search key, the ranked option ids and the page cursor go into state;
+            # records stay in the result cache
+            state["flight_results_key"] = flight_search_key(source_iata, destination_iata, start_date, end_date) if page else None
+            state["flight_option_ids"] = table.ids(ranked)
+            state["flight_cursor"] = len(page)
+            state["flights_processed"] = False  # Flag to track if flights have been processed
+
+            if page:
+                # Build flight selection message
+                flights_msg = f"** Found {len(table)} flights from {source} to {destination}, ranked by {flight_type}:**\n\n"
+                flights_msg += self._format_flights(page, 1)
+                flights_msg += self._page_footer("flight", len(page), len(ranked))
+
+                state["messages"].append(AIMessage(content=flights_msg))
+                logger.info(f"Displayed {len(page)} of {len(ranked)} flight options to user")
 
-            except Exception as e:
-                logger.error(f"Error analyzing destination: {e}")
-                # Continue with original destination, mark as processed
-                state["destination_city_processed"] = True
+                # Set route to flight selection node
+                state["route"] = "flight_selection_node"
+
+            else:
+                # No flights found
+                no_flights_msg = f"No flights found from {source} to {destination} for your travel dates.\n\n"
+                no_flights_msg += "Let me try searching for hotels instead."
+
+                state["messages"].append(AIMessage(content=no_flights_msg))
+                state["route"] = "hotel_search_node"
+                logger.info("No flights found, proceeding to hotel search")
+
+        except UpstreamUnavailableError as e:
+            logger.error(f"Flight search unavailable: {e}")
+            error_msg = f"Flight search is temporarily unavailable, so I couldn't look up flights from {source} to {destination} right now.\n\n"
+            error_msg += "Let me try searching for hotels instead."
+
+            state["messages"].append(AIMessage(content=error_msg))
+            state["route"] = "hotel_search_node"
 
-        # Step 3: Convert to IATA codes
+        except Exception as e:
+            logger.error(f"Error searching flights: {e}")
+            error_msg = f"I encountered an error while searching for flights from {source} to {destination}.\n\n"
+            error_msg += "Let me try searching for hotels instead."
+
+            state["messages"].append(AIMessage(content=error_msg))
+            state["route"] = "hotel_search_node"
+
+        return state
+
+    async def _destination_type(self, destination: str) -> str:
+        """Ask the LLM whether the destination is a "country" or a "city"."""
+        destination_check_prompt = f"""
+        Is "{destination}" a country name or city name?
+        Respond with ONLY one word: "country" or "city"
+        """
+        dest_resp = await self._cached_ainvoke("destination_check", destination_check_prompt)
+        return dest_resp.content.strip().lower()
+
+    async def _resolve_iata(self, source: str, destination: str) -> tuple:
+        """Convert source/destination to IATA codes, falling back to the city names."""
         IATA_prompt = f"""
         Convert these locations to IATA airport codes. If no direct IATA code exists, provide the nearest major airport city.
         Source: "{source}"
@@ -412,7 +659,7 @@ class TravelPlannerNode:
         """
 
         try:
-            resp = await self.llm.ainvoke([HumanMessage(content=IATA_prompt)])
+            resp = await self._cached_ainvoke("iata", IATA_prompt)
             raw_text = resp.content.strip()
             iata_data = json.loads(raw_text)
 
@@ -427,89 +674,204 @@ class TravelPlannerNode:
             source_iata = source
             destination_iata = destination
 
-        # Step 4: Final fallback - use city names if IATA failed
-        if not source_iata:
-            source_iata = source
-        if not destination_iata:
-            destination_iata = destination
-
-        # Step 5: Search for flights
-        try:
-            logger.info(f"Searching flights from {source_iata} to {destination_iata}")
-            flight_key = f"{source.lower()}-{destination.lower()}-{start_date}-{end_date}"
-            # print("::::", flight_key)
-            flight_expire = 10800
-            cached_flight = await redis_client.get(flight_key)
-            # print("???", cached_flight)
-            if cached_flight:
-                logger.info(f"cache found for {flight_key}")
-                flights_dict = json.loads(cached_flight)
-            else:
-                logger.info(f" no cache found for {flight_key}")
-                flights_data = await search_flights(
-                    source_iata, destination_iata, start_date, end_date, state.get("flight_type", "cheapest"))
-
-                flights_list = flights_data.get("flights", [])
-
-                # Store flights in dictionary format with sequence numbers as keys
-                flights_dict = {}
-                for i, flight in enumerate(flights_list, 1):
-                    flights_dict[str(i)] = flight
-
-                cached_flight = await redis_client.set_json(flight_key, flights_dict, flight_expire)
-                logger.info(f"flight details cached: {flight_key}")
-
-            state["available_flights"] = flights_dict  # Store as dict with sequence numbers
-            state["flights_processed"] = False  # Flag to track if flights have been processed
-
-            if flights_dict:
-                # Build flight selection message
-                flights_msg = f"** Found {len(flights_dict)} flights from {source} to {destination}:**\n\n"
-
-                for flight_no, flight in flights_dict.items():
-                    airline = flight.get("airline", "Unknown Airline")
-                    price = flight.get("price", "Price not available")
-                    departure_time = flight.get("departure_time", "Time not available")
-                    arrival_time = flight.get("arrival_time", "Time not available")
-
-                    flights_msg += f"**{flight_no}. {airline}**\n"
-                    flights_msg += f"    Price: {price}\n"
-                    flights_msg += f"    Departure: {departure_time}\n"
-                    flights_msg += f"    Arrival: {arrival_time}\n"
-
-                    # Add duration if available
-                    duration = flight.get("duration")
-                    if duration and duration != "Duration not available":
-                        flights_msg += f"   ⏱ Duration: {duration}\n"
-
-                    flights_msg += "\n"
-
-                flights_msg += "**Please select a flight by entering the number (1, 2, 3, etc.):**"
-
-                state["messages"].append(AIMessage(content=flights_msg))
-                logger.info(f"Displayed {len(flights_dict)} flight options to user")
-
-                # Set route to flight selection node
-                state["route"] = "flight_selection_node"
-
-            else:
-                # No flights found
-                no_flights_msg = f"No flights found from {source} to {destination} for your travel dates.\n\n"
-                no_flights_msg += "Let me try searching for hotels instead."
+        # Final fallback - use city names if IATA failed
+        return source_iata or source, destination_iata or destination
+
+    def _flight_prefetch_key(self, source: str, destination: str, start_date: str, end_date: str) -> str:
+        # Background task key - the cache key needs the resolved IATA codes, which the prefetch produces
+        return f"flight_prefetch:{canonical_city(source)}:{canonical_city(destination)}:{iso_date(start_date)}:{iso_date(end_date)}"
+
+    @staticmethod
+    async def _read_results_cache(key: str, build_table):
+        """(ResultTable, age in seconds) cached under ``key``, or None."""
+        cached = await redis_client.get(key)
+        if not cached:
+            return None
+        data = json.loads(cached)
+        if "fetched_at" in data:
+            return ResultTable.from_dict(data["table"]), time.time() - data["fetched_at"]
+        # Entries written before the envelope have no age: treated as past the hard TTL
+        table = ResultTable.from_dict(data) if "columns" in data else build_table(list(data.values()))
+        return table, float("inf")
+
+    def _cache_ttls(self, kind: str) -> tuple:
+        """(soft, hard) TTL in seconds for "flights" / "hotels" results."""
+        ttls = self.search_cache_config.get(kind, {})
+        return ttls.get("soft_ttl", 1800), ttls.get("hard_ttl", 10800)
+
+    def _page_size(self, kind: str) -> int:
+        return self.results_config.get(f"top_k_{kind}", 5)
+
+    @staticmethod
+    def _page_footer(kind: str, shown: int, total: int) -> str:
+        if shown < total:
+            return f"**Select a {kind} by entering its number (1-{shown}), or reply 'more' to see more options ({shown} of {total} shown).**"
+        return f"**Please select a {kind} by entering the number (1-{shown}):**"
+
+    @staticmethod
+    def _format_flights(flights: list, first_no: int) -> str:
+        """Flight options numbered from ``first_no``."""
+        flights_msg = ""
+        for flight_no, flight in enumerate(flights, first_no):
+            airline = flight.get("airline", "Unknown Airline")
+            price = flight.get("price", "Price not available")
+            departure_time = flight.get("departure_time", "Time not available")
+            arrival_time = flight.get("arrival_time", "Time not available")
+
+            flights_msg += f"**{flight_no}. {airline}**\n"
+            flights_msg += f"    Price: {price}\n"
+            flights_msg += f"    Departure: {departure_time}\n"
+            flights_msg += f"    Arrival: {arrival_time}\n"
+
+            # Add duration if available
+            duration = flight.get("duration")
+            if duration and duration != "Duration not available":
+                flights_msg += f"   ⏱ Duration: {duration}\n"
+
+            flights_msg += "\n"
+        return flights_msg
+
+    @staticmethod
+    def _format_hotels(hotels: list, first_no: int) -> str:
+        """Hotel options numbered from ``first_no``."""
+        hotels_msg = ""
+        for hotel_no, hotel in enumerate(hotels, first_no):
+            name = hotel.get("name", "Unknown Hotel")
+            price = hotel.get("price", "Price not available")
+            rating = hotel.get("rating", "Rating not available")
+            location = hotel.get("location", "Location not available")
+
+            hotels_msg += f"**{hotel_no}. {name}**\n"
+            hotels_msg += f"   Price: {price} per night\n"
+            if rating and rating != "Rating not available":
+                hotels_msg += f"   Rating: {rating}/5\n"
+            if location and location != "Location not available":
+                hotels_msg += f"   Location: {location}\n"
+
+            # Add amenities if available
+            amenities = hotel.get("amenities")
+            if amenities:
+                hotels_msg += f"    Amenities: {', '.join(amenities[:3])}\n"
+
+            hotels_msg += "\n"
+        return hotels_msg
+
+    async def _next_page(self, state: TravelPlannerState, kind: str, build_table, format_page):
+        """Show the next page of ranked ``kind`` ("flight" / "hotel") options from the result cache."""
+        option_ids = state.get(f"{kind}_option_ids") or []
+        cursor = state.get(f"{kind}_cursor") or 0
+        state["route"] = "END"  # Still waiting for a selection
+
+        if cursor >= len(option_ids):
+            state["messages"].append(AIMessage(content=f"That's all {len(option_ids)} {kind} options. Please select one by entering its number (1-{cursor})."))
+            return state
 
-                state["messages"].append(AIMessage(content=no_flights_msg))
-                state["route"] = "hotel_search_node"
-                logger.info("No flights found, proceeding to hotel search")
+        page_ids = option_ids[cursor : cursor + self._page_size(f"{kind}s")]
+        table = await self._load_results(state.get(f"{kind}_results_key"), build_table)
+        page = [table.find(option_id) for option_id in page_ids] if table is not None else [None]
+        if any(option is None for option in page):
+            # Result set expired or the options were refreshed away: rank the current results again
+            state["messages"].append(AIMessage(content=f"Some of these {kind} options are no longer available, so here are the current options."))
+            state["route"] = f"{kind}_search_node"
+            return state
 
-        except Exception as e:
-            logger.error(f"Error searching flights: {e}")
-            error_msg = f"I encountered an error while searching for flights from {source} to {destination}.\n\n"
-            error_msg += "Let me try searching for hotels instead."
+        state[f"{kind}_cursor"] = cursor + len(page)
+        page_msg = format_page(page, cursor + 1)
+        page_msg += self._page_footer(kind, cursor + len(page), len(option_ids))
+        state["messages"].append(AIMessage(content=page_msg))
+        logger.info(f"Displayed {kind} options {cursor + 1}-{cursor + len(page)} of {len(option_ids)}")
+        return state
 
-            state["messages"].append(AIMessage(content=error_msg))
-            state["route"] = "hotel_search_node"
+    def _remember_results(self, key: str, table: ResultTable) -> ResultTable:
+        self._recent_results[key] = table
+        self._recent_results.move_to_end(key)
+        while len(self._recent_results) > self.search_cache_config.get("recent_results", 256):
+            self._recent_results.popitem(last=False)
+        return table
+
+    async def _load_results(self, key: str, build_table):
+        """The cached result set under ``key`` (this worker's copy if Redis has none), or None."""
+        if not key:
+            return None
+        entry = await self._read_results_cache(key, build_table)
+        return entry[0] if entry else self._recent_results.get(key)
+
+    async def _load_option(self, key: str, build_table, option_id: str):
+        """A shown option from the cached result set, or None if it expired or was refreshed away."""
+        table = await self._load_results(key, build_table)
+        return table.find(option_id) if table is not None else None
+
+    def _single_flight_options(self) -> dict:
+        options = self.search_cache_config.get("single_flight", {})
+        return {
+            "lock_ttl": options.get("lock_ttl", 30),
+            "wait_timeout": options.get("wait_timeout", 25),
+            "poll_interval": options.get("poll_interval", 0.2),
+        }
+
+    async def _cached_search(self, kind: str, key: str, build_table, search) -> ResultTable:
+        """
+        Stale-while-revalidate lookup for flight/hotel results.
 
-        return state
+        Younger than soft_ttl: served from Redis. Between soft and hard TTL: served from
+        Redis while a background task refreshes it. Missing or older than hard_ttl
+        (Redis also expires entries then): ``search()`` runs, coalesced with identical
+        concurrent searches.
+        """
+        soft_ttl, hard_ttl = self._cache_ttls(kind)
+
+        async def read_fresh():
+            entry = await self._read_results_cache(key, build_table)
+            return entry[0] if entry and entry[1] < soft_ttl else None
+
+        async def search_and_store() -> ResultTable:
+            table = await search()
+            if len(table):
+                # Parsed into columns once; the cache keeps the columns next to the records
+                await redis_client.set_json(key, {"fetched_at": time.time(), "table": table.to_dict()}, hard_ttl)
+                logger.info(f"{kind} details cached: {key}")
+            return table
+
+        def coalesced():
+            # Concurrent identical searches (this worker or others) share one SerpAPI call
+            return single_flight.run(key, search_and_store, read_fresh, **self._single_flight_options())
+
+        entry = await self._read_results_cache(key, build_table)
+        if entry is not None:
+            table, age = entry
+            if age < soft_ttl:
+                logger.info(f"cache found for {key}")
+                cache_stats.record(key, "hit")
+                return table
+            if age < hard_ttl:
+                cache_stats.record(key, "stale")
+                logger.info(f"stale cache for {key} ({age:.0f}s old), refreshing in the background")
+                background_tasks.spawn(f"refresh:{key}", coalesced())
+                return table
+
+        logger.info(f" no cache found for {key}")
+        cache_stats.record(key, "miss")
+        return await coalesced()
+
+    async def _fetch_flights(self, source: str, destination: str, source_iata: str, destination_iata: str, start_date: str, end_date: str, flight_type: str = "cheapest") -> ResultTable:
+        """Return all flights as a ResultTable, from Redis when cached, otherwise from SerpAPI."""
+        flight_key = flight_search_key(source_iata, destination_iata, start_date, end_date)
+
+        async def search() -> ResultTable:
+            flights_data = await search_flights(source_iata, destination_iata, start_date, end_date, flight_type)
+            return flight_table(flights_data.get("flights", []))
+
+        return self._remember_results(flight_key, await self._cached_search("flights", flight_key, flight_table, search))
+
+    async def _speculative_flight_search(self, source: str, destination: str, start_date: str, end_date: str, flight_type: str) -> dict:
+        """Run destination check, IATA conversion and flight search ahead of the user's "yes"."""
+        if "country" in await self._destination_type(destination):
+            # flight_search_node will ask for a city first - nothing useful to prefetch
+            return None
+
+        source_iata, destination_iata = await self._resolve_iata(source, destination)
+        await self._fetch_flights(source, destination, source_iata, destination_iata, start_date, end_date, flight_type)
+        return {"source_iata": source_iata, "destination_iata": destination_iata}
 
     async def flight_selection_node(self, state: TravelPlannerState):
         logger.info("Flight selection node is called")
@@ -518,14 +880,26 @@ class TravelPlannerNode:
 
         if isinstance(last_msg, HumanMessage):
             user_input = last_msg.content.strip()
-            available_flights = state.get("available_flights", {})
+            option_ids = state.get("flight_option_ids") or []
+            shown = state.get("flight_cursor") or 0
+
+            if user_input.lower() in MORE_REPLIES:
+                return await self._next_page(state, "flight", flight_table, self._format_flights)
+
+            # Check if user selected a valid flight number (any page shown so far)
+            if user_input.isdigit() and 1 <= int(user_input) <= shown:
+                selected_flight = await self._load_option(state.get("flight_results_key"), flight_table, option_ids[int(user_input) - 1])
+                if selected_flight is None:
+                    state["messages"].append(AIMessage(content="That flight is no longer available, so here are the current options."))
+                    state["route"] = "flight_search_node"
+                    logger.info(f"Flight option {user_input} is no longer in the cached results, searching again")
+                    return state
 
-            # Check if user selected a valid flight number
-            if user_input in available_flights:
-                selected_flight = available_flights[user_input]
                 state["selected_flight"] = selected_flight
                 state["selected_flight_number"] = user_input
                 state["flights_processed"] = True
+                state["flight_option_ids"] = None
+                state["flight_cursor"] = None
 
                 # CRITICAL: Clear accommodation_guests to prevent carry-over
                 state["accommodation_guests"] = None
@@ -544,7 +918,7 @@ class TravelPlannerNode:
 
             else:
                 # Invalid selection
-                error_msg = f"Invalid selection: '{user_input}'. Please enter a valid flight number (1, 2, 3, etc.) from the list above."
+                error_msg = f"Invalid selection: '{user_input}'. Please enter a flight number from 1 to {shown}" + (", or 'more' to see more options." if shown < len(option_ids) else ".")
                 state["messages"].append(AIMessage(content=error_msg))
                 state["route"] = "flight_selection_node"
                 logger.info(f"User entered invalid flight selection: {user_input}")
@@ -574,56 +948,43 @@ class TravelPlannerNode:
             return state
 
         try:
-            hotel_key = f"{destination.lower()}-{start_date}-{end_date}"
-            hotel_expire = 10800
-            cached_hotel = await redis_client.get(hotel_key)
-            if cached_hotel:
-                logger.info(f"cache found for {hotel_key}")
-                hotels_dict = json.loads(cached_hotel)
-            else:
-                logger.info(f" no cache found for {hotel_key}")
-                hotel_results = await search_hotels(
-                    city=destination, check_in=start_date, check_out=end_date, guests=state["accommodation_guests"])
-                hotel_options = hotel_results.get("hotels", [])
-                # print(len(hotel_options))
-                # Store hotels in dictionary format with sequence numbers as keys
-                hotels_dict = {}
-                for i, hotel in enumerate(hotel_options, 1):
-                    hotels_dict[str(i)] = hotel
-                await redis_client.set_json(hotel_key, hotels_dict, hotel_expire)
-                logger.info(f"hotel details cached: {hotel_key}")
-
-            state["available_hotels"] = hotels_dict  # Store as dict with sequence numbers
+            hotel_key = hotel_search_key(destination, start_date, end_date, state["accommodation_guests"])
+            # Only a prefetch for this party size helps; one for another size is left alone
+            prefetch_key = self._hotel_prefetch_key(destination, start_date, end_date, state["accommodation_guests"])
+            if background_tasks.is_running(prefetch_key):
+                logger.info(f"Waiting for {prefetch_key}")
+                await background_tasks.wait(prefetch_key)
+
+            table = await self._fetch_hotels(destination, start_date, end_date, state["accommodation_guests"])
+
+            # Vectorized budget filter, then only the top K ranked properties are shown
+            budget = parse_amount(state.get("accommodation_budget"))
+            budget = None if math.isnan(budget) else budget  # NaN -> no budget given
+            candidates = table.at_most("price", budget)
+            over_budget_note = ""
+            if budget is not None and len(candidates) == 0 and len(table):
+                over_budget_note = f"No hotels are within your budget of {state.get('accommodation_budget')} per night, showing the closest options.\n\n"
+                candidates = table.all()
+            # Rank up to max_hotels properties; they are shown one page at a time
+            hotel_ranking = self.results_config.get("hotel_ranking", "cheapest")
+            ranked = table.top_k(self.results_config.get("max_hotels", 50), HOTEL_RANKINGS.get(hotel_ranking, HOTEL_RANKINGS["cheapest"]), candidates)
+            page = table.take(ranked[: self._page_size("hotels")])
+
+            # Only the search key, the ranked option ids and the page cursor go into state;
+            # records stay in the result cache
+            state["hotel_results_key"] = hotel_key if page else None
+            state["hotel_option_ids"] = table.ids(ranked)
+            state["hotel_cursor"] = len(page)
             state["hotels_processed"] = False  # Flag to track if hotels have been processed
 
-            if hotels_dict:
+            if page:
                 # Build hotel selection message
-                hotels_msg = f"** Found {len(hotels_dict)} hotels in {destination}:**\n\n"
-
-                for hotel_no, hotel in hotels_dict.items():
-                    name = hotel.get("name", "Unknown Hotel")
-                    price = hotel.get("price", "Price not available")
-                    rating = hotel.get("rating", "Rating not available")
-                    location = hotel.get("location", "Location not available")
-
-                    hotels_msg += f"**{hotel_no}. {name}**\n"
-                    hotels_msg += f"   Price: {price} per night\n"
-                    if rating and rating != "Rating not available":
-                        hotels_msg += f"   Rating: {rating}/5\n"
-                    if location and location != "Location not available":
-                        hotels_msg += f"   Location: {location}\n"
-
-                    # Add amenities if available
-                    amenities = hotel.get("amenities")
-                    if amenities:
-                        hotels_msg += f"    Amenities: {', '.join(amenities[:3])}\n"
-
-                    hotels_msg += "\n"
-
-                hotels_msg += "**Please select a hotel by entering the number (1, 2, 3, etc.):**"
+                hotels_msg = over_budget_note + f"** Found {len(candidates)} hotels in {destination}, ranked by {hotel_ranking}:**\n\n"
+                hotels_msg += self._format_hotels(page, 1)
+                hotels_msg += self._page_footer("hotel", len(page), len(ranked))
 
                 state["messages"].append(AIMessage(content=hotels_msg))
-                logger.info(f"Displayed {len(hotels_dict)} hotel options to user")
+                logger.info(f"Displayed {len(page)} of {len(ranked)} hotel options to user")
 
                 # Set route to hotel selection node
                 state["route"] = "hotel_selection_node"
@@ -637,6 +998,14 @@ class TravelPlannerNode:
                 state["route"] = "END"
                 logger.info("No hotels found, ending search")
 
+        except UpstreamUnavailableError as e:
+            logger.error(f"Hotel search unavailable: {e}")
+            error_msg = f" Hotel search is temporarily unavailable, so I couldn't look up hotels in {destination} right now.\n\n"
+            error_msg += "Please try again in a few minutes."
+
+            state["messages"].append(AIMessage(content=error_msg))
+            state["route"] = "END"
+
         except Exception as e:
             logger.error(f"Error searching hotels: {e}")
             error_msg = f" I encountered an error while searching for hotels in {destination}.\n\n"
@@ -647,6 +1016,40 @@ class TravelPlannerNode:
 
         return state
 
+    async def _fetch_hotels(self, destination: str, start_date: str, end_date: str, guests: int) -> ResultTable:
+        """Return all hotels as a ResultTable, from Redis when cached, otherwise from SerpAPI."""
+        hotel_key = hotel_search_key(destination, start_date, end_date, guests)
+
+        async def search() -> ResultTable:
+            # Query with the user's place text; the key only normalizes it (qualifier kept)
+            hotel_results = await search_hotels(city=destination, check_in=start_date, check_out=end_date, guests=guests)
+            return hotel_table(hotel_results.get("hotels", []))
+
+        return self._remember_results(hotel_key, await self._cached_search("hotels", hotel_key, hotel_table, search))
+
+    @staticmethod
+    def _hotel_prefetch_key(destination: str, start_date: str, end_date: str, guests: int) -> str:
+        """Background task key of a hotel prefetch; shares the guest-aware hotel cache key."""
+        return f"hotel_prefetch:{hotel_search_key(destination, start_date, end_date, guests)}"
+
+    async def hotel_prefetch_node(self, state: TravelPlannerState):
+        """Warm the hotel cache in the background while the user is choosing a flight."""
+        logger.info("Hotel prefetch node is called")
+
+        destination = state.get("destination")
+        start_date = state.get("start_date")
+        end_date = state.get("end_date")
+        if not settings.HOTEL_PREFETCH_ENABLED or not all([destination, start_date, end_date]):
+            return None
+
+        # Guests are only asked after the flight pick, so prefetch with the default party size.
+        # Results are keyed by guest count, so other party sizes never see these prices.
+        guests = state.get("accommodation_guests") or settings.HOTEL_PREFETCH_GUESTS
+        prefetch_key = self._hotel_prefetch_key(destination, start_date, end_date, guests)
+        background_tasks.spawn(prefetch_key, self._fetch_hotels(destination, start_date, end_date, guests))
+        # Nothing to write to state - the result lands in the hotel cache key
+        return None
+
     async def hotel_selection_node(self, state: TravelPlannerState):
         logger.info("Hotel selection node is called")
 
@@ -654,14 +1057,26 @@ class TravelPlannerNode:
 
         if isinstance(last_msg, HumanMessage):
             user_input = last_msg.content.strip()
-            available_hotels = state.get("available_hotels", {})
+            option_ids = state.get("hotel_option_ids") or []
+            shown = state.get("hotel_cursor") or 0
+
+            if user_input.lower() in MORE_REPLIES:
+                return await self._next_page(state, "hotel", hotel_table, self._format_hotels)
+
+            # Check if user selected a valid hotel number (any page shown so far)
+            if user_input.isdigit() and 1 <= int(user_input) <= shown:
+                selected_hotel = await self._load_option(state.get("hotel_results_key"), hotel_table, option_ids[int(user_input) - 1])
+                if selected_hotel is None:
+                    state["messages"].append(AIMessage(content="That hotel is no longer available, so here are the current options."))
+                    state["route"] = "hotel_search_node"
+                    logger.info(f"Hotel option {user_input} is no longer in the cached results, searching again")
+                    return state
 
-            # Check if user selected a valid hotel number
-            if user_input in available_hotels:
-                selected_hotel = available_hotels[user_input]
                 state["selected_hotel"] = selected_hotel
                 state["selected_hotel_number"] = user_input
                 state["hotels_processed"] = True
+                state["hotel_option_ids"] = None
+                state["hotel_cursor"] = None
 
                 # Build confirmation message
                 name = selected_hotel.get("name", "Unknown Hotel")
@@ -689,7 +1104,7 @@ class TravelPlannerNode:
 
             else:
                 # Invalid selection
-                error_msg = f" Invalid selection: '{user_input}'. Please enter a valid hotel number (1, 2, 3, etc.) from the list above."
+                error_msg = f" Invalid selection: '{user_input}'. Please enter a hotel number from 1 to {shown}" + (", or 'more' to see more options." if shown < len(option_ids) else ".")
                 state["messages"].append(AIMessage(content=error_msg))
                 state["route"] = "hotel_selection_node"
                 logger.info(f"User entered invalid hotel selection: {user_input}")
@@ -770,6 +1185,14 @@ class TravelPlannerNode:
             return state
 
         try:
+            # Daily forecast for the trip dates (empty when the trip is beyond the forecast range)
+            forecast = await weather_service.trip_forecast(destination, start_date, end_date)
+            forecast_text = format_forecast(forecast)
+            forecast_section = f"""
+            Weather forecast (plan indoor alternatives on rainy days):
+            {forecast_text}
+""" if forecast else ""
+
             # Generate itinerary using LLM
             itinerary_prompt = f"""
             Create a detailed {duration}-day travel itinerary for {destination}.
@@ -778,7 +1201,7 @@ class TravelPlannerNode:
             - Destination: {destination}
             - Dates: {start_date} to {end_date} ({duration} days)
             - Hotel: {selected_hotel.get('name', 'Selected hotel')}
-
+{forecast_section}
             Please provide a comprehensive daily itinerary including:
             1. Morning activities
             2. Afternoon activities
@@ -791,8 +1214,13 @@ class TravelPlannerNode:
             Format it clearly with daily sections.
             """
 
-            itinerary_response = await self.llm.ainvoke([HumanMessage(content=itinerary_prompt)])
-            itinerary_content = itinerary_response.content
+            if self.itinerary_config.get("mode") == "per_day" and int(duration) > 1:
+                itinerary_content = await self._generate_itinerary_per_day(destination, start_date, end_date, int(duration), selected_hotel.get("name", "Selected hotel"), {day["date"]: day for day in forecast})
+            else:
+                itinerary_response = await self._llm_for("itinerary").ainvoke([HumanMessage(content=itinerary_prompt)])
+                itinerary_content = itinerary_response.content
+
+            forecast_message = f"    ** Weather Forecast:**\n{forecast_text}\n\n" if forecast else ""
 
             # Format the final message with trip summary + itinerary
             final_message = f"""🎉 **Your Travel Planning is Complete!**
@@ -808,7 +1236,7 @@ class TravelPlannerNode:
     • Price: {selected_hotel.get('price', 'N/A')}
     • Rating: {selected_hotel.get('rating', 'N/A')}
 
-    ** Your {duration}-Day Itinerary for {destination}:**
+{forecast_message}    ** Your {duration}-Day Itinerary for {destination}:**
 
     {itinerary_content}
 
@@ -825,3 +1253,73 @@ class TravelPlannerNode:
             state["route"] = "END"
 
         return state
+
+    async def _itinerary_outline(self, destination: str, duration: int) -> list:
+        """One short theme per day, so the per-day calls don't repeat each other."""
+        outline_prompt = f"""
+        Plan the outline of a {duration}-day trip to {destination}.
+        Respond with strict JSON: a list of exactly {duration} strings, one short theme per day
+        (main areas or attractions), e.g. ["Old town and museums", "Day trip to the coast"].
+        """
+        try:
+            resp = await self._llm_for("itinerary").ainvoke([HumanMessage(content=outline_prompt)])
+            outline = json.loads(resp.content.strip())
+            if isinstance(outline, list) and len(outline) >= duration:
+                return [str(theme) for theme in outline[:duration]]
+            logger.warning(f"Itinerary outline has {len(outline) if isinstance(outline, list) else 0} days, expected {duration}")
+        except Exception as e:
+            logger.error(f"Error generating itinerary outline: {e}")
+        return [f"Highlights of {destination}" for _ in range(duration)]
+
+    async def _generate_itinerary_per_day(self, destination: str, start_date: str, end_date: str, duration: int, hotel_name: str, forecast: dict = None) -> str:
+        """
+        Outline first, then one LLM call per day with bounded parallelism.
+
+        Days are streamed (custom stream mode) in order as soon as each one and all
+        earlier days are ready, and returned joined in order.
+        """
+        outline = await self._itinerary_outline(destination, duration)
+        semaphore = asyncio.Semaphore(self.itinerary_config.get("max_parallel", 4))
+        trip_start = date.fromisoformat(start_date)
+
+        async def generate_day(day_no: int) -> str:
+            day_date = (trip_start + timedelta(days=day_no - 1)).isoformat()
+            weather = (forecast or {}).get(day_date)
+            weather_line = f"\n            - Weather: {weather['condition']}, {weather['temp_min']}-{weather['temp_max']}°C, {weather['rain_chance']}% chance of rain (prefer indoor plans if rainy)" if weather else ""
+            day_prompt = f"""
+            Write day {day_no} of a {duration}-day travel itinerary for {destination}.
+
+            Travel Details:
+            - Date: {day_date} (trip runs {start_date} to {end_date})
+            - Hotel: {hotel_name}{weather_line}
+            - Theme for today: {outline[day_no - 1]}
+            - Other days already cover: {"; ".join(theme for i, theme in enumerate(outline, 1) if i != day_no)}
+
+            Include morning, afternoon and evening activities, dining recommendations,
+            transportation tips and cultural highlights for this day only.
+            Start with the heading "### Day {day_no}: <theme>".
+            """
+            async with semaphore:
+                resp = await self._llm_for("itinerary").ainvoke([HumanMessage(content=day_prompt)])
+            return resp.content
+
+        try:
+            writer = get_stream_writer()
+        except RuntimeError:
+            # Called outside a graph run - nothing to stream to
+            writer = None
+
+        tasks = [asyncio.create_task(generate_day(day_no)) for day_no in range(1, duration + 1)]
+        days = []
+        try:
+            for day_no, task in enumerate(tasks, 1):
+                day_content = await task
+                days.append(day_content)
+                if writer:
+                    writer({"type": "itinerary_day", "day": day_no, "total_days": duration, "content": day_content})
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        logger.info(f"Generated {duration} itinerary days in parallel for {destination}")
+        return "\n\n".join(days)
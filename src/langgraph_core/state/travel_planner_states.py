@@ -36,7 +36,9 @@ class TravelPlannerState(TypedDict):
     original_destination: Optional[str]  # Store original destination for context
     suggested_city: Optional[str]
     # --- Flight specific states ---
-    available_flights: Optional[Dict]  # Flights stored as dict {1: flight1, 2: flight2, ...}
+    flight_results_key: Optional[str]  # Cache key of the flight search; options are loaded from there
+    flight_option_ids: Optional[List[str]]  # option_id of each ranked flight, in display order (1, 2, ...)
+    flight_cursor: Optional[int]  # How many ranked flights have been shown (pages of top_k_flights)
     selected_flight: Optional[Dict]  # User's selected flight
     selected_flight_number: Optional[str]  # Selected flight number
     flights_processed: Optional[bool]  # Whether flights have been processed
@@ -46,7 +48,9 @@ class TravelPlannerState(TypedDict):
     accommodation_area_type: Optional[str]
     accommodation_budget: Optional[str]
     accommodation_type: Optional[str]
-    available_hotels: Optional[Dict]  # Hotels stored as dict {1: hotel1, 2: hotel2, ...}
+    hotel_results_key: Optional[str]  # Cache key of the hotel search; options are loaded from there
+    hotel_option_ids: Optional[List[str]]  # option_id of each ranked hotel, in display order (1, 2, ...)
+    hotel_cursor: Optional[int]  # How many ranked hotels have been shown (pages of top_k_hotels)
     selected_hotel: Optional[Dict]
     selected_hotel_number: Optional[str]
     hotels_processed: Optional[bool]  # Whether hotel search is done
@@ -0,0 +1,91 @@
+import re
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+from langchain_community.tools.tavily_search import TavilySearchResults
+from langchain_core.callbacks import AsyncCallbackManagerForToolRun
+
+from src.cache.cache_keys import build_key, cache_stats
+from src.cache.redis_client import redis_client
+from src.loggers import Logger
+from src.utils.Utilities import load_llm_config
+
+logger = Logger(__name__).get_logger()
+
+_TRAILING_PUNCT_RE = re.compile(r"[\s?!.,;:]+$")
+
+
+def normalize_query(query: str) -> str:
+    """Casefolded, whitespace collapsed, trailing punctuation dropped: "Best  museums in Paris??" -> "best museums in paris"."""
+    return _TRAILING_PUNCT_RE.sub("", " ".join((query or "").split()).casefold())
+
+
+class SearchResultCache:
+    """
+    TTL-bounded Redis cache for web search results, keyed by the normalized query and
+    every search option (``tavily`` namespace in cache_keys). TTL comes from
+    ``tool_cache.tavily.ttl`` in llm_configs.yml. Failed searches are never cached.
+    """
+
+    def __init__(self):
+        self._config = None
+
+    @property
+    def ttl(self) -> int:
+        if self._config is None:
+            try:
+                self._config = load_llm_config("tool_cache") or {}
+            except Exception as e:
+                logger.warning(f"No tool_cache config, using defaults: {e}")
+                self._config = {}
+        return self._config.get("tavily", {}).get("ttl", 3600)
+
+    @staticmethod
+    def key(query: str, **options) -> str:
+        return build_key("tavily", q=normalize_query(query), **options)
+
+    async def get_or_fetch(self, key: str, fetch: Callable[[], Awaitable[Any]], cacheable: Callable[[Any], bool] = bool) -> Any:
+        cached = await redis_client.get_json(key)
+        if cached is not None:
+            cache_stats.record(key, "hit")
+            return cached
+        cache_stats.record(key, "miss")
+        result = await fetch()
+        if cacheable(result):
+            await redis_client.set_json(key, result, self.ttl)
+        return result
+
+
+# Global instance shared by all search tools
+search_cache = SearchResultCache()
+
+
+class CachedTavilySearch(TavilySearchResults):
+    """TavilySearchResults whose async runs are answered from ``search_cache`` when possible.
+
+    The sync ``_run`` is left uncached (the Redis client is async-only); the graphs call
+    tools through ``ainvoke``.
+    """
+
+    async def _arun(
+        self,
+        query: str,
+        run_manager: Optional[AsyncCallbackManagerForToolRun] = None,
+    ) -> Tuple[Union[List[Dict[str, str]], str], Dict]:
+        key = search_cache.key(
+            query,
+            max_results=self.max_results,
+            search_depth=self.search_depth,
+            include_domains=",".join(sorted(self.include_domains or [])),
+            exclude_domains=",".join(sorted(self.exclude_domains or [])),
+            include_answer=self.include_answer,
+            include_raw_content=self.include_raw_content,
+            include_images=self.include_images,
+        )
+
+        async def search():
+            content, artifact = await super(CachedTavilySearch, self)._arun(query, run_manager)
+            return [content, artifact]
+
+        # A failed search comes back as (repr(error), {}) - only cache real results
+        content, artifact = await search_cache.get_or_fetch(key, search, cacheable=lambda result: bool(result[1]))
+        return content, artifact
@@ -1,9 +1,11 @@
 from typing import Any, Dict
 
-import aiohttp
 from langchain.tools import StructuredTool
-from src.exceptions import ExceptionError
-from src.langgraph_core.schemas.all_schems import WeatherResponse, WindInfo
+from src.config.settings import settings
+from src.exceptions import ExceptionError, UpstreamUnavailableError
+from src.langgraph_core.schemas.all_schems import WeatherResponse
+from src.langgraph_core.tools.upstream_guard import upstream_guard
+from src.langgraph_core.tools.weather_service import weather_service
 from src.loggers import Logger
 from src.utils.Utilities import get_api_key
 
@@ -12,43 +14,41 @@ logger = Logger(__name__).get_logger()
 
 async def weather_information(city_name: str) -> WeatherResponse:
     """Generates a weather report for a given city."""
-    base_url = "https://api.openweathermap.org/data/2.5/weather"
-    params = {
-        "q": city_name,
-        "appid": get_api_key("OPENWEATHERMAP_API_KEY"),
-        "units": "metric",
-    }
-
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(base_url, params=params) as response:
-                if response.status != 200:
-                    raise ValueError(f"Error fetching weather: {await response.text()}")
-
-                data = await response.json()
-                info = WeatherResponse(
-                    city=data["name"],
-                    temp=data["main"]["temp"],
-                    unit="Celsius",
-                    wind=WindInfo(speed=data["wind"]["speed"], direction=data["wind"]["deg"]),
-                )
-                return info.dict()
+        # Cached per normalized city for a few minutes (see weather_service.py)
+        return await weather_service.current(city_name)
     except Exception as e:
         logger.error(f"Error in weather_information: {e}")
         raise
 
 
+# weather_information is async: registered as the tool's coroutine so ainvoke awaits it
 weather_tool = StructuredTool.from_function(
-    func=weather_information,
+    coroutine=weather_information,
     name="weather_infotmation",
     description="Fetches current weather info for a given city",
     return_direct=True,
 )
 
 
+def _leg(leg: dict) -> dict:
+    """Identifying fields of one flight segment."""
+    dep_airport = leg.get("departure_airport", {})
+    arr_airport = leg.get("arrival_airport", {})
+    return {
+        "flight_number": leg.get("flight_number", ""),
+        "departure_airport": dep_airport.get("id") or dep_airport.get("name", ""),
+        "departure_time": dep_airport.get("time") or dep_airport.get("datetime", ""),
+        "arrival_airport": arr_airport.get("id") or arr_airport.get("name", ""),
+        "arrival_time": arr_airport.get("time") or arr_airport.get("datetime", ""),
+    }
+
+
 async def search_flights(source: str, destination: str, start_date: str, end_date: str, flight_type: str = "cheapest") -> Dict[str, Any]:
     """
     Search flights using SerpAPI.
+    Raises UpstreamUnavailableError when SerpAPI cannot be reached (after retries),
+    so a transient failure is never mistaken for "no flights".
     """
     api_key = get_api_key("SERPAPI_API_KEY")
     params = {
@@ -63,16 +63,10 @@ async def search_flights(source: str, destination: str, start_date: str, end_dat
 
     try:
         logger.info("Searching flights from %s to %s", source, destination)
-        async with aiohttp.ClientSession() as session:
-            async with session.get("https://serpapi.com/search", params=params) as response:
-                response.raise_for_status()
-                results = await response.json()
+        results = await upstream_guard.get_json("serpapi", f"{settings.SERPAPI_BASE_URL}/search", api_key=api_key, params=params)
 
-        # Decide which list of flights to use
-        if flight_type == "cheapest":
-            flights = results.get("cheapest_flights", []) or results.get("best_flights", [])
-        else:
-            flights = results.get("best_flights", []) or results.get("other_flights", [])
+        # Keep every option; ranking by flight_type happens on the columnar ResultTable
+        flights = results.get("best_flights", []) + results.get("other_flights", [])
 
         flight_options = []
         for flight in flights:
@@ -92,14 +86,20 @@ async def search_flights(source: str, destination: str, start_date: str, end_dat
                     "arrival_airport": (arr_airport.get("id") or arr_airport.get("name", "")),
                     "arrival_time": (arr_airport.get("time") or arr_airport.get("datetime", "")),
                     "duration": (segment.get("duration", flight.get("duration", ""))),
+                    "total_duration": flight.get("total_duration"),
+                    "stops": max(len(flight.get("flights", [])) - 1, 0),
+                    # Every leg, so connecting itineraries that share a first leg stay distinct
+                    "legs": [_leg(leg) for leg in flight.get("flights", [])],
                 }
             )
 
         return {"flights": flight_options}
 
+    except UpstreamUnavailableError:
+        raise
     except Exception as e:
         logger.error(f"Error fetching flights: {e}")
-        return {"flights": []}
+        raise UpstreamUnavailableError("serpapi", str(e)) from e
 
 
 async def search_hotels(city: str, check_in: str, check_out: str, guests: int, hotel_type: str = "cheapest") -> Dict[str, Any]:
@@ -110,9 +110,11 @@ async def search_hotels(city: str, check_in: str, check_out: str, guests: int, h
         area_type: e.g., 'main city', 'suburban'
         check_in, check_out: YYYY-MM-DD format
         guests: Number of guests
-        hotel_type: 'best' or 'cheapest'
+        hotel_type: 'best' or 'cheapest' (applied when the results are ranked, see result_store.py)
     Returns:
-        Dict with list of hotels
+        Dict with list of hotels, unsorted
+    Raises:
+        UpstreamUnavailableError when SerpAPI cannot be reached (after retries)
     """
     api_key = get_api_key("SERPAPI_API_KEY")
     params = {
@@ -126,17 +128,11 @@ async def search_hotels(city: str, check_in: str, check_out: str, guests: int, h
     }
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get("https://serpapi.com/search", params=params) as response:
-                response.raise_for_status()
-                data = await response.json()
+        data = await upstream_guard.get_json("serpapi", f"{settings.SERPAPI_BASE_URL}/search", api_key=api_key, params=params)
 
         # Extract properties list (correct field name in the API response)
         properties_list = data.get("properties", [])
 
-        if hotel_type == "cheapest":
-            properties_list.sort(key=lambda x: x.get("rate_per_night", {}).get("extracted_lowest", float("inf")))
-
         hotels = []
         for prop in properties_list:
             rate_info = prop.get("rate_per_night", {})
@@ -146,17 +142,20 @@ async def search_hotels(city: str, check_in: str, check_out: str, guests: int, h
                 "name": prop.get("name"),
                 "address": prop.get("gps_coordinates", {}),
                 "price": rate_info.get("lowest", "N/A"),
+                "price_value": rate_info.get("extracted_lowest"),
                 "rating": prop.get("overall_rating"),
                 "reviews": prop.get("reviews"),
                 "url": prop.get("link", ""),
                 "type": prop.get("type"),
-                "hotel_class": prop.get("hotel_class"),
+                "hotel_class": prop.get("extracted_hotel_class") or prop.get("hotel_class"),
                 "total_rate": total_rate.get("lowest", "N/A")
             })
 
         return {"hotels": hotels}
 
+    except UpstreamUnavailableError:
+        raise
     except Exception as e:
         custom_err = ExceptionError(e)
         logger.error("Error fetching hotels: %s", custom_err)
-        return {"hotels": []}
+        raise UpstreamUnavailableError("serpapi", str(e)) from e
@@ -0,0 +1,176 @@
+import asyncio
+import time
+from collections import defaultdict
+from typing import Optional
+
+import aiohttp
+from yarl import URL
+
+from src.loggers import Logger
+from src.utils.Utilities import load_llm_config
+
+logger = Logger(__name__).get_logger()
+
+
+class UpstreamSessions:
+    """
+    App-scoped aiohttp session shared by the upstream tools (SerpAPI, OpenWeather, Tavily).
+
+    One ``TCPConnector`` keeps connections alive between calls, caches DNS and caps
+    connections per host; limits, keep-alive, per-host timeouts and the hosts to
+    pre-warm come from ``upstream_http`` in llm_configs.yml. A ``TraceConfig`` counts
+    requests, new vs reused connections, connect/TLS time, DNS lookups and errors per
+    host for ``metrics()``. The session is created lazily on first use and closed by
+    the FastAPI lifespan.
+    """
+
+    def __init__(self):
+        self._config = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop = None
+        self.requests = defaultdict(int)
+        self.in_flight = defaultdict(int)
+        self.new_connections = defaultdict(int)
+        self.reused_connections = defaultdict(int)
+        self.connect_seconds = defaultdict(float)
+        self.dns_lookups = defaultdict(int)
+        self.dns_cache_hits = defaultdict(int)
+        self.errors = defaultdict(int)
+
+    @property
+    def config(self) -> dict:
+        if self._config is None:
+            try:
+                self._config = load_llm_config("upstream_http") or {}
+            except Exception as e:
+                logger.warning(f"No upstream_http config, using aiohttp defaults: {e}")
+                self._config = {}
+        return self._config
+
+    def timeout_for(self, url: str) -> aiohttp.ClientTimeout:
+        """Per-host timeout from ``upstream_http.timeouts`` (falls back to ``default``)."""
+        timeouts = self.config.get("timeouts", {})
+        host_timeout = timeouts.get(URL(url).host) or timeouts.get("default", {})
+        return aiohttp.ClientTimeout(
+            total=host_timeout.get("total", 30),
+            connect=host_timeout.get("connect", 5),
+            sock_read=host_timeout.get("sock_read"),
+        )
+
+    # ---- trace hooks -------------------------------------------------------
+
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        trace = aiohttp.TraceConfig()
+
+        async def on_request_start(session, ctx, params):
+            ctx.host = params.url.host
+            self.requests[ctx.host] += 1
+            self.in_flight[ctx.host] += 1
+
+        async def on_request_end(session, ctx, params):
+            self.in_flight[ctx.host] -= 1
+            if params.response.status >= 500 or params.response.status == 429:
+                self.errors[ctx.host] += 1
+
+        async def on_request_exception(session, ctx, params):
+            self.in_flight[ctx.host] -= 1
+            self.errors[ctx.host] += 1
+
+        async def on_connection_create_start(session, ctx, params):
+            ctx.connect_started = time.perf_counter()
+
+        async def on_connection_create_end(session, ctx, params):
+            # TCP connect plus TLS handshake for https
+            self.new_connections[ctx.host] += 1
+            self.connect_seconds[ctx.host] += time.perf_counter() - ctx.connect_started
+
+        async def on_connection_reuseconn(session, ctx, params):
+            self.reused_connections[ctx.host] += 1
+
+        async def on_dns_resolvehost_end(session, ctx, params):
+            self.dns_lookups[params.host] += 1
+
+        async def on_dns_cache_hit(session, ctx, params):
+            self.dns_cache_hits[params.host] += 1
+
+        trace.on_request_start.append(on_request_start)
+        trace.on_request_end.append(on_request_end)
+        trace.on_request_exception.append(on_request_exception)
+        trace.on_connection_create_start.append(on_connection_create_start)
+        trace.on_connection_create_end.append(on_connection_create_end)
+        trace.on_connection_reuseconn.append(on_connection_reuseconn)
+        trace.on_dns_resolvehost_end.append(on_dns_resolvehost_end)
+        trace.on_dns_cache_hit.append(on_dns_cache_hit)
+        return trace
+
+    # ---- session -----------------------------------------------------------
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """The shared session; must be used from inside the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._session is not None and not self._session.closed and self._loop is not loop:
+            # A session is bound to the loop it was created on (e.g. a second asyncio.run)
+            logger.warning("Upstream session belongs to another event loop, creating a new one")
+            self._session = None
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.config.get("limit", 100),
+                limit_per_host=self.config.get("limit_per_host", 20),
+                ttl_dns_cache=self.config.get("ttl_dns_cache", 300),
+                keepalive_timeout=self.config.get("keepalive_timeout", 60),
+                enable_cleanup_closed=True,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=self.timeout_for(""),
+                trace_configs=[self._trace_config()],
+                raise_for_status=False,
+            )
+            self._loop = loop
+        return self._session
+
+    def get(self, url: str, **kwargs):
+        kwargs.setdefault("timeout", self.timeout_for(url))
+        return self.session.get(url, **kwargs)
+
+    def post(self, url: str, **kwargs):
+        kwargs.setdefault("timeout", self.timeout_for(url))
+        return self.session.post(url, **kwargs)
+
+    async def prewarm(self):
+        """Open (DNS + TCP + TLS) a pooled connection to every host in ``upstream_http.prewarm``."""
+
+        async def warm(url: str):
+            try:
+                async with self.session.head(url, timeout=self.timeout_for(url)):
+                    logger.info(f"Pre-warmed upstream connection to {url}")
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.warning(f"Could not pre-warm connection to {url}: {e}")
+
+        await asyncio.gather(*(warm(url) for url in self.config.get("prewarm", [])))
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def metrics(self) -> dict:
+        """Requests, connection reuse, connect/TLS time, DNS and errors per host."""
+        return {
+            host: {
+                "requests": self.requests[host],
+                "in_flight": self.in_flight[host],
+                "new_connections": self.new_connections[host],
+                "reused_connections": self.reused_connections[host],
+                "connect_seconds": round(self.connect_seconds[host], 4),
+                "dns_lookups": self.dns_lookups[host],
+                "dns_cache_hits": self.dns_cache_hits[host],
+                "errors": self.errors[host],
+            }
+            for host in self.requests
+        }
+
+
+# Global instance shared by all upstream tools
+upstream_http = UpstreamSessions()
@@ -0,0 +1,29 @@
+from typing import List
+
+from langchain.tools import StructuredTool
+
+from src.config.settings import settings
+from src.langgraph_core.tools.cached_search import search_cache
+from src.langgraph_core.tools.upstream_guard import upstream_guard
+from src.utils.Utilities import get_api_key
+
+
+async def tavily_http_search(query: str) -> List[dict]:
+    """Search the web through the Tavily REST API at TAVILY_BASE_URL."""
+    api_key = get_api_key("TAVILY_API_KEY")
+    payload = {"query": query, "max_results": 2, "api_key": api_key}
+
+    async def search():
+        data = await upstream_guard.post_json("tavily", f"{settings.TAVILY_BASE_URL}/search", api_key=api_key, json=payload)
+        return [{"url": r["url"], "content": r["content"]} for r in data.get("results", [])]
+
+    # Same result cache as CachedTavilySearch
+    return await search_cache.get_or_fetch(search_cache.key(query, max_results=2), search)
+
+
+# Same name and output shape as TavilySearchResults, but with a configurable base URL
+tavily_http_tool = StructuredTool.from_function(
+    coroutine=tavily_http_search,
+    name="tavily_search_results_json",
+    description="A search engine. Useful for answering questions about current events. Input should be a search query.",
+)
@@ -1,13 +1,25 @@
-from langchain_community.tools.tavily_search import TavilySearchResults
+from typing import Dict, List
+
 from langgraph.prebuilt import ToolNode
 
+from src.config.settings import settings
+from src.langgraph_core.tools.tavily_http import tavily_http_tool
+from src.langgraph_core.tools.cached_search import CachedTavilySearch
+
+# Tool instances are built once per process and reused by every graph and node
+_TOOLS: Dict[str, List] = {}
+
 
 def get_tools():
     """
     Return the list of tools to be used in the chatbot
     """
-    tools = [TavilySearchResults(max_results=2)]
-    return tools
+    if "search" not in _TOOLS:
+        if settings.FAKE_UPSTREAMS:
+            _TOOLS["search"] = [tavily_http_tool]
+        else:
+            _TOOLS["search"] = [CachedTavilySearch(max_results=2)]
+    return _TOOLS["search"]
 
 
 def create_tool_node(tools):
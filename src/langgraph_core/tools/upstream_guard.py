@@ -0,0 +1,166 @@
+import asyncio
+import random
+import time
+from collections import defaultdict
+from typing import Any, Dict, Tuple
+
+import aiohttp
+
+from src.exceptions import UpstreamUnavailableError
+from src.langgraph_core.tools.http_session import upstream_http
+from src.loggers import Logger
+from src.utils.resilience import CircuitBreaker, TokenBucket
+from src.utils.Utilities import load_llm_config
+
+logger = Logger(__name__).get_logger()
+
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+class UpstreamGuard:
+    """
+    Rate limiting, retries and circuit breaking for the upstream tool APIs.
+
+    Every call to an API ("serpapi", "openweather", "tavily") goes through:
+      1. its circuit breaker - fails fast with UpstreamUnavailableError while open;
+      2. a token bucket per (API, API key) - waits for quota, or fails if the wait
+         would exceed ``max_wait``;
+      3. up to ``retries`` retries on 429/5xx, timeouts and connection errors with
+         full-jitter exponential backoff (``Retry-After`` is honoured on 429); a 2xx
+         whose body is not JSON is retried the same way.
+    Other 4xx responses raise aiohttp.ClientResponseError without retrying and do not
+    count against the breaker. Settings come from ``upstream_resilience`` in
+    llm_configs.yml; ``default`` applies to APIs without their own entry.
+    """
+
+    def __init__(self):
+        self._config = None
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._buckets: Dict[Tuple[str, str], TokenBucket] = {}
+        self.stats = defaultdict(lambda: defaultdict(float))
+
+    @property
+    def config(self) -> dict:
+        if self._config is None:
+            try:
+                self._config = load_llm_config("upstream_resilience") or {}
+            except Exception as e:
+                logger.warning(f"No upstream_resilience config, using defaults: {e}")
+                self._config = {}
+        return self._config
+
+    def _policy(self, api: str) -> dict:
+        return {**self.config.get("default", {}), **self.config.get(api, {})}
+
+    def _breaker(self, api: str) -> CircuitBreaker:
+        if api not in self._breakers:
+            breaker = self._policy(api).get("breaker", {})
+            self._breakers[api] = CircuitBreaker(
+                f"upstream:{api}",
+                failure_threshold=breaker.get("failure_threshold", 5),
+                reset_timeout=breaker.get("reset_timeout", 30),
+            )
+        return self._breakers[api]
+
+    def _bucket(self, api: str, api_key: str) -> TokenBucket:
+        key = (api, api_key or "")
+        if key not in self._buckets:
+            limit = self._policy(api).get("rate_limit", {})
+            self._buckets[key] = TokenBucket(rate=limit.get("per_second", 5), capacity=limit.get("burst", 10))
+        return self._buckets[key]
+
+    def _backoff(self, policy: dict, attempt: int, retry_after: str = None) -> float:
+        """Full jitter: uniform(0, min(max_delay, base_delay * 2**attempt)), or Retry-After."""
+        max_delay = policy.get("max_delay", 8.0)
+        if retry_after:
+            try:
+                return min(float(retry_after), max_delay)
+            except ValueError:
+                pass  # HTTP-date form, fall back to jittered backoff
+        return random.uniform(0, min(max_delay, policy.get("base_delay", 0.5) * 2 ** attempt))
+
+    async def request_json(self, api: str, method: str, url: str, api_key: str = None, **kwargs) -> Any:
+        """Send ``method url`` for ``api`` and return the JSON body of the 2xx response."""
+        policy = self._policy(api)
+        stats = self.stats[api]
+        breaker = self._breaker(api)
+        stats["calls"] += 1
+
+        if not breaker.allow():
+            stats["short_circuited"] += 1
+            raise UpstreamUnavailableError(api, "circuit open")
+
+        retries = policy.get("retries", 3)
+        reason = "unknown error"
+        settled = False  # whether the breaker has been told how this call went
+        try:
+            for attempt in range(retries + 1):
+                waited = time.perf_counter()
+                if not await self._bucket(api, api_key).acquire(policy.get("max_wait", 5.0)):
+                    stats["throttled"] += 1
+                    raise UpstreamUnavailableError(api, "local rate limit exceeded")
+                stats["throttle_wait_seconds"] += time.perf_counter() - waited
+
+                stats["attempts"] += 1
+                retry_after = None
+                try:
+                    async with upstream_http.session.request(method, url, timeout=upstream_http.timeout_for(url), **kwargs) as response:
+                        if response.status < 400:
+                            data = await response.json(content_type=None)
+                            breaker.record_success()
+                            settled = True
+                            stats["successes"] += 1
+                            return data
+                        if response.status not in RETRYABLE_STATUS:
+                            # The API is up, the request is wrong (bad key, bad params)
+                            breaker.record_success()
+                            settled = True
+                            stats["client_errors"] += 1
+                            response.raise_for_status()
+                        if response.status == 429:
+                            stats["upstream_429"] += 1
+                            retry_after = response.headers.get("Retry-After")
+                        reason = f"HTTP {response.status}"
+                except (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError) as e:
+                    reason = f"{type(e).__name__}: {e}"
+                except ValueError as e:
+                    # 2xx with a body that is not JSON (e.g. an HTML error page from a proxy)
+                    reason = f"invalid JSON body: {e}"
+
+                if attempt < retries:
+                    delay = self._backoff(policy, attempt, retry_after)
+                    stats["retries"] += 1
+                    logger.warning(f"{api} attempt {attempt + 1} failed ({reason}), retrying in {delay:.2f}s")
+                    await asyncio.sleep(delay)
+
+            breaker.record_failure()
+            settled = True
+        finally:
+            # Throttled, cancelled or an unexpected error: free a half-open trial slot
+            if not settled:
+                breaker.release()
+
+        stats["failures"] += 1
+        logger.error(f"{api} unavailable after {retries + 1} attempts: {reason}")
+        raise UpstreamUnavailableError(api, reason)
+
+    async def get_json(self, api: str, url: str, api_key: str = None, **kwargs) -> Any:
+        return await self.request_json(api, "GET", url, api_key=api_key, **kwargs)
+
+    async def post_json(self, api: str, url: str, api_key: str = None, **kwargs) -> Any:
+        return await self.request_json(api, "POST", url, api_key=api_key, **kwargs)
+
+    def metrics(self) -> dict:
+        """Per-API call/retry/failure counters, breaker state and remaining tokens per key."""
+        return {
+            api: {
+                **{name: round(value, 4) for name, value in stats.items()},
+                "breaker": self._breaker(api).snapshot(),
+                "buckets": [bucket.snapshot() for (bucket_api, _), bucket in self._buckets.items() if bucket_api == api],
+            }
+            for api, stats in self.stats.items()
+        }
+
+
+# Global instance shared by all upstream tools
+upstream_guard = UpstreamGuard()
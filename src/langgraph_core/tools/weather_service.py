@@ -0,0 +1,151 @@
+import asyncio
+from collections import Counter, defaultdict
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional
+
+from src.cache.cache_keys import build_key, cache_stats, canonical_city
+from src.cache.redis_client import redis_client
+from src.cache.single_flight import single_flight
+from src.config.settings import settings
+from src.langgraph_core.schemas.all_schems import WeatherResponse, WindInfo
+from src.langgraph_core.tools.upstream_guard import upstream_guard
+from src.loggers import Logger
+from src.utils.Utilities import get_api_key, load_llm_config
+
+logger = Logger(__name__).get_logger()
+
+
+def _daily_forecast(data: dict) -> Dict[str, dict]:
+    """Collapse OpenWeather's 3-hourly /forecast list into one summary per local date."""
+    offset = timedelta(seconds=data.get("city", {}).get("timezone", 0))
+    slots = defaultdict(list)
+    for slot in data.get("list", []):
+        local_day = (datetime.fromtimestamp(slot["dt"], tz=timezone.utc) + offset).date().isoformat()
+        slots[local_day].append(slot)
+
+    days = {}
+    for day, entries in slots.items():
+        conditions = Counter((e.get("weather") or [{}])[0].get("main", "Unknown") for e in entries)
+        days[day] = {
+            "date": day,
+            "temp_min": round(min(e["main"].get("temp_min", e["main"]["temp"]) for e in entries), 1),
+            "temp_max": round(max(e["main"].get("temp_max", e["main"]["temp"]) for e in entries), 1),
+            "condition": conditions.most_common(1)[0][0],
+            "rain_chance": round(max(e.get("pop", 0) for e in entries) * 100),
+        }
+    return days
+
+
+class WeatherService:
+    """
+    Cached OpenWeather lookups for the weather tool and the itinerary.
+
+    Current conditions and the 5-day daily forecast are cached in Redis per canonical
+    city (``weather_current`` / ``weather_forecast`` namespaces in cache_keys) with the short and
+    long TTLs from ``weather`` in llm_configs.yml; identical concurrent lookups share one
+    request. ``current_many`` / ``forecast_many`` fetch several cities concurrently under
+    one ``max_concurrency`` limit. Upstream calls go through upstream_guard.
+    """
+
+    def __init__(self):
+        self._config = None
+
+    @property
+    def config(self) -> dict:
+        if self._config is None:
+            try:
+                self._config = load_llm_config("weather") or {}
+            except Exception as e:
+                logger.warning(f"No weather config, using defaults: {e}")
+                self._config = {}
+        return self._config
+
+    async def _cached(self, key: str, ttl: int, fetch):
+        cached = await redis_client.get_json(key)
+        if cached is not None:
+            cache_stats.record(key, "hit")
+            return cached
+        cache_stats.record(key, "miss")
+
+        async def fetch_and_store():
+            value = await fetch()
+            await redis_client.set_json(key, value, ttl)
+            return value
+
+        return await single_flight.run(key, fetch_and_store, lambda: redis_client.get_json(key))
+
+    async def _get(self, path: str, city: str) -> dict:
+        api_key = get_api_key("OPENWEATHERMAP_API_KEY")
+        params = {"q": city, "appid": api_key, "units": "metric"}
+        return await upstream_guard.get_json("openweather", f"{settings.OPENWEATHER_BASE_URL}/data/2.5/{path}", api_key=api_key, params=params)
+
+    async def current(self, city: str) -> dict:
+        """Current conditions as a WeatherResponse dict."""
+        city = city.strip()
+
+        async def fetch():
+            data = await self._get("weather", city)
+            return WeatherResponse(
+                city=data["name"],
+                temp=data["main"]["temp"],
+                unit="Celsius",
+                wind=WindInfo(speed=data["wind"]["speed"], direction=data["wind"]["deg"]),
+            ).dict()
+
+        return await self._cached(build_key("weather_current", city=canonical_city(city)), self.config.get("current_ttl", 600), fetch)
+
+    async def forecast(self, city: str, start_date: str = None, end_date: str = None) -> List[dict]:
+        """Daily forecast summaries between the ISO dates (inclusive); OpenWeather covers ~5 days ahead."""
+        city = city.strip()
+
+        async def fetch():
+            return _daily_forecast(await self._get("forecast", city))
+
+        days = await self._cached(build_key("weather_forecast", city=canonical_city(city)), self.config.get("forecast_ttl", 10800), fetch)
+        first = start_date or min(days, default="")
+        last = end_date or max(days, default="")
+        return [days[day] for day in sorted(days) if first <= day <= last]
+
+    async def _many(self, cities: Iterable[str], lookup) -> Dict[str, Optional[object]]:
+        """Run ``lookup`` for each distinct city concurrently; results are keyed by canonical_city, failed lookups map to None."""
+        semaphore = asyncio.Semaphore(self.config.get("max_concurrency", 5))
+        unique = {canonical_city(city): city for city in cities if city}
+
+        async def one(city: str):
+            async with semaphore:
+                try:
+                    return await lookup(city)
+                except Exception as e:
+                    logger.warning(f"Weather lookup failed for {city}: {e}")
+                    return None
+
+        results = await asyncio.gather(*(one(city) for city in unique.values()))
+        return dict(zip(unique, results))
+
+    async def current_many(self, cities: Iterable[str]) -> Dict[str, Optional[dict]]:
+        return await self._many(cities, self.current)
+
+    async def forecast_many(self, cities: Iterable[str], start_date: str = None, end_date: str = None) -> Dict[str, Optional[List[dict]]]:
+        return await self._many(cities, lambda city: self.forecast(city, start_date, end_date))
+
+    async def trip_forecast(self, city: str, start_date: str, end_date: str) -> List[dict]:
+        """Forecast for the trip dates, or [] when unavailable or the trip is beyond the forecast range."""
+        if date.fromisoformat(start_date) > date.today() + timedelta(days=self.config.get("forecast_days", 5)):
+            return []
+        try:
+            return await asyncio.wait_for(self.forecast(city, start_date, end_date), self.config.get("forecast_timeout", 3))
+        except Exception as e:
+            logger.warning(f"No forecast for {city} {start_date}..{end_date}: {e}")
+            return []
+
+
+def format_forecast(days: List[dict]) -> str:
+    """One line per day, for prompts and chat messages."""
+    return "\n".join(
+        f"- {day['date']}: {day['condition']}, {day['temp_min']}-{day['temp_max']}°C, {day['rain_chance']}% chance of rain"
+        for day in days
+    )
+
+
+# Global instance shared by all nodes
+weather_service = WeatherService()
@@ -1,20 +1,22 @@
 import os
-import re
 import sys
-from datetime import timedelta
 
-import spacy
 import yaml
-from dateutil import parser as date_parser
 from dotenv import find_dotenv, load_dotenv
 
+from src.config.settings import settings
 from src.exceptions import ExceptionError
 from src.loggers import logging
+from src.utils.date_parser import parse_trip_dates
+from src.utils.location_extractors import get_location_extractor
 
 load_dotenv(find_dotenv())
 
 
 def get_api_key(api_key_name):
+    if settings.FAKE_LLM or settings.FAKE_UPSTREAMS:
+        # offline rig: real keys are optional
+        return os.environ.get(api_key_name, f"fake-{api_key_name.lower()}")
     return os.environ[api_key_name]
 
 
@@ -50,45 +52,18 @@ def load_llm_config(provider_name: str, config_path=r".\src\config\llm_configs.y
 
 
 class TravelInfo:
-    def __init__(self):
-        self.nlp = spacy.load("en_core_web_md")  # good for location
+    def __init__(self, location_backend: str = None):
+        # Backend comes from settings.LOCATION_EXTRACTOR unless given explicitly
+        self.location_extractor = get_location_extractor(location_backend)
 
     def extract_location(self, text: str):
-        doc = self.nlp(text)
-        locations = [ent.text for ent in doc.ents if ent.label_ == "GPE"]
-        return locations
+        return self.location_extractor.extract(text)
 
     def extract_dates_and_duration(self, text: str):
-        start_date, end_date, duration = None, None, None
-
-        # Case 1: explicit date range "from X to Y"
-        range_match = re.search(
-            r"from\s+([\d]{1,2}\s+[A-Za-z]{3,9}\s+\d{4})\s+to\s+([\d]{1,2}\s+[A-Za-z]{3,9}\s+\d{4})",
-            text,
-            re.IGNORECASE,
-        )
-        if range_match:
-            start_date = date_parser.parse(range_match.group(1)).date()
-            end_date = date_parser.parse(range_match.group(2)).date()
-            duration = (end_date - start_date).days
-            return start_date, end_date, duration
-
-        # Case 2: single start date with duration
-        date_match = re.search(r"\b\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4}\b", text)
-        if date_match:
-            start_date = date_parser.parse(date_match.group()).date()
-
-        dur_match = re.search(r"(\d+)\s+days?", text.lower())
-        if dur_match:
-            duration = int(dur_match.group(1))
-
-        if start_date and duration:
-            end_date = start_date + timedelta(days=duration)
-
-        return start_date, end_date, duration
+        """Return (start_date, end_date, duration); see src.utils.date_parser for the formats."""
+        return parse_trip_dates(text)
 
-    def extract_trip_info(self, text: str):
-        locations = self.extract_location(text)
+    def _build_trip_info(self, text: str, locations):
         start, end, trip_days = self.extract_dates_and_duration(text)
 
         return {
@@ -97,3 +72,12 @@ class TravelInfo:
             "end_date": end.isoformat() if end else None,
             "duration": trip_days,
         }
+
+    def extract_trip_info(self, text: str):
+        return self._build_trip_info(text, self.extract_location(text))
+
+    def extract_trip_info_many(self, texts):
+        """Batched extract_trip_info - runs all texts through one ``nlp.pipe`` call."""
+        texts = list(texts)
+        locations = self.location_extractor.extract_many(texts)
+        return [self._build_trip_info(text, locs) for text, locs in zip(texts, locations)]
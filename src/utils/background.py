@@ -0,0 +1,88 @@
+import asyncio
+from typing import Any, Awaitable, Dict, Optional
+
+from src.loggers import Logger
+
+logger = Logger(__name__).get_logger()
+
+
+class BackgroundTaskManager:
+    """Keyed registry of fire-and-forget asyncio tasks (prefetches, refreshes)."""
+
+    def __init__(self):
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def spawn(self, key: str, coro: Awaitable, retain: float = 0) -> asyncio.Task:
+        """Start ``coro`` in the background under ``key`` unless one is already running.
+
+        Finished tasks are kept for ``retain`` seconds so a later turn can still read the result.
+        """
+        existing = self._tasks.get(key)
+        if existing and not existing.done():
+            logger.info(f"Background task already running for {key}")
+            coro.close()
+            return existing
+
+        task = asyncio.create_task(coro, name=key)
+        self._tasks[key] = task
+        task.add_done_callback(lambda t: self._on_done(key, t, retain))
+        logger.info(f"Background task started for {key}")
+        return task
+
+    def _on_done(self, key: str, task: asyncio.Task, retain: float):
+        if not task.cancelled() and task.exception():
+            logger.error(f"Background task {key} failed: {task.exception()}")
+
+        if retain > 0:
+            asyncio.get_running_loop().call_later(retain, self._forget, key, task)
+        else:
+            self._forget(key, task)
+
+    def _forget(self, key: str, task: asyncio.Task):
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+
+    def get(self, key: str) -> Optional[asyncio.Task]:
+        return self._tasks.get(key)
+
+    def is_running(self, key: str) -> bool:
+        task = self._tasks.get(key)
+        return bool(task and not task.done())
+
+    async def wait(self, key: str, timeout: float = None) -> Any:
+        """Wait for the task under ``key`` and return its result, or None if missing/failed."""
+        task = self._tasks.get(key)
+        if task is None:
+            return None
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), timeout)
+        except asyncio.TimeoutError:
+            logger.info(f"Timed out waiting for background task {key}")
+            return None
+        except asyncio.CancelledError:
+            if task.cancelled():
+                return None
+            raise
+        except Exception:
+            return None
+
+    def cancel(self, key: str) -> bool:
+        """Cancel a pending task; returns True if something was cancelled."""
+        task = self._tasks.pop(key, None)
+        if task and not task.done():
+            task.cancel()
+            logger.info(f"Background task cancelled for {key}")
+            return True
+        return False
+
+    async def shutdown(self):
+        """Cancel everything still running (call on app shutdown)."""
+        pending = [task for task in self._tasks.values() if not task.done()]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        self._tasks.clear()
+
+
+# Global instance shared by all nodes
+background_tasks = BackgroundTaskManager()
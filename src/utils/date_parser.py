@@ -0,0 +1,199 @@
+"""
+Date and trip-length parsing for travel messages.
+
+Understands ISO dates (2025-12-12), written dates (12 Dec 2025, Dec 12, 12th of December),
+numeric day-first dates (12/12/2025), relative phrases (today, tomorrow, next friday,
+in 2 weeks, next weekend), ranges (from X to Y, 12-18 Dec) and lengths of stay
+(for 5 nights, a week, 3-day trip). Every result is a ``datetime.date``; callers store
+``.isoformat()``.
+
+All grammars are compiled once at import and results are memoized per (text, today).
+"""
+import re
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import List, NamedTuple, Optional, Tuple
+
+MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+WEEKDAYS = {"mon": 0, "tue": 1, "wed": 2, "thu": 3, "fri": 4, "sat": 5, "sun": 6}
+NUMBER_WORDS = {
+    "a": 1, "an": 1, "one": 1, "two": 2, "three": 3, "four": 4, "five": 5, "six": 6, "seven": 7,
+    "eight": 8, "nine": 9, "ten": 10, "eleven": 11, "twelve": 12, "fourteen": 14, "fifteen": 15,
+}
+
+_MON = r"(?P<mon>jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\.?"
+_ORD = r"(?:st|nd|rd|th)?"
+_NUM = r"(?P<num>\d+|" + "|".join(NUMBER_WORDS) + r")"
+
+_ISO_RE = re.compile(r"\b(?P<year>\d{4})-(?P<month>\d{1,2})-(?P<day>\d{1,2})\b")
+_DAY_RANGE_RE = re.compile(r"\b(?P<day1>\d{1,2})" + _ORD + r"\s*(?:-|–|to|till|until)\s*(?P<day2>\d{1,2})" + _ORD + r"\s+(?:of\s+)?" + _MON + r"(?:,?\s*(?P<year>\d{4}))?\b", re.IGNORECASE)
+_DAY_MONTH_RE = re.compile(r"\b(?P<day>\d{1,2})" + _ORD + r"\s+(?:of\s+)?" + _MON + r"(?:,?\s*(?P<year>\d{4}))?\b", re.IGNORECASE)
+_MONTH_DAY_RE = re.compile(r"\b" + _MON + r"\s+(?P<day>\d{1,2})" + _ORD + r"(?:,?\s*(?P<year>\d{4}))?\b", re.IGNORECASE)
+_NUMERIC_RE = re.compile(r"\b(?P<a>\d{1,2})[/.](?P<b>\d{1,2})[/.](?P<year>\d{4}|\d{2})\b")
+_RELATIVE_DAY_RE = re.compile(r"\b(?P<word>day after tomorrow|today|tonight|tomorrow)\b", re.IGNORECASE)
+_WEEKDAY_RE = re.compile(r"\b(?:(?P<mod>next|this|coming)\s+)?(?P<wd>mon|tue|wed|thu|fri|sat|sun)[a-z]*day\b", re.IGNORECASE)
+_IN_N_RE = re.compile(r"\bin\s+" + _NUM + r"\s+(?P<unit>day|week|month)s?\b", re.IGNORECASE)
+_NEXT_UNIT_RE = re.compile(r"\bnext\s+(?P<unit>weekend|week|month)\b", re.IGNORECASE)
+_DURATION_RE = re.compile(r"\b(?:for\s+)?" + _NUM + r"[\s-]+(?P<unit>night|day|week)s?\b", re.IGNORECASE)
+
+
+class TripDates(NamedTuple):
+    start_date: Optional[date]
+    end_date: Optional[date]
+    duration: Optional[int]
+
+
+class _Found(NamedTuple):
+    span: Tuple[int, int]
+    value: date
+    year_inferred: bool
+
+
+def _to_int(token: str) -> int:
+    return int(token) if token.isdigit() else NUMBER_WORDS[token.lower()]
+
+
+def _make_date(year: Optional[str], month: int, day: int, today: date) -> Optional[Tuple[date, bool]]:
+    """Build a date; without a year take the next occurrence on/after today."""
+    try:
+        if year:
+            year = int(year)
+            return date(year + 2000 if year < 100 else year, month, day), False
+        candidate = date(today.year, month, day)
+        if candidate < today:
+            candidate = date(today.year + 1, month, day)
+        return candidate, True
+    except ValueError:
+        return None
+
+
+def _add_months(start: date, months: int) -> date:
+    month_index = start.month - 1 + months
+    year, month = start.year + month_index // 12, month_index % 12 + 1
+    for day in (start.day, 30, 29, 28):
+        try:
+            return date(year, month, day)
+        except ValueError:
+            continue
+
+
+def _overlaps(span, taken) -> bool:
+    return any(span[0] < end and start < span[1] for start, end in taken)
+
+
+def _find_dates(text: str, today: date) -> List[_Found]:
+    found: List[_Found] = []
+
+    def add(span, built):
+        if built and not _overlaps(span, [f.span for f in found]):
+            found.append(_Found(span, built[0], built[1]))
+
+    for m in _DAY_RANGE_RE.finditer(text):
+        month = MONTHS[m.group("mon")[:3].lower()]
+        first = _make_date(m.group("year"), month, int(m.group("day1")), today)
+        second = _make_date(m.group("year"), month, int(m.group("day2")), today)
+        if first and second:
+            add((m.start(), m.start("day2")), first)
+            add((m.start("day2"), m.end()), second)
+
+    for m in _ISO_RE.finditer(text):
+        add(m.span(), _make_date(m.group("year"), int(m.group("month")), int(m.group("day")), today))
+
+    for pattern in (_DAY_MONTH_RE, _MONTH_DAY_RE):
+        for m in pattern.finditer(text):
+            add(m.span(), _make_date(m.group("year"), MONTHS[m.group("mon")[:3].lower()], int(m.group("day")), today))
+
+    for m in _NUMERIC_RE.finditer(text):
+        a, b = int(m.group("a")), int(m.group("b"))
+        day, month = (b, a) if b > 12 else (a, b)  # day-first unless impossible
+        add(m.span(), _make_date(m.group("year"), month, day, today))
+
+    for m in _RELATIVE_DAY_RE.finditer(text):
+        offset = {"today": 0, "tonight": 0, "tomorrow": 1, "day after tomorrow": 2}[m.group("word").lower()]
+        add(m.span(), (today + timedelta(days=offset), True))
+
+    for m in _WEEKDAY_RE.finditer(text):
+        days_ahead = (WEEKDAYS[m.group("wd")[:3].lower()] - today.weekday()) % 7
+        if days_ahead == 0 and (m.group("mod") or "").lower() != "this":
+            days_ahead = 7
+        add(m.span(), (today + timedelta(days=days_ahead), True))
+
+    for m in _IN_N_RE.finditer(text):
+        n, unit = _to_int(m.group("num")), m.group("unit").lower()
+        value = _add_months(today, n) if unit == "month" else today + timedelta(days=n * (7 if unit == "week" else 1))
+        add(m.span(), (value, True))
+
+    for m in _NEXT_UNIT_RE.finditer(text):
+        unit = m.group("unit").lower()
+        if unit == "weekend":
+            value = today + timedelta(days=(5 - today.weekday()) % 7 or 7)
+        elif unit == "week":
+            value = today + timedelta(days=7 - today.weekday())
+        else:
+            value = _add_months(today.replace(day=1), 1)
+        add(m.span(), (value, True))
+
+    return sorted(found, key=lambda f: f.span[0])
+
+
+def _find_duration(text: str, taken) -> Optional[int]:
+    for m in _DURATION_RE.finditer(text):
+        if _overlaps(m.span(), taken):
+            continue
+        n, unit = _to_int(m.group("num")), m.group("unit").lower()
+        return n * 7 if unit == "week" else n
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _parse_trip_dates(text: str, today: date) -> TripDates:
+    found = _find_dates(text, today)
+    duration = _find_duration(text, [f.span for f in found] + [m.span() for m in _IN_N_RE.finditer(text)])
+
+    start_date = found[0].value if found else None
+    end_date = None
+    if len(found) > 1:
+        end_date = found[1].value
+        if end_date < start_date and found[1].year_inferred and end_date.month < start_date.month:
+            # "28 Dec to 3 Jan" - the end rolls into the next year; "10 Dec to 5 Dec" is rejected below
+            end_date = end_date.replace(year=end_date.year + 1)
+        if end_date < start_date:
+            end_date = None
+
+    if start_date and end_date:
+        duration = (end_date - start_date).days
+    elif start_date and duration:
+        end_date = start_date + timedelta(days=duration)
+
+    return TripDates(start_date, end_date, duration)
+
+
+def parse_trip_dates(text: str, today: date = None) -> TripDates:
+    """
+    Extract (start_date, end_date, duration) from free text.
+
+    Args:
+        text (str): user message, e.g. "from 12 Dec to 18 Dec" or "next friday for 3 nights".
+        today (date): reference day for relative phrases and year inference.
+    """
+    if not text:
+        return TripDates(None, None, None)
+    return _parse_trip_dates(" ".join(text.split()).lower(), today or date.today())
+
+
+def parse_date(text: str, today: date = None) -> Optional[date]:
+    """Return the first date mentioned in ``text`` or None."""
+    return parse_trip_dates(text, today).start_date
+
+
+def to_iso(text: str, today: date = None) -> Optional[str]:
+    """Normalize a single date answer ("next friday", "25/12/2025") to YYYY-MM-DD."""
+    parsed = parse_date(text, today)
+    return parsed.isoformat() if parsed else None
+
+
+def cache_info():
+    return _parse_trip_dates.cache_info()
@@ -0,0 +1,123 @@
+import os
+import threading
+from typing import Dict, List
+
+import spacy
+import yaml
+
+from src.config.settings import settings
+from src.exceptions import ExceptionError
+from src.loggers import logging
+
+# Pipes we never use - only "ner" is needed for GPE extraction, and in the
+# en_core_web_* v3 pipelines it carries its own tok2vec layer.
+NER_ONLY_EXCLUDE = ["tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer", "senter"]
+
+GAZETTEER_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "config", "gazetteer.yml")
+
+_NLP_PIPELINES = {}
+_NLP_LOCK = threading.Lock()
+
+
+def get_nlp(model_name: str = "en_core_web_md"):
+    """
+    Return the process-wide spaCy pipeline for ``model_name``.
+
+    The model is loaded lazily on first use, with everything except NER excluded,
+    and shared by every extractor afterwards.
+    """
+    nlp = _NLP_PIPELINES.get(model_name)
+    if nlp is None:
+        with _NLP_LOCK:
+            nlp = _NLP_PIPELINES.get(model_name)
+            if nlp is None:
+                logging.info(f"Loading spaCy model {model_name} (NER only)")
+                nlp = spacy.load(model_name, exclude=NER_ONLY_EXCLUDE)
+                _NLP_PIPELINES[model_name] = nlp
+    return nlp
+
+
+class SpacyLocationExtractor:
+    """GPE entities from a pretrained spaCy NER model (en_core_web_md / en_core_web_sm)."""
+
+    def __init__(self, model_name: str):
+        self.name = model_name
+        self.model_name = model_name
+
+    @property
+    def nlp(self):
+        return get_nlp(self.model_name)
+
+    @staticmethod
+    def _locations(doc) -> List[str]:
+        return [ent.text for ent in doc.ents if ent.label_ == "GPE"]
+
+    def extract(self, text: str) -> List[str]:
+        return self._locations(self.nlp(text))
+
+    def extract_many(self, texts: List[str], batch_size: int = 64) -> List[List[str]]:
+        return [self._locations(doc) for doc in self.nlp.pipe(texts, batch_size=batch_size)]
+
+
+class GazetteerLocationExtractor:
+    """Rule-based extractor: a blank tokenizer plus an EntityRuler over a list of known places."""
+
+    name = "gazetteer"
+
+    def __init__(self, gazetteer_path: str = GAZETTEER_PATH):
+        self.gazetteer_path = gazetteer_path
+        self._nlp = None
+        self._lock = threading.Lock()
+
+    def _build(self):
+        try:
+            with open(self.gazetteer_path, "r") as f:
+                gazetteer = yaml.safe_load(f)
+        except Exception as e:
+            raise ExceptionError(e)
+
+        nlp = spacy.blank("en")
+        ruler = nlp.add_pipe("entity_ruler", config={"phrase_matcher_attr": "LOWER"})
+        places = gazetteer.get("cities", []) + gazetteer.get("countries", [])
+        ruler.add_patterns([{"label": "GPE", "pattern": place} for place in places])
+        logging.info(f"Built gazetteer location extractor with {len(places)} places")
+        return nlp
+
+    @property
+    def nlp(self):
+        if self._nlp is None:
+            with self._lock:
+                if self._nlp is None:
+                    self._nlp = self._build()
+        return self._nlp
+
+    def extract(self, text: str) -> List[str]:
+        return SpacyLocationExtractor._locations(self.nlp(text))
+
+    def extract_many(self, texts: List[str], batch_size: int = 256) -> List[List[str]]:
+        return [SpacyLocationExtractor._locations(doc) for doc in self.nlp.pipe(texts, batch_size=batch_size)]
+
+
+LOCATION_EXTRACTORS = {
+    "en_core_web_md": lambda: SpacyLocationExtractor("en_core_web_md"),
+    "en_core_web_sm": lambda: SpacyLocationExtractor("en_core_web_sm"),
+    "gazetteer": GazetteerLocationExtractor,
+}
+
+_EXTRACTORS: Dict[str, object] = {}
+
+
+def get_location_extractor(backend: str = None):
+    """
+    Return the shared location extractor for ``backend``.
+
+    Args:
+        backend (str): one of LOCATION_EXTRACTORS; defaults to settings.LOCATION_EXTRACTOR.
+    """
+    backend = backend or settings.LOCATION_EXTRACTOR
+    if backend not in LOCATION_EXTRACTORS:
+        raise ExceptionError(ValueError(f"Unknown location extractor '{backend}'. Choose from {list(LOCATION_EXTRACTORS)}"))
+
+    if backend not in _EXTRACTORS:
+        _EXTRACTORS[backend] = LOCATION_EXTRACTORS[backend]()
+    return _EXTRACTORS[backend]
@@ -0,0 +1,130 @@
+import asyncio
+import time
+from collections import deque
+from typing import Optional
+
+from src.loggers import Logger
+
+logger = Logger(__name__).get_logger()
+
+
+class CircuitBreaker:
+    """
+    Classic closed -> open -> half-open breaker.
+
+    After ``failure_threshold`` consecutive failures the breaker opens and rejects calls
+    for ``reset_timeout`` seconds; then a single trial call is let through (half-open).
+    A success closes it again, a failure re-opens it.
+    """
+
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._trial_in_flight = False
+
+    def allow(self) -> bool:
+        """True if a call may go through right now."""
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN:
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                return False
+            self.state = self.HALF_OPEN
+            self._trial_in_flight = False
+        if self._trial_in_flight:
+            return False
+        self._trial_in_flight = True
+        return True
+
+    def release(self):
+        """Give back a half-open trial slot that ended up unused (e.g. a cancelled call)."""
+        self._trial_in_flight = False
+
+    def record_success(self):
+        if self.state != self.CLOSED:
+            logger.info(f"Circuit {self.name} closed")
+        self.state = self.CLOSED
+        self.failures = 0
+        self._trial_in_flight = False
+
+    def record_failure(self):
+        self.failures += 1
+        self._trial_in_flight = False
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                logger.warning(f"Circuit {self.name} opened after {self.failures} failures")
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+    def snapshot(self) -> dict:
+        return {"state": self.state, "failures": self.failures}
+
+
+class LatencyTracker:
+    """Rolling window of call latencies (seconds) with percentile lookups."""
+
+    def __init__(self, window: int = 200):
+        self._samples = deque(maxlen=window)
+
+    def record(self, seconds: float):
+        self._samples.append(seconds)
+
+    def __len__(self):
+        return len(self._samples)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Nearest-rank percentile, ``q`` in [0, 100]; None when no samples yet."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, max(0, round(q / 100 * len(ordered)) - 1))
+        return ordered[index]
+
+    def snapshot(self) -> dict:
+        return {"samples": len(self), "p50": self.percentile(50), "p95": self.percentile(95)}
+
+
+class TokenBucket:
+    """
+    Token bucket limiter: ``rate`` tokens per second, bursts up to ``capacity``.
+
+    ``acquire`` reserves the next token and waits for it (waiters are served in order)
+    unless the wait would exceed ``max_wait``, in which case it returns False without
+    taking one. Reservations can drive ``tokens`` negative; the deficit is the queue ahead.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, max_wait: Optional[float] = None) -> bool:
+        # No await between the check and the reservation, so no lock is needed
+        self._refill()
+        wait = max(0.0, (1 - self.tokens) / self.rate)
+        if max_wait is not None and wait > max_wait:
+            return False
+        self.tokens -= 1
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                self.tokens += 1  # give the reservation back
+                raise
+        return True
+
+    def snapshot(self) -> dict:
+        self._refill()
+        return {"tokens": round(self.tokens, 2), "rate": self.rate, "capacity": self.capacity}
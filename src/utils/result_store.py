@@ -0,0 +1,195 @@
+"""
+Columnar store for flight and hotel search results.
+
+SerpAPI results are parsed once into a ``ResultTable``: the display records stay as
+dicts, while the fields we filter and rank on live in compact NumPy columns. Budget
+filters are boolean masks, multi-key ranking is ``np.lexsort`` and top-k selection uses
+``np.argpartition`` so only the K rows shown to the user are fully sorted.
+Missing values are NaN and always rank last.
+
+Every record gets an ``option_id`` (a short hash of the fields that identify it: the
+hotel's name and coordinates, the flight's airline and every leg's flight number,
+airports and times) so conversation state can refer to options by id instead of carrying
+the records. A refreshed result set still resolves the id when only the price, rating or
+review count changed; selections then use the current record, so the confirmation shows
+today's price. Records that share an identity get "-2", "-3", ... suffixes in result
+order, and ``find`` never guesses between two records with the same id.
+"""
+import hashlib
+import json
+import re
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+_AMOUNT_RE = re.compile(r"-?\d+(?:\.\d+)?")
+_CLASS_RE = re.compile(r"(\d)")
+
+# (column, ascending) keys per ranking, most significant first
+FLIGHT_RANKINGS = {
+    "cheapest": [("price", True), ("duration", True), ("stops", True)],
+    "fastest": [("duration", True), ("stops", True), ("price", True)],
+    "best": [("stops", True), ("duration", True), ("price", True)],
+}
+HOTEL_RANKINGS = {
+    "cheapest": [("price", True), ("rating", False)],
+    "best": [("rating", False), ("hotel_class", False), ("price", True)],
+}
+
+
+def parse_amount(value) -> float:
+    """Number from a SerpAPI price/duration field: 3200, "₹3,200", "12,500 INR" -> float, else NaN."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, str):
+        match = _AMOUNT_RE.search(value.replace(",", ""))
+        if match:
+            return float(match.group())
+    return float("nan")
+
+
+def first_present(record: dict, *keys):
+    """Value of the first of ``keys`` that is set (the search tools store missing fields as None)."""
+    return next((record[key] for key in keys if record.get(key) is not None), None)
+
+
+def option_id(identity: dict) -> str:
+    """Stable id of a search result from its identifying fields."""
+    content = json.dumps(identity, sort_keys=True, default=str)
+    return hashlib.sha1(content.encode("utf-8")).hexdigest()[:12]
+
+
+def parse_hotel_class(value) -> float:
+    """4, "4-star hotel" -> 4.0, else NaN."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    match = _CLASS_RE.search(value or "")
+    return float(match.group(1)) if match else float("nan")
+
+
+class ResultTable:
+    """Display records plus float32 NumPy columns for filtering and ranking."""
+
+    def __init__(self, records: List[dict], columns: Dict[str, np.ndarray]):
+        self.records = records
+        self.columns = columns
+        self._by_id = None
+
+    @classmethod
+    def from_records(cls, records: List[dict], extractors: Dict[str, callable], identity: callable) -> "ResultTable":
+        seen = {}
+        with_ids = []
+        for r in records:
+            base = option_id(identity(r))
+            seen[base] = seen.get(base, 0) + 1
+            with_ids.append({**r, "option_id": base if seen[base] == 1 else f"{base}-{seen[base]}"})
+        records = with_ids
+        columns = {name: np.fromiter((extract(r) for r in records), dtype=np.float32, count=len(records)) for name, extract in extractors.items()}
+        return cls(records, columns)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def all(self) -> np.ndarray:
+        return np.arange(len(self.records))
+
+    def at_most(self, column: str, max_value: Optional[float], indices: np.ndarray = None) -> np.ndarray:
+        """Indices whose ``column`` is <= ``max_value`` (rows with unknown values are dropped)."""
+        indices = self.all() if indices is None else indices
+        if max_value is None:
+            return indices
+        return indices[self.columns[column][indices] <= max_value]
+
+    def _sort_keys(self, keys: Sequence[Tuple[str, bool]], indices: np.ndarray) -> List[np.ndarray]:
+        """Per-key arrays where smaller is better and NaN sorts last."""
+        arrays = []
+        for column, ascending in keys:
+            values = self.columns[column][indices].astype(np.float64)
+            if not ascending:
+                values = -values
+            arrays.append(np.where(np.isnan(values), np.inf, values))
+        return arrays
+
+    def rank(self, keys: Sequence[Tuple[str, bool]], indices: np.ndarray = None) -> np.ndarray:
+        """``indices`` fully ordered by ``keys`` (first key most significant)."""
+        indices = self.all() if indices is None else indices
+        if len(indices) < 2 or not keys:
+            return indices
+        arrays = self._sort_keys(keys, indices)
+        return indices[np.lexsort(arrays[::-1])]
+
+    def top_k(self, k: int, keys: Sequence[Tuple[str, bool]], indices: np.ndarray = None) -> np.ndarray:
+        """The best ``k`` of ``indices`` by ``keys``, in order, without sorting the rest."""
+        indices = self.all() if indices is None else indices
+        if len(indices) <= k or not keys:
+            return self.rank(keys, indices)[:k]
+
+        primary = self._sort_keys(keys[:1], indices)[0]
+        kth = primary[np.argpartition(primary, k - 1)[k - 1]]
+        # Keep ties on the primary key so the secondary keys can break them
+        candidates = indices[primary <= kth]
+        return self.rank(keys, candidates)[:k]
+
+    def take(self, indices: Iterable[int]) -> List[dict]:
+        return [self.records[i] for i in indices]
+
+    def ids(self, indices: Iterable[int]) -> List[str]:
+        return [self.records[i]["option_id"] for i in indices]
+
+    def find(self, option_id: str) -> Optional[dict]:
+        """The record with ``option_id``, or None if it is not in this result set or is ambiguous."""
+        if self._by_id is None:
+            self._by_id = {}
+            for r in self.records:
+                key = r.get("option_id")
+                # Two records with one id (e.g. an older cached table): refuse rather than pick one
+                self._by_id[key] = None if key in self._by_id else r
+        return self._by_id.get(option_id)
+
+    def to_dict(self) -> dict:
+        """JSON-serialisable form (NaN stored as None) for the Redis cache."""
+        return {
+            "records": self.records,
+            "columns": {name: [None if np.isnan(v) else float(v) for v in values] for name, values in self.columns.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ResultTable":
+        columns = {name: np.array([np.nan if v is None else v for v in values], dtype=np.float32) for name, values in data["columns"].items()}
+        return cls(data["records"], columns)
+
+
+FLIGHT_COLUMNS = {
+    "price": lambda f: parse_amount(f.get("price")),
+    "duration": lambda f: parse_amount(first_present(f, "total_duration", "duration")),
+    "stops": lambda f: parse_amount(f.get("stops")),
+}
+
+HOTEL_COLUMNS = {
+    "price": lambda h: parse_amount(first_present(h, "price_value", "price")),
+    "rating": lambda h: parse_amount(h.get("rating")),
+    "hotel_class": lambda h: parse_hotel_class(h.get("hotel_class")),
+    "lat": lambda h: parse_amount((h.get("address") or {}).get("latitude")),
+    "lon": lambda h: parse_amount((h.get("address") or {}).get("longitude")),
+}
+
+
+def flight_identity(f: dict) -> dict:
+    identity = {k: f.get(k) for k in ("airline", "departure_airport", "departure_time", "arrival_airport", "arrival_time", "stops")}
+    # The flat fields describe the first leg only; the full itinerary is in "legs"
+    identity["legs"] = f.get("legs")
+    identity["total_duration"] = f.get("total_duration")
+    return identity
+
+
+def hotel_identity(h: dict) -> dict:
+    address = h.get("address") or {}
+    return {"name": h.get("name"), "lat": address.get("latitude"), "lon": address.get("longitude")}
+
+
+def flight_table(flights: List[dict]) -> ResultTable:
+    return ResultTable.from_records(flights, FLIGHT_COLUMNS, flight_identity)
+
+
+def hotel_table(hotels: List[dict]) -> ResultTable:
+    return ResultTable.from_records(hotels, HOTEL_COLUMNS, hotel_identity)
@@ -231,6 +231,31 @@ function addMessage(sender, content) {
     chatMessages.appendChild(messageDiv);
 
     scrollToBottom();
+    return messageDiv;
+}
+
+// Read a text/event-stream response, calling onEvent(type, data) per event
+async function readEvents(response, onEvent) {
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    while (true) {
+        const { value, done } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+        let boundary;
+        while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+            const frame = buffer.slice(0, boundary);
+            buffer = buffer.slice(boundary + 2);
+            let type = 'message';
+            let data = '';
+            for (const line of frame.split('\n')) {
+                if (line.startsWith('event: ')) type = line.slice(7);
+                else if (line.startsWith('data: ')) data += line.slice(6);
+            }
+            if (data) onEvent(type, JSON.parse(data));
+        }
+    }
 }
 
 // Format message content
@@ -373,7 +398,7 @@ async function sendMessage() {
             throw new Error('No session token found');
         }
 
-        const response = await fetch('/data', {
+        const response = await fetch('/data/stream', {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json',
@@ -391,16 +416,23 @@ async function sendMessage() {
             return;
         }
 
-        const data = await response.json();
-
-        // Remove typing indicator
+        // Server-Sent Events: itinerary days arrive one by one, then the full reply
+        let draft = null;
+        await readEvents(response, (type, event) => {
+            removeTypingIndicator();
+            if (type === 'itinerary_day') {
+                draft = draft || addMessage('bot', '');
+                draft.dataset.raw = (draft.dataset.raw || '') + event.content + '\n\n';
+                draft.querySelector('.message-content').innerHTML = formatMessage(draft.dataset.raw);
+                scrollToBottom();
+            } else if (type === 'message') {
+                if (draft) draft.remove();
+                addMessage('bot', event.message);
+            } else if (type === 'error') {
+                addMessage('bot', event.message);
+            }
+        });
         removeTypingIndicator();
-
-        if (data.response) {
-            addMessage('bot', data.message || data.response);
-        } else {
-            addMessage('bot', 'Sorry, I encountered an error. Please try again.');
-        }
     } catch (error) {
         removeTypingIndicator();
         if (error.message === 'No session token found') {